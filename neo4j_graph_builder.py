@@ -4,17 +4,54 @@ Simple Neo4j Knowledge Graph Importer
 Clean implementation for importing startup ecosystem JSON data to Neo4j
 """
 
+import ast
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 from dotenv import load_dotenv
 import logging
-import math
+from utils.kg_json import iter_kg
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Rows sent per write transaction during bulk import
+BATCH_SIZE = 10000
+
+# Concurrent write sessions and relationship rows per parallel task
+MAX_WORKERS = 8
+REL_CHUNK_SIZE = 5000
+
+# Server-side commit size for apoc.periodic.iterate entity import
+APOC_BATCH_SIZE = 1000
+
+# Map entity types to Neo4j labels
+LABEL_MAP = {
+    'startup': 'Startup',
+    'founder': 'Founder',
+    'vc': 'VC',
+    'technology': 'Technology'
+}
+
+# String placeholders that mean "no value"
+NULL_STRINGS = frozenset(('NaN', 'None', 'null'))
+
+# Uniqueness constraints on entity IDs, created after the bulk entity load
+CONSTRAINTS = [
+    "CREATE CONSTRAINT startup_id IF NOT EXISTS FOR (s:Startup) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT founder_id IF NOT EXISTS FOR (f:Founder) REQUIRE f.id IS UNIQUE",
+    "CREATE CONSTRAINT vc_id IF NOT EXISTS FOR (v:VC) REQUIRE v.id IS UNIQUE",
+    "CREATE CONSTRAINT tech_id IF NOT EXISTS FOR (t:Technology) REQUIRE t.id IS UNIQUE"
+]
+
+def label_for(entity_type):
+    """Get the Neo4j label for an entity type"""
+    return LABEL_MAP.get(entity_type, entity_type.title())
+
 class SimpleNeo4jImporter:
     def __init__(self):
         load_dotenv()
@@ -27,34 +64,45 @@ class SimpleNeo4jImporter:
         if not self.uri or not self.password:
             raise ValueError("Please set NEO4J_URI and NEO4J_PASSWORD in your .env file")
         
+        # Entity ID -> label, filled by import_entities for label-aware relationship MATCHes
+        self.entity_labels = {}
+        
+        # Cleared on the first ProcedureNotFound so later batches skip APOC
+        self.apoc_available = True
+        
         # Connect to Neo4j with notification filtering
         self.driver = GraphDatabase.driver(
             self.uri, 
             auth=(self.username, self.password),
-            notifications_min_severity='WARNING'  # Suppress INFO notifications
+            notifications_min_severity='WARNING',  # Suppress INFO notifications
+            max_connection_pool_size=2 * MAX_WORKERS
         )
         logger.info("🔌 Connected to Neo4j")
     
     def clean_property_value(self, value):
         """Clean property values for Neo4j compatibility"""
-        # Handle NaN values
-        if isinstance(value, float) and math.isnan(value):
+        # Handle NaN values (NaN is the only value not equal to itself)
+        if value != value:
             return None
         
-        # Handle string representations of arrays
         if isinstance(value, str):
+            # Handle None values represented as strings
+            if value in NULL_STRINGS:
+                return None
+            
+            # Handle string representations of arrays
             if value.startswith('[') and value.endswith(']'):
                 try:
-                    # Try to parse as JSON array
-                    import ast
+                    # Fast path: most arrays are valid JSON
+                    return json.loads(value)
+                except ValueError:
+                    pass
+                try:
+                    # Python-style lists (e.g. single quotes) need literal_eval
                     return ast.literal_eval(value)
-                except:
+                except Exception:
                     # If parsing fails, return as string
                     return value
-        
-        # Handle None values represented as strings
-        if value == 'NaN' or value == 'None' or value == 'null':
-            return None
             
         return value
     
@@ -65,6 +113,27 @@ class SimpleNeo4jImporter:
             cleaned[key] = self.clean_property_value(value)
         return cleaned
     
+    def clean_property_records(self, records):
+        """Clean a list of property dictionaries column-wise with pandas"""
+        if not records:
+            return []
+        
+        # object dtype keeps ints as ints instead of upcasting to float around NaNs
+        df = pd.DataFrame(records, dtype=object)
+        
+        # Null sentinels and NaN become None in one vectorized pass
+        df = df.replace(list(NULL_STRINGS), float('nan'))
+        df = df.where(df.notna(), None)
+        
+        # Only columns that actually contain array strings need per-value parsing
+        for column in df.columns:
+            values = df[column]
+            is_array_str = values.map(lambda v: isinstance(v, str) and v.startswith('['))
+            if is_array_str.any():
+                df[column] = values.map(self.clean_property_value)
+        
+        return df.to_dict(orient='records')
+    
     def test_connection(self):
         """Test the Neo4j connection"""
         try:
@@ -85,82 +154,150 @@ class SimpleNeo4jImporter:
     
     def get_node_counts(self):
         """Get current node and relationship counts"""
+        # One round-trip; each count is answered from the count store
+        query = """
+        CALL { MATCH (n) RETURN count(n) AS total_nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS total_rels }
+        CALL { MATCH (s:Startup) RETURN count(s) AS startup_count }
+        CALL { MATCH (f:Founder) RETURN count(f) AS founder_count }
+        CALL { MATCH (v:VC) RETURN count(v) AS vc_count }
+        CALL { MATCH (t:Technology) RETURN count(t) AS tech_count }
+        RETURN total_nodes, total_rels, startup_count, founder_count, vc_count, tech_count
+        """
+        
         with self.driver.session() as session:
-            # Count nodes
-            node_result = session.run("MATCH (n) RETURN count(n) as total_nodes")
-            total_nodes = node_result.single()['total_nodes']
-            
-            # Count relationships
-            rel_result = session.run("MATCH ()-[r]->() RETURN count(r) as total_rels")
-            total_rels = rel_result.single()['total_rels']
-            
-            # Count by type
-            startup_count = session.run("MATCH (s:Startup) RETURN count(s) as count").single()['count']
-            founder_count = session.run("MATCH (f:Founder) RETURN count(f) as count").single()['count']
-            vc_count = session.run("MATCH (v:VC) RETURN count(v) as count").single()['count']
-            tech_count = session.run("MATCH (t:Technology) RETURN count(t) as count").single()['count']
+            counts = session.run(query).single()
             
             return {
-                'total_nodes': total_nodes,
-                'total_relationships': total_rels,
-                'startups': startup_count,
-                'founders': founder_count,
-                'vcs': vc_count,
-                'technologies': tech_count
+                'total_nodes': counts['total_nodes'],
+                'total_relationships': counts['total_rels'],
+                'startups': counts['startup_count'],
+                'founders': counts['founder_count'],
+                'vcs': counts['vc_count'],
+                'technologies': counts['tech_count']
             }
     
+    def drop_constraints(self):
+        """Drop the uniqueness constraints so bulk entity creation skips per-row index updates"""
+        with self.driver.session() as session:
+            for constraint in CONSTRAINTS:
+                constraint_name = constraint.split()[2]
+                session.run(f"DROP CONSTRAINT {constraint_name} IF EXISTS")
+        logger.info("🔧 Constraints dropped for bulk load")
+    
     def create_constraints(self):
         """Create uniqueness constraints"""
-        constraints = [
-            "CREATE CONSTRAINT startup_id IF NOT EXISTS FOR (s:Startup) REQUIRE s.id IS UNIQUE",
-            "CREATE CONSTRAINT founder_id IF NOT EXISTS FOR (f:Founder) REQUIRE f.id IS UNIQUE", 
-            "CREATE CONSTRAINT vc_id IF NOT EXISTS FOR (v:VC) REQUIRE v.id IS UNIQUE",
-            "CREATE CONSTRAINT tech_id IF NOT EXISTS FOR (t:Technology) REQUIRE t.id IS UNIQUE"
-        ]
-        
         with self.driver.session() as session:
-            for constraint in constraints:
-                try:
-                    # Suppress notifications for constraint creation
-                    session.run(constraint, notifications_min_severity='WARNING')
-                    constraint_name = constraint.split()[2]
-                    logger.info(f"✅ Constraint ensured: {constraint_name}")
-                except Exception as e:
-                    # Only log actual errors, not "already exists" notifications
-                    if "already exists" not in str(e).lower():
-                        logger.warning(f"Constraint creation failed: {e}")
+            try:
+                # Send all constraints in one transaction (one round-trip)
+                with session.begin_transaction() as tx:
+                    for constraint in CONSTRAINTS:
+                        tx.run(constraint)
+                    tx.commit()
+                for constraint in CONSTRAINTS:
+                    logger.info(f"✅ Constraint ensured: {constraint.split()[2]}")
+            except Exception as e:
+                # Retry one by one on the same session so a single bad constraint
+                # does not block the others
+                logger.info(f"Batched constraint creation failed ({e}), retrying individually")
+                for constraint in CONSTRAINTS:
+                    try:
+                        session.run(constraint)
+                        constraint_name = constraint.split()[2]
+                        logger.info(f"✅ Constraint ensured: {constraint_name}")
+                    except Exception as e:
+                        # Only log actual errors, not "already exists" notifications
+                        if "already exists" not in str(e).lower():
+                            logger.warning(f"Constraint creation failed: {e}")
+            
+            # Relationship MATCHes rely on these indexes, so wait until they are online
+            session.run("CALL db.awaitIndexes()")
     
     def import_entities(self, entities):
-        """Import all entities to Neo4j"""
-        logger.info(f"📥 Importing {len(entities)} entities...")
+        """Import entities to Neo4j from a dict or a stream of (id, data) pairs"""
+        if isinstance(entities, dict):
+            logger.info(f"📥 Importing {len(entities)} entities...")
+            entities = entities.items()
+        else:
+            logger.info("📥 Streaming entities...")
         
-        # Group entities by type
+        # Buffer entities by type and hand each full buffer to a worker
         entity_groups = {}
-        for entity_id, entity_data in entities.items():
-            entity_type = entity_data['type']
-            if entity_type not in entity_groups:
-                entity_groups[entity_type] = []
+        imported = 0
+        duplicates = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pending = []
+            for entity_id, entity_data in entities:
+                entity_type = entity_data['type']
+                if entity_type not in entity_groups:
+                    entity_groups[entity_type] = ([], [])
+                if entity_id in self.entity_labels:
+                    duplicates += 1
+                self.entity_labels[entity_id] = label_for(entity_type)
+                
+                entity_ids, property_rows = entity_groups[entity_type]
+                entity_ids.append(entity_id)
+                property_rows.append(entity_data['properties'])
+                imported += 1
+                
+                if len(entity_ids) >= BATCH_SIZE:
+                    del entity_groups[entity_type]
+                    self._submit(executor, pending, self._import_entity_rows,
+                                 entity_type, entity_ids, property_rows)
             
-            # Add the entity with its ID and clean properties
-            entity_with_id = self.clean_properties(entity_data['properties'].copy())
-            entity_with_id['id'] = entity_id
-            entity_groups[entity_type].append(entity_with_id)
+            for entity_type, (entity_ids, property_rows) in entity_groups.items():
+                self._submit(executor, pending, self._import_entity_rows,
+                             entity_type, entity_ids, property_rows)
+            for future in pending:
+                future.result()
+        
+        # Constraints are created after the load, so duplicates are only caught here
+        if duplicates:
+            logger.warning(f"⚠️ {duplicates} duplicate entity IDs imported; uniqueness constraints will fail")
         
-        # Import each entity type
-        for entity_type, entity_list in entity_groups.items():
-            self._import_entity_batch(entity_type, entity_list)
+        return imported
     
-    def _import_entity_batch(self, entity_type, entities):
+    def _import_entity_rows(self, session, entity_type, entity_ids, property_rows):
+        """Clean one buffer of raw entity properties, attach IDs and import it"""
+        entity_list = self.clean_property_records(property_rows)
+        for entity_with_id, entity_id in zip(entity_list, entity_ids):
+            entity_with_id['id'] = entity_id
+        self._import_entity_batch(session, entity_type, entity_list)
+    
+    def _run_with_session(self, method, *args):
+        """Open a dedicated session and pass it to method"""
+        with self.driver.session() as session:
+            return method(session, *args)
+    
+    def _submit(self, executor, pending, *task):
+        """Queue a (method, *args) task, waiting on the oldest once enough are in flight"""
+        # Bounding in-flight tasks keeps memory flat when the input is streamed
+        if len(pending) >= 2 * MAX_WORKERS:
+            pending.pop(0).result()
+        pending.append(executor.submit(self._run_with_session, *task))
+    
+    def _run_in_chunks(self, session, query, param_name, rows):
+        """Run a write query in BATCH_SIZE chunks, one transaction per chunk"""
+        for start in range(0, len(rows), BATCH_SIZE):
+            chunk = rows[start:start + BATCH_SIZE]
+            session.execute_write(
+                lambda tx: tx.run(query, **{param_name: chunk}).consume()
+            )
+    
+    def _import_entity_batch(self, session, entity_type, entities):
         """Import a batch of entities of the same type"""
-        # Map entity types to Neo4j labels
-        label_map = {
-            'startup': 'Startup',
-            'founder': 'Founder', 
-            'vc': 'VC',
-            'technology': 'Technology'
-        }
+        label = label_for(entity_type)
         
-        label = label_map.get(entity_type, entity_type.title())
+        if self.apoc_available:
+            try:
+                self._import_entity_batch_apoc(session, label, entities)
+                logger.info(f"✅ Imported {len(entities)} {label} entities")
+                return
+            except ClientError as e:
+                if e.code != 'Neo.ClientError.Procedure.ProcedureNotFound':
+                    raise
+                logger.info("APOC not available, importing entities with plain UNWIND")
+                self.apoc_available = False
         
         # Create Cypher query
         query = f"""
@@ -169,45 +306,94 @@ class SimpleNeo4jImporter:
         SET n = entity
         """
         
-        with self.driver.session() as session:
-            session.run(query, entities=entities)
+        self._run_in_chunks(session, query, 'entities', entities)
         
         logger.info(f"✅ Imported {len(entities)} {label} entities")
     
+    def _import_entity_batch_apoc(self, session, label, entities):
+        """Import entities with apoc.periodic.iterate so the server commits batches in parallel"""
+        query = f"""
+        CALL apoc.periodic.iterate(
+            'UNWIND $entities AS entity RETURN entity',
+            'CREATE (n:{label}) SET n = entity',
+            {{batchSize: $batch_size, parallel: true, params: {{entities: $entities}}}}
+        )
+        YIELD batches, committedOperations, failedOperations, errorMessages
+        RETURN batches, committedOperations, failedOperations, errorMessages
+        """
+        
+        for start in range(0, len(entities), BATCH_SIZE):
+            chunk = entities[start:start + BATCH_SIZE]
+            summary = session.run(query, entities=chunk, batch_size=APOC_BATCH_SIZE).single()
+            if summary['failedOperations']:
+                raise RuntimeError(
+                    f"{summary['failedOperations']} {label} rows failed to import: "
+                    f"{summary['errorMessages']}"
+                )
+    
     def import_relationships(self, relationships):
-        """Import all relationships to Neo4j"""
-        logger.info(f"🔗 Importing {len(relationships)} relationships...")
+        """Import relationships to Neo4j from a list or a stream"""
+        if isinstance(relationships, list):
+            logger.info(f"🔗 Importing {len(relationships)} relationships...")
+        else:
+            logger.info("🔗 Streaming relationships...")
         
-        # Group relationships by type and clean properties
+        # Buffer relationships by (type, source label, target label) and hand
+        # each full buffer to a worker
         rel_groups = {}
-        for rel in relationships:
-            rel_type = rel['type']
-            if rel_type not in rel_groups:
-                rel_groups[rel_type] = []
+        imported = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pending = []
+            for rel in relationships:
+                group_key = (
+                    rel['type'],
+                    self.entity_labels.get(rel['source']),
+                    self.entity_labels.get(rel['target'])
+                )
+                if group_key not in rel_groups:
+                    rel_groups[group_key] = []
+                
+                # Clean relationship properties
+                cleaned_rel = rel.copy()
+                cleaned_rel['properties'] = self.clean_properties(rel.get('properties', {}))
+                rel_groups[group_key].append(cleaned_rel)
+                imported += 1
+                
+                if len(rel_groups[group_key]) >= REL_CHUNK_SIZE:
+                    self._submit_relationship_chunk(executor, pending, group_key,
+                                                    rel_groups.pop(group_key))
             
-            # Clean relationship properties
-            cleaned_rel = rel.copy()
-            cleaned_rel['properties'] = self.clean_properties(rel.get('properties', {}))
-            rel_groups[rel_type].append(cleaned_rel)
-        
-        # Import each relationship type
-        for rel_type, rel_list in rel_groups.items():
-            self._import_relationship_batch(rel_type, rel_list)
+            for group_key, rel_list in rel_groups.items():
+                self._submit_relationship_chunk(executor, pending, group_key, rel_list)
+            for future in pending:
+                future.result()
+        
+        return imported
+    
+    def _submit_relationship_chunk(self, executor, pending, group_key, rel_list):
+        """Queue one chunk of same-group relationships for import"""
+        # Sort by source so concurrent chunks touch mostly disjoint source nodes,
+        # which keeps lock contention low; execute_write retries any deadlocks
+        rel_list.sort(key=lambda rel: rel['source'])
+        self._submit(executor, pending, self._import_relationship_batch, *group_key, rel_list)
     
-    def _import_relationship_batch(self, rel_type, relationships):
-        """Import a batch of relationships of the same type"""
+    def _import_relationship_batch(self, session, rel_type, source_label, target_label, relationships):
+        """Import a batch of relationships of the same type and endpoint labels"""
+        # Labelled MATCHes hit the id uniqueness constraint; fall back to a
+        # label-less MATCH for endpoints that were not seen by import_entities
+        source_pattern = f":{source_label}" if source_label else ""
+        target_pattern = f":{target_label}" if target_label else ""
         
         # Create Cypher query
         query = f"""
         UNWIND $relationships AS rel
-        MATCH (source {{id: rel.source}})
-        MATCH (target {{id: rel.target}})
+        MATCH (source{source_pattern} {{id: rel.source}})
+        MATCH (target{target_pattern} {{id: rel.target}})
         CREATE (source)-[r:{rel_type}]->(target)
         SET r = rel.properties
         """
         
-        with self.driver.session() as session:
-            session.run(query, relationships=relationships)
+        self._run_in_chunks(session, query, 'relationships', relationships)
         
         logger.info(f"✅ Imported {len(relationships)} {rel_type} relationships")
     
@@ -215,24 +401,20 @@ class SimpleNeo4jImporter:
         """Import complete knowledge graph from JSON file"""
         logger.info(f"📂 Loading knowledge graph from {json_file_path}")
         
-        # Load JSON data
-        with open(json_file_path, 'r') as f:
-            kg_data = json.load(f)
-        
-        entities = kg_data.get('entities', {})
-        relationships = kg_data.get('relationships', [])
-        
-        logger.info(f"📊 Found {len(entities)} entities and {len(relationships)} relationships")
+        # Bulk-loader pattern: load entities without constraints, then build the
+        # unique indexes once before the relationship MATCHes need them
+        self.drop_constraints()
         
-        # Create constraints first
-        logger.info("🔧 Creating constraints...")
-        self.create_constraints()
-        
-        # Import entities
-        self.import_entities(entities)
+        # Entities, then relationships, streamed when ijson is installed
+        with iter_kg(json_file_path) as (entities, relationships):
+            entity_count = self.import_entities(entities)
+            
+            logger.info("🔧 Creating constraints...")
+            self.create_constraints()
+            
+            rel_count = self.import_relationships(relationships)
         
-        # Import relationships
-        self.import_relationships(relationships)
+        logger.info(f"📊 Imported {entity_count} entities and {rel_count} relationships")
         
         # Show final statistics
         stats = self.get_node_counts()
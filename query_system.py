@@ -9,8 +9,8 @@ to explore the startup ecosystem knowledge graph.
 **Key Features:**
 - **Natural Language to Cypher:** Leverages the Gemini LLM to convert user questions
   into executable Cypher queries.
-- **Dynamic Schema Generation:** Automatically inspects the database to create a
-  schema, ensuring the LLM has the correct context.
+- **Schema Context:** Ships the known graph schema so the LLM has the correct
+  context; set `REFRESH_SCHEMA=1` to regenerate it from the database instead.
 - **Safety First:** Includes a basic validation layer to prevent destructive
   queries from being run.
 - **Interactive Session:** Allows for real-time querying of the database.
@@ -22,9 +22,16 @@ to explore the startup ecosystem knowledge graph.
 """
 
 import os
+import asyncio
+import hashlib
+import functools
 import logging
+import re
+import shelve
+import threading
 import pandas as pd
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 import google.generativeai as genai
 from dotenv import load_dotenv
 
@@ -45,71 +52,34 @@ except Exception as e:
     logger.error(f" Failed to configure Gemini LLM: {e}")
     llm = None
 
-class IntelligentQuerySystem:
-    """
-    Translates natural language to Cypher queries using an LLM.
-    """
-    _instance = None
+# Faster event loop for aquery() callers, when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-    def __new__(cls, driver, database="neo4j"):
-        if cls._instance is None:
-            cls._instance = super(IntelligentQuerySystem, cls).__new__(cls)
-            cls._instance.driver = driver
-            cls._instance.database = database
-            cls._instance.schema = None
-            cls._instance.prompt_template = None
-        return cls._instance
+# Known graph schema, matching what _generate_schema builds from the database.
+# Set REFRESH_SCHEMA=1 to regenerate it from Neo4j instead.
+STATIC_SCHEMA = """Node Labels and Properties:
+- Startup: id, name, industry, founded_date, stage, status, employee_count
+- Founder: id, name, previous_company, domain_expertise, technical_background, education_level, university, years_experience
+- VC: id, name, aum, focus_industries, investment_stage
+- Technology: id, name, category, maturity, popularity_score
 
-    def _generate_schema(self) -> str:
-        """
-        Dynamically generates a schema representation from the Neo4j database.
-        This is crucial context for the LLM.
-        """
-        if self.schema:
-            return self.schema
-        
-        logger.info("🛠️ Generating graph schema from database...")
-        schema_parts = []
-        with self.driver.session(database=self.database) as session:
-            # Get node labels and their properties
-            labels = session.run("CALL db.labels() YIELD label RETURN label").value('label')
-            schema_parts.append("Node Labels and Properties:")
-            for label in labels:
-                properties = session.run(f"MATCH (n:{label}) WITH n LIMIT 100 "
-                                         "UNWIND keys(n) AS key "
-                                         "RETURN DISTINCT key").value('key')
-                schema_parts.append(f"- {label}: {', '.join(properties)}")
-
-            # Get relationship types and their properties
-            rel_types = session.run("CALL db.relationshipTypes() YIELD relationshipType "
-                                    "RETURN relationshipType").value('relationshipType')
-            schema_parts.append("\nRelationship Types:")
-            for rel_type in rel_types:
-                # Find relationships and connect nodes
-                rel_info = session.run(
-                    f"MATCH (a)-[r:`{rel_type}`]->(b) "
-                    "RETURN DISTINCT labels(a) AS from, labels(b) AS to LIMIT 1"
-                ).single()
-                if rel_info:
-                    from_labels = rel_info['from']
-                    to_labels = rel_info['to']
-                    if from_labels and to_labels:
-                        from_label = from_labels[0]
-                        to_label = to_labels[0]
-                        schema_parts.append(f"- ({from_label})-[:{rel_type}]->({to_label})")
-        
-        self.schema = "\n".join(schema_parts)
-        logger.info("✅ Schema generation complete.")
-        logger.debug(f"Generated Schema:\n{self.schema}")
-        return self.schema
+Relationship Types:
+- (Founder)-[:WORKS_AT]->(Startup)
+- (VC)-[:INVESTS_IN]->(Startup)
+- (Startup)-[:USES_TECHNOLOGY]->(Technology)
 
-    def _build_prompt(self, user_question: str) -> str:
-        """
-        Constructs the full prompt to send to the LLM, including schema and examples.
-        """
-        schema = self._generate_schema()
-        
-        prompt = f"""You are an expert Neo4j developer. Convert this natural language question into a Cypher query.
+Indexed Properties:
+- Startup.id (unique)
+- Founder.id (unique)
+- VC.id (unique)
+- Technology.id (unique)"""
+
+# LLM prompt up to the user's question; {schema} is filled in once per query system
+PROMPT_TEMPLATE = """You are an expert Neo4j developer. Convert this natural language question into a Cypher query.
 
 **Graph Schema:**
 {schema}
@@ -119,6 +89,7 @@ class IntelligentQuerySystem:
 - Use the exact schema provided above
 - For string matching, use CONTAINS for flexibility
 - Pay attention to the specific question being asked
+- Prefer the Indexed Properties listed above in node patterns and WHERE clauses
 
 **Examples:**
 User: "How many startups are there?"
@@ -142,64 +113,290 @@ Cypher: MATCH (target:Founder {{name: 'David Norman'}}) MATCH (f:Founder) WHERE
 User: "Top 5 industries by startup count?"
 Cypher: MATCH (s:Startup) RETURN s.industry AS industry, count(s) AS startups ORDER BY startups DESC LIMIT 5
 
-**Current Question:** {user_question}
+**Current Question:** """
+PROMPT_SUFFIX = "\n\n**Cypher Query:**"
+
+# Generated Cypher persisted across processes, keyed by schema hash + normalized question
+CYPHER_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cypher_cache')
+CYPHER_CACHE_LOCK = threading.Lock()
+
+# Write keywords as whole words, so names like "Emerge" or "subset" are not blocked
+UNSAFE_QUERY_PATTERN = re.compile(r'\b(?:delete|detach|create|merge|set|remove|drop)\b', re.IGNORECASE)
+
+def normalize_question(question: str) -> str:
+    """
+    Lowercases and collapses whitespace so trivially rephrased questions share a cache entry.
+    """
+    return re.sub(r'\s+', ' ', question.strip().lower())
+
+class IntelligentQuerySystem:
+    """
+    Translates natural language to Cypher queries using an LLM.
+    """
+    def __init__(self, driver, database="neo4j"):
+        self.driver = driver
+        self.database = database
+        self.schema = None
+        self.prompt_template = None
+        self.cypher_cache = {}
+
+    def _generate_schema(self) -> str:
+        """
+        Returns the schema representation used as context for the LLM.
+        Uses STATIC_SCHEMA unless REFRESH_SCHEMA is set, in which case it is
+        generated dynamically from the Neo4j database.
+        """
+        if self.schema:
+            return self.schema
 
-**Cypher Query:**"""
+        # The graph layout is fixed, so only hit the database when asked to re-verify it
+        if not os.getenv("REFRESH_SCHEMA"):
+            self.schema = STATIC_SCHEMA
+            return self.schema
         
-        return prompt
+        with self.driver.session(database=self.database) as session:
+            logger.info("🛠️ Generating graph schema from database...")
+            try:
+                schema_parts = self._schema_from_apoc(session)
+            except ClientError:
+                logger.info("APOC not available, falling back to batched schema queries.")
+                schema_parts = self._schema_from_cypher(session)
+            schema_parts.extend(self._indexed_properties(session))
+        
+        self.schema = "\n".join(schema_parts)
+        logger.info("✅ Schema generation complete.")
+        logger.debug(f"Generated Schema:\n{self.schema}")
+        return self.schema
+
+    def _schema_from_apoc(self, session) -> list:
+        """
+        Builds the schema from a single apoc.meta.schema() round-trip.
+        """
+        meta = session.run("CALL apoc.meta.schema() YIELD value RETURN value").single()['value']
+
+        schema_parts = ["Node Labels and Properties:"]
+        rel_patterns = []
+        for name, info in meta.items():
+            if info.get('type') != 'node':
+                continue
+            schema_parts.append(f"- {name}: {', '.join(info.get('properties', {}))}")
+            for rel_type, rel_info in info.get('relationships', {}).items():
+                if rel_info.get('direction') == 'out':
+                    for to_label in rel_info.get('labels', []):
+                        rel_patterns.append(f"- ({name})-[:{rel_type}]->({to_label})")
+
+        schema_parts.append("\nRelationship Types:")
+        schema_parts.extend(sorted(set(rel_patterns)))
+        return schema_parts
+
+    def _schema_from_cypher(self, session) -> list:
+        """
+        Builds the schema with one query for labels and one for relationship types.
+        """
+        # Get node labels and their properties
+        label_rows = session.run(
+            "CALL db.labels() YIELD label "
+            "CALL { WITH label MATCH (n) WHERE label IN labels(n) WITH n LIMIT 100 "
+            "UNWIND keys(n) AS key RETURN collect(DISTINCT key) AS properties } "
+            "RETURN label, properties"
+        )
+        schema_parts = ["Node Labels and Properties:"]
+        for row in label_rows:
+            schema_parts.append(f"- {row['label']}: {', '.join(row['properties'])}")
+
+        # Get relationship types and the labels they connect
+        rel_rows = session.run(
+            "CALL db.relationshipTypes() YIELD relationshipType "
+            "CALL { WITH relationshipType MATCH (a)-[r]->(b) WHERE type(r) = relationshipType "
+            "RETURN labels(a) AS from, labels(b) AS to LIMIT 1 } "
+            "RETURN relationshipType, from, to"
+        )
+        schema_parts.append("\nRelationship Types:")
+        for row in rel_rows:
+            if row['from'] and row['to']:
+                schema_parts.append(f"- ({row['from'][0]})-[:{row['relationshipType']}]->({row['to'][0]})")
+        return schema_parts
+
+    def _indexed_properties(self, session) -> list:
+        """
+        Lists indexed and unique-constrained properties so the LLM can write index-backed lookups.
+        """
+        rows = session.run(
+            "SHOW INDEXES YIELD labelsOrTypes, properties, owningConstraint, entityType "
+            "WHERE entityType = 'NODE' AND properties IS NOT NULL "
+            "RETURN labelsOrTypes, properties, owningConstraint IS NOT NULL AS is_unique"
+        )
+        schema_parts = ["\nIndexed Properties:"]
+        for row in rows:
+            for label in row['labelsOrTypes']:
+                for prop in row['properties']:
+                    suffix = " (unique)" if row['is_unique'] else ""
+                    schema_parts.append(f"- {label}.{prop}{suffix}")
+        return schema_parts
+
+    def _build_prompt(self, user_question: str) -> str:
+        """
+        Constructs the full prompt to send to the LLM, including schema and examples.
+        """
+        # Schema and examples are fixed, so format them once and only append the question
+        if self.prompt_template is None:
+            self.prompt_template = PROMPT_TEMPLATE.format(schema=self._generate_schema())
+        
+        return self.prompt_template + user_question + PROMPT_SUFFIX
 
     def _is_safe_query(self, query: str) -> bool:
         """
         A simple check to prevent destructive operations.
         """
-        query_lower = query.lower()
-        unsafe_keywords = ["delete", "detach", "create", "merge", "set", "remove", "drop"]
-        if any(keyword in query_lower for keyword in unsafe_keywords):
+        if UNSAFE_QUERY_PATTERN.search(query):
             logger.warning(f"🚨 Unsafe query detected and blocked: {query}")
             return False
         return True
 
+    def _prepare_prompt(self, user_question: str) -> str:
+        """
+        Builds the prompt for a question, generating the schema on first use.
+        """
+        logger.info("Building prompt...")
+        prompt = self._build_prompt(user_question)
+        logger.info(f"🤔 Sending question to LLM: '{user_question}'")
+        logger.debug(f"Full prompt being sent:\n{prompt}")
+        return prompt
+
+    def _cypher_cache_key(self, user_question: str) -> str:
+        """
+        Keys cached Cypher by schema hash and normalized question, so a schema change
+        invalidates every cached query.
+        """
+        schema_hash = hashlib.sha256(self._generate_schema().encode('utf-8')).hexdigest()[:16]
+        return f"{schema_hash}:{normalize_question(user_question)}"
+
+    def _get_cached_cypher(self, cache_key: str):
+        """
+        Looks up previously generated Cypher in memory, then in the on-disk shelf.
+        """
+        if cache_key in self.cypher_cache:
+            return self.cypher_cache[cache_key]
+        try:
+            with CYPHER_CACHE_LOCK, shelve.open(CYPHER_CACHE_FILE) as shelf:
+                cypher_query = shelf.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Could not read Cypher cache: {e}")
+            return None
+        if cypher_query is not None:
+            self.cypher_cache[cache_key] = cypher_query
+        return cypher_query
+
+    def _cache_cypher(self, cache_key: str, cypher_query: str):
+        """
+        Stores generated Cypher in memory and in the on-disk shelf.
+        """
+        self.cypher_cache[cache_key] = cypher_query
+        try:
+            with CYPHER_CACHE_LOCK, shelve.open(CYPHER_CACHE_FILE) as shelf:
+                shelf[cache_key] = cypher_query
+        except Exception as e:
+            logger.warning(f"Could not write Cypher cache: {e}")
+
+    def _extract_cypher(self, response) -> str:
+        """
+        Strips markdown fences from an LLM response.
+        """
+        cypher_query = response.text.strip().replace("```cypher", "").replace("```", "").strip()
+        logger.info(f"🤖 LLM-generated Cypher: {cypher_query}")
+        return cypher_query
+
+    def _execute_cypher(self, cypher_query: str):
+        """
+        Validates generated Cypher and executes it.
+        """
+        if not self._is_safe_query(cypher_query):
+            return "The generated query was blocked for safety reasons (it contained a write operation)."
+
+        logger.info(f"Executing query: {cypher_query}")
+        with self.driver.session(database=self.database) as session:
+            result = session.run(cypher_query)
+            # Build the DataFrame column-wise straight from the result for nice printing
+            return result.to_df()
+
+    def _query_error(self, e: Exception) -> str:
+        import traceback
+        logger.error(f"❌ Error in query method: {e}")
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        return f"Error in query method: {e}"
+
     def query(self, user_question: str):
         """
         Takes a user's question, generates a Cypher query, executes it, and returns the result.
+        Repeated questions reuse their cached Cypher and skip the LLM round-trip.
         """
-        if not llm:
-            logger.error("LLM not configured. Cannot process query.")
-            return "LLM is not available. Please check your API key and configuration."
+        try:
+            cache_key = self._cypher_cache_key(user_question)
+            cypher_query = self._get_cached_cypher(cache_key)
+            generated = cypher_query is None
+            if not generated:
+                logger.info(f"♻️ Using cached Cypher: {cypher_query}")
+            else:
+                if not llm:
+                    logger.error("LLM not configured. Cannot process query.")
+                    return "LLM is not available. Please check your API key and configuration."
 
+                prompt = self._prepare_prompt(user_question)
+                try:
+                    response = llm.generate_content(prompt)
+                except Exception as e:
+                    logger.error(f"❌ LLM query generation failed: {e}")
+                    return f"Error generating query: {e}"
+                cypher_query = self._extract_cypher(response)
+
+            result = self._execute_cypher(cypher_query)
+            # Cache new Cypher only once it has run; a broken query would otherwise replay forever
+            if generated and self._is_safe_query(cypher_query):
+                self._cache_cypher(cache_key, cypher_query)
+            return result
+        except Exception as e:
+            return self._query_error(e)
+
+    async def aquery(self, user_question: str):
+        """
+        Async version of query(). The LLM call is awaited and the Neo4j work runs in a
+        worker thread on the shared (thread-safe) driver, so many questions can be in
+        flight at once while sync callers keep using the same driver.
+        """
         try:
-            # 1. Build the prompt
-            logger.info("Building prompt...")
-            prompt = self._build_prompt(user_question)
-            
-            # 2. Get Cypher query from LLM
-            logger.info(f"🤔 Sending question to LLM: '{user_question}'")
-            logger.debug(f"Full prompt being sent:\n{prompt}")
-            try:
-                response = llm.generate_content(prompt)
-                cypher_query = response.text.strip().replace("```cypher", "").replace("```", "").strip()
-                logger.info(f"🤖 LLM-generated Cypher: {cypher_query}")
-            except Exception as e:
-                logger.error(f"❌ LLM query generation failed: {e}")
-                return f"Error generating query: {e}"
-
-            # 3. Validate and execute the query
-            if not self._is_safe_query(cypher_query):
-                return "The generated query was blocked for safety reasons (it contained a write operation)."
-
-            logger.info(f"Executing query: {cypher_query}")
-            with self.driver.session(database=self.database) as session:
-                result = session.run(cypher_query)
-                # Convert to pandas DataFrame for nice printing
-                records = [record.data() for record in result]
-                df = pd.DataFrame(records)
-                return df
-                
+            cache_key = await asyncio.to_thread(self._cypher_cache_key, user_question)
+            cypher_query = await asyncio.to_thread(self._get_cached_cypher, cache_key)
+            generated = cypher_query is None
+            if not generated:
+                logger.info(f"♻️ Using cached Cypher: {cypher_query}")
+            else:
+                if not llm:
+                    logger.error("LLM not configured. Cannot process query.")
+                    return "LLM is not available. Please check your API key and configuration."
+
+                prompt = self._prepare_prompt(user_question)
+                try:
+                    response = await llm.generate_content_async(prompt)
+                except Exception as e:
+                    logger.error(f"❌ LLM query generation failed: {e}")
+                    return f"Error generating query: {e}"
+                cypher_query = self._extract_cypher(response)
+
+            result = await asyncio.to_thread(self._execute_cypher, cypher_query)
+            # Cache new Cypher only once it has run; a broken query would otherwise replay forever
+            if generated and self._is_safe_query(cypher_query):
+                await asyncio.to_thread(self._cache_cypher, cache_key, cypher_query)
+            return result
         except Exception as e:
-            import traceback
-            logger.error(f"❌ Error in query method: {e}")
-            logger.error(f"❌ Traceback: {traceback.format_exc()}")
-            return f"Error in query method: {e}"
+            return self._query_error(e)
+
+@functools.lru_cache(maxsize=None)
+def get_query_system(driver, database="neo4j") -> IntelligentQuerySystem:
+    """
+    Returns the shared query system for a driver and database, so the schema
+    and prompt are only built once per process.
+    """
+    return IntelligentQuerySystem(driver, database)
 
 def interactive_session(query_system: IntelligentQuerySystem):
     """
@@ -226,6 +423,9 @@ def interactive_session(query_system: IntelligentQuerySystem):
             if isinstance(result, pd.DataFrame):
                 if result.empty:
                     print("No results found.")
+                elif len(result) <= 20 and len(result.columns) <= 4:
+                    # Small answers (counts, short lists) skip the markdown formatter
+                    print(result.to_string(index=False))
                 else:
                     print(result.to_markdown(index=False))
             else:
@@ -260,7 +460,7 @@ if __name__ == "__main__":
         )
         
         # Initialize the query system
-        iqs = IntelligentQuerySystem(driver, database)
+        iqs = get_query_system(driver, database)
         
         # Start the interactive session
         interactive_session(iqs)
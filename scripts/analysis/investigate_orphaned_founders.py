@@ -2,14 +2,19 @@
 """
 Investigate Orphaned Founders
 Analysis script to understand why some founders have no relationships
+
+Run from the project root: python -m scripts.analysis.investigate_orphaned_founders
 """
 
 import os
-import json
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, READ_ACCESS
 from dotenv import load_dotenv
 import logging
 
+from utils.kg_json import load_kg_summary
+
+JSON_FILE = 'startup_knowledge_graph.json'
+
 # Suppress Neo4j warnings
 neo4j_logger = logging.getLogger("neo4j.notifications")
 neo4j_logger.setLevel(logging.ERROR)
@@ -22,24 +27,40 @@ class OrphanedFounderInvestigator:
         self.uri = os.getenv('NEO4J_URI')
         self.username = os.getenv('NEO4J_USER', 'neo4j')
         self.password = os.getenv('NEO4J_PASSWORD')
+        self.database = os.getenv('NEO4J_DATABASE', 'neo4j')
         
         if not self.uri or not self.password:
             raise ValueError("Please set NEO4J_URI and NEO4J_PASSWORD in your .env file")
         
-        # Connect to Neo4j
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        # Connect to Neo4j; all investigation queries share one read session
+        self.driver = GraphDatabase.driver(
+            self.uri,
+            auth=(self.username, self.password),
+            max_connection_pool_size=32,
+            connection_acquisition_timeout=30,  # Fail fast instead of stalling on a busy pool
+            keep_alive=True
+        )
+        self.session = None
         print("🔌 Connected to Neo4j for investigation")
     
+    def get_session(self):
+        """Lazily open the read session shared by all investigation queries"""
+        if self.session is None:
+            self.session = self.driver.session(database=self.database,
+                                               default_access_mode=READ_ACCESS)
+        return self.session
+    
     def run_query(self, query, description="", params=None):
         """Run a Cypher query and return results"""
         try:
-            with self.driver.session() as session:
-                result = session.run(query, params or {})
-                records = list(result)
-                if description:
-                    print(f"\n📊 {description}")
-                    print("-" * 50)
-                return records
+            # Each query gets its own read transaction, so one failure cannot poison the rest
+            records = self.get_session().execute_read(
+                lambda tx: list(tx.run(query, params or {}))
+            )
+            if description:
+                print(f"\n📊 {description}")
+                print("-" * 50)
+            return records
         except Exception as e:
             print(f"❌ Error running query: {e}")
             return []
@@ -49,43 +70,41 @@ class OrphanedFounderInvestigator:
         print("\n🔍 ORPHANED FOUNDERS ANALYSIS")
         print("=" * 60)
         
-        # Get sample orphaned founders
-        orphaned_founders = self.run_query(
+        # Sample and connection statistics in one pass; COUNT {} on a bare
+        # pattern reads each node's degree instead of expanding relationships
+        results = self.run_query(
             """
             MATCH (f:Founder)
-            WHERE NOT (f)-[]-()
-            RETURN f.id, f.name, keys(f) as properties
-            LIMIT 10
+            WITH f, COUNT { (f)--() } as rel_count
+            WITH collect(CASE WHEN rel_count = 0
+                              THEN {id: f.id, name: f.name, properties: keys(f)} END) as orphans,
+                 sum(CASE WHEN rel_count > 0 THEN 1 ELSE 0 END) as connected_count,
+                 count(f) as total_founders
+            RETURN orphans[0..$sample_size] as samples,
+                   size(orphans) as orphaned_count,
+                   connected_count,
+                   total_founders
             """,
-            "Sample Orphaned Founders:"
+            "Sample Orphaned Founders:",
+            {'sample_size': 10}
         )
         
-        for founder in orphaned_founders:
-            name = founder['f.name'] or 'Unknown'
-            founder_id = founder['f.id'] or 'Unknown'
+        if not results:
+            return
+        stats = results[0]
+        
+        for founder in stats['samples']:
+            name = founder['name'] or 'Unknown'
+            founder_id = founder['id'] or 'Unknown'
             props = ', '.join(founder['properties']) if founder['properties'] else 'No properties'
             print(f"  • {name} ({founder_id}) - Properties: {props}")
         
-        # Count total orphaned vs connected founders
-        total_stats = self.run_query(
-            """
-            MATCH (f:Founder)
-            OPTIONAL MATCH (f)-[r]-()
-            WITH f, count(r) as rel_count
-            RETURN 
-                sum(CASE WHEN rel_count = 0 THEN 1 ELSE 0 END) as orphaned_count,
-                sum(CASE WHEN rel_count > 0 THEN 1 ELSE 0 END) as connected_count,
-                count(f) as total_founders
-            """,
-            "Founder Connection Statistics:"
-        )
-        
-        if total_stats:
-            stats = total_stats[0]
-            print(f"  • Total Founders: {stats['total_founders']:,}")
-            print(f"  • Connected Founders: {stats['connected_count']:,}")
-            print(f"  • Orphaned Founders: {stats['orphaned_count']:,}")
-            print(f"  • Orphaned Percentage: {(stats['orphaned_count']/stats['total_founders']*100):.1f}%")
+        print("\n📊 Founder Connection Statistics:")
+        print("-" * 50)
+        print(f"  • Total Founders: {stats['total_founders']:,}")
+        print(f"  • Connected Founders: {stats['connected_count']:,}")
+        print(f"  • Orphaned Founders: {stats['orphaned_count']:,}")
+        print(f"  • Orphaned Percentage: {(stats['orphaned_count']/stats['total_founders']*100):.1f}%")
     
     def check_original_json_data(self):
         """Check the original JSON data to understand the source"""
@@ -93,48 +112,34 @@ class OrphanedFounderInvestigator:
         print("=" * 60)
         
         try:
-            with open('startup_knowledge_graph.json', 'r') as f:
-                kg_data = json.load(f)
-            
-            entities = kg_data.get('entities', {})
-            relationships = kg_data.get('relationships', [])
-            
-            # Count founders in JSON
-            founder_entities = {k: v for k, v in entities.items() if v.get('type') == 'founder'}
-            print(f"📊 Founders in JSON: {len(founder_entities):,}")
-            
-            # Count WORKS_AT relationships in JSON
-            works_at_rels = [r for r in relationships if r.get('type') == 'WORKS_AT']
-            print(f"📊 WORKS_AT relationships in JSON: {len(works_at_rels):,}")
-            
-            # Get unique founder IDs from WORKS_AT relationships
-            founders_with_jobs = set()
-            for rel in works_at_rels:
-                if 'source' in rel:
-                    founders_with_jobs.add(rel['source'])
-            
-            print(f"📊 Unique founders with jobs: {len(founders_with_jobs):,}")
-            
-            # Find founders without jobs
-            all_founder_ids = set(founder_entities.keys())
-            founders_without_jobs = all_founder_ids - founders_with_jobs
-            
-            print(f"📊 Founders without jobs in JSON: {len(founders_without_jobs):,}")
-            print(f"📊 This matches orphaned founders: {len(founders_without_jobs) == 319}")
-            
-            # Show sample founders without jobs
-            print("\n📋 Sample founders without jobs in JSON:")
-            sample_orphaned = list(founders_without_jobs)[:10]
-            for founder_id in sample_orphaned:
-                founder_data = founder_entities[founder_id]
-                name = founder_data.get('properties', {}).get('name', 'Unknown')
-                print(f"  • {name} ({founder_id})")
+            # Shared with verify_kg_creation, so either run fills the cache
+            self.report_json_founders(load_kg_summary(JSON_FILE))
                 
         except FileNotFoundError:
             print("❌ startup_knowledge_graph.json not found")
         except Exception as e:
             print(f"❌ Error reading JSON: {e}")
     
+    def report_json_founders(self, summary):
+        """Report founders without jobs in the JSON"""
+        founder_names = summary['founder_names']
+        founders_with_jobs = summary['works_at_sources']
+        print(f"📊 Founders in JSON: {len(founder_names):,}")
+        print(f"📊 WORKS_AT relationships in JSON: {summary['rel_counts']['WORKS_AT']:,}")
+        print(f"📊 Unique founders with jobs: {len(founders_with_jobs):,}")
+        
+        # Find founders without jobs
+        founders_without_jobs = founder_names.keys() - founders_with_jobs
+        
+        print(f"📊 Founders without jobs in JSON: {len(founders_without_jobs):,}")
+        print(f"📊 This matches orphaned founders: {len(founders_without_jobs) == 319}")
+        
+        # Show sample founders without jobs
+        print("\n📋 Sample founders without jobs in JSON:")
+        sample_orphaned = list(founders_without_jobs)[:10]
+        for founder_id in sample_orphaned:
+            print(f"  • {founder_names[founder_id]} ({founder_id})")
+    
     def check_works_at_relationships(self):
         """Analyze the WORKS_AT relationships to understand the pattern"""
         print("\n🔗 WORKS_AT RELATIONSHIP ANALYSIS")
@@ -143,10 +148,15 @@ class OrphanedFounderInvestigator:
         # Check if all WORKS_AT relationships have founders as source
         works_at_analysis = self.run_query(
             """
-            MATCH (f:Founder)-[r:WORKS_AT]->(s:Startup)
-            RETURN count(r) as total_works_at,
-                   count(DISTINCT f) as unique_founders_working,
-                   count(DISTINCT s) as unique_startups_with_founders
+            MATCH (f:Founder)-[:WORKS_AT]->(s:Startup)
+            WITH count(DISTINCT f) as unique_founders_working,
+                 count(DISTINCT s) as unique_startups_with_founders
+            CALL {
+                // One labelled endpoint lets the planner answer from the count store
+                MATCH (:Founder)-[r:WORKS_AT]->()
+                RETURN count(r) as total_works_at
+            }
+            RETURN total_works_at, unique_founders_working, unique_startups_with_founders
             """,
             "WORKS_AT Relationship Statistics:"
         )
@@ -187,17 +197,17 @@ class OrphanedFounderInvestigator:
         orphaned_vs_connected = self.run_query(
             """
             MATCH (f:Founder)
-            OPTIONAL MATCH (f)-[r]-()
-            WITH f, count(r) as rel_count
+            WITH f, COUNT { (f)--() } as rel_count
             WITH 
                 CASE WHEN rel_count = 0 THEN 'orphaned' ELSE 'connected' END as status,
                 f
             RETURN status, 
                    count(f) as founder_count,
-                   collect(f.id)[0..5] as sample_ids
+                   collect(f.id)[0..$sample_size] as sample_ids
             ORDER BY status
             """,
-            "Orphaned vs Connected Founder IDs:"
+            "Orphaned vs Connected Founder IDs:",
+            {'sample_size': 5}
         )
         
         for row in orphaned_vs_connected:
@@ -210,14 +220,28 @@ class OrphanedFounderInvestigator:
         # Check if there's a pattern in the IDs
         orphaned_id_pattern = self.run_query(
             """
-            MATCH (f:Founder)
-            WHERE NOT (f)-[]-()
-            WITH f.id as founder_id
-            ORDER BY founder_id
-            RETURN collect(founder_id)[0..20] as first_20_orphaned_ids,
-                   collect(founder_id)[-20..] as last_20_orphaned_ids
+            CALL {
+                // ORDER BY ... LIMIT plans as a bounded Top-N instead of a full sort
+                MATCH (f:Founder)
+                WHERE COUNT { (f)--() } = 0
+                WITH f.id as founder_id
+                ORDER BY founder_id ASC
+                LIMIT $sample_size
+                RETURN collect(founder_id) as first_ids
+            }
+            CALL {
+                MATCH (f:Founder)
+                WHERE COUNT { (f)--() } = 0
+                WITH f.id as founder_id
+                ORDER BY founder_id DESC
+                LIMIT $sample_size
+                RETURN reverse(collect(founder_id)) as last_ids
+            }
+            RETURN first_ids as first_20_orphaned_ids,
+                   last_ids as last_20_orphaned_ids
             """,
-            "Orphaned Founder ID Patterns:"
+            "Orphaned Founder ID Patterns:",
+            {'sample_size': 20}
         )
         
         if orphaned_id_pattern:
@@ -246,6 +270,9 @@ class OrphanedFounderInvestigator:
     
     def close(self):
         """Close the Neo4j connection"""
+        if self.session:
+            self.session.close()
+            self.session = None
         if self.driver:
             self.driver.close()
             print("\n🔒 Neo4j connection closed")
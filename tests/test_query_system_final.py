@@ -4,36 +4,43 @@ Final test of the query system for all 8 sample questions
 """
 import sys
 import os
+import asyncio
 
 # Add parent directory to path so we can import modules
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
-from query_system import IntelligentQuerySystem
+from query_system import get_query_system
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
+from test_neo4j_queries import Neo4jGraphTester
 
-def test_all_sample_questions():
-    """Test all 8 sample questions from sample_questions.md"""
+def test_all_sample_questions(driver=None):
+    """
+    Test all 8 sample questions from sample_questions.md. A driver passed in is
+    shared with other test code, which also closes it.
+    """
     
     print("🎯 TESTING ALL 8 SAMPLE QUESTIONS")
     print("=" * 60)
     
     # Setup connection
     load_dotenv()
-    uri = os.getenv("NEO4J_URI")
-    username = os.getenv("NEO4J_USER", "neo4j") 
-    password = os.getenv("NEO4J_PASSWORD")
     database = os.getenv("NEO4J_DATABASE", "neo4j")
-    
-    driver = GraphDatabase.driver(
-        uri, 
-        auth=(username, password),
-        notifications_min_severity='WARNING'
-    )
+    owns_driver = driver is None
+    if owns_driver:
+        uri = os.getenv("NEO4J_URI")
+        username = os.getenv("NEO4J_USER", "neo4j") 
+        password = os.getenv("NEO4J_PASSWORD")
+        
+        driver = GraphDatabase.driver(
+            uri, 
+            auth=(username, password),
+            notifications_min_severity='WARNING'
+        )
     
     # Initialize query system (note: requires GEMINI_API_KEY for LLM)
-    iqs = IntelligentQuerySystem(driver, database)
+    iqs = get_query_system(driver, database)
     
     # All 8 sample questions
     questions = [
@@ -68,8 +75,28 @@ def test_all_sample_questions():
             print(f"   Error: {e}")
             print(f"   Traceback: {traceback.format_exc()}")
     
-    driver.close()
+    if owns_driver:
+        driver.close()
     print("\n🎉 Query system testing complete!")
 
+def main():
+    """Validate the graph, then ask the sample questions, over one shared driver"""
+    load_dotenv()
+    uri = os.getenv("NEO4J_URI")
+    username = os.getenv("NEO4J_USER", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD")
+    
+    # One pool and handshake for both suites; each leaves a driver it was given open
+    driver = GraphDatabase.driver(
+        uri,
+        auth=(username, password),
+        notifications_min_severity='WARNING'
+    )
+    try:
+        asyncio.run(Neo4jGraphTester(driver).run_all_tests())
+        test_all_sample_questions(driver)
+    finally:
+        driver.close()
+
 if __name__ == "__main__":
-    test_all_sample_questions() 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -9,45 +9,161 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 import json
-import networkx as nx
+import functools
+import numpy as np
 from collections import defaultdict
 
-def load_knowledge_graph_to_networkx():
-    """Load knowledge graph from JSON into NetworkX"""
-    with open('startup_knowledge_graph.json', 'r') as f:
-        kg = json.load(f)
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses the same file
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: bit-packed popcounts compute the same scores
+    njit = None
+
+def jaccard_counts(set1, set2):
+    """Return (intersection size, union size, Jaccard index) without building the union set"""
+    if not set1 or not set2:
+        return 0, len(set1) + len(set2), 0
+    intersection = len(set1 & set2)
+    union = len(set1) + len(set2) - intersection
+    return intersection, union, intersection / union if union > 0 else 0
+
+def popcount(words):
+    """Number of set bits along the last axis of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(words.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def pairwise_jaccard(indptr, indices):
+        """Jaccard index of rows a < b of a CSR set matrix with sorted ids (upper triangle)"""
+        n = len(indptr) - 1
+        jaccard = np.zeros((n, n))
+        for a in prange(n):
+            # An empty set shares nothing, so its row stays 0
+            if indptr[a] == indptr[a + 1]:
+                continue
+            for b in range(a + 1, n):
+                # Empty sets and non-overlapping id ranges share nothing either
+                if (indptr[b] == indptr[b + 1] or indices[indptr[a + 1] - 1] < indices[indptr[b]]
+                        or indices[indptr[b + 1] - 1] < indices[indptr[a]]):
+                    continue
+                # Two-pointer walk over both sorted id lists counts the shared ids
+                i, j, shared = indptr[a], indptr[b], 0
+                while i < indptr[a + 1] and j < indptr[b + 1]:
+                    if indices[i] == indices[j]:
+                        shared += 1
+                        i += 1
+                        j += 1
+                    elif indices[i] < indices[j]:
+                        i += 1
+                    else:
+                        j += 1
+                union = (indptr[a + 1] - indptr[a]) + (indptr[b + 1] - indptr[b]) - shared
+                if union > 0:
+                    jaccard[a, b] = shared / union
+        return jaccard
+else:
+    def pairwise_jaccard(indptr, indices):
+        """Jaccard index of every row pair of a CSR set matrix, from bit-packed popcounts"""
+        n = len(indptr) - 1
+        membership = np.zeros((n, indices.max() + 1 if len(indices) else 0), dtype=bool)
+        membership[np.repeat(np.arange(n), np.diff(indptr)), indices] = True
+        
+        # Each set packed into uint64 words; a pair's intersection and union are the
+        # popcounts of the ANDed and ORed words
+        packed = np.packbits(membership, axis=1)
+        packed = np.pad(packed, ((0, 0), (0, -packed.shape[1] % 8))).view(np.uint64)
+        intersection = popcount(packed[:, None, :] & packed[None, :, :])
+        union = popcount(packed[:, None, :] | packed[None, :, :])
+        return np.divide(intersection, union, out=np.zeros(union.shape), where=union > 0)
+
+def read_knowledge_graph(path='startup_knowledge_graph.json'):
+    """Parse the knowledge graph JSON, with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Bare NaN written for missing values is only accepted by stdlib json
+            pass
+    return json.loads(raw)
+
+@functools.lru_cache(maxsize=1)
+def load_indexed_kg(path='startup_knowledge_graph.json'):
+    """Index the knowledge graph JSON by name in one pass, once; callers share the indices and must not modify them
     
-    G = nx.Graph()
+    Returns (id_to_name, startup_techs, vc_investments, founder_props_by_name).
+    """
+    kg = read_knowledge_graph(path)
     
     # Create mapping from ID to name
     id_to_name = {}
+    founder_props_by_name = {}
     for entity_id, entity_data in kg['entities'].items():
+        # Interned once, so every index below shares one string object per name and
+        # lookups between same-named keys short-circuit on identity
         name = entity_data['properties']['name']
+        if isinstance(name, str):
+            name = sys.intern(name)
         id_to_name[entity_id] = name
-        G.add_node(name, **entity_data['properties'], entity_type=entity_data['type'], entity_id=entity_id)
+        if entity_data['type'] == 'founder':
+            founder_props_by_name.setdefault(name, entity_data['properties'])
     
-    # Add relationships as edges using names instead of IDs
+    # Source name -> set of target names, per relationship type the tests compare
+    startup_techs = defaultdict(set)
+    vc_investments = defaultdict(set)
+    index_for = {'USES_TECHNOLOGY': startup_techs, 'INVESTS_IN': vc_investments}
     for rel_data in kg['relationships']:
+        index = index_for.get(rel_data['type'])
+        if index is None:
+            continue
         source_name = id_to_name.get(rel_data['source'])
         target_name = id_to_name.get(rel_data['target'])
         if source_name and target_name:
-            G.add_edge(source_name, target_name, relationship=rel_data['type'], **rel_data['properties'])
+            index[source_name].add(target_name)
+    
+    return id_to_name, startup_techs, vc_investments, founder_props_by_name
+
+# Attribute codes for a value that is NaN (never equal, as NaN != NaN) or not set at all
+NAN_CODE = -1
+MISSING_CODE = -2
+
+def encode_founder_attributes(founder_props_by_name):
+    """Encode founder properties as an int32 [founder, attribute] matrix of per-attribute value codes
     
-    return G
+    Returns (row_of_name, attributes, codes).
+    """
+    names = list(founder_props_by_name)
+    attributes = sorted(set().union(*founder_props_by_name.values())) if names else []
+    codes = np.full((len(names), len(attributes)), MISSING_CODE, dtype=np.int32)
+    for k, attr in enumerate(attributes):
+        value_codes = {}
+        for row, name in enumerate(names):
+            props = founder_props_by_name[name]
+            if attr in props:
+                value = props[attr]
+                codes[row, k] = NAN_CODE if value != value else value_codes.setdefault(value, len(value_codes))
+    return {name: row for row, name in enumerate(names)}, attributes, codes
+
+def attribute_similarity(codes_a, codes_b):
+    """Matching attributes / attributes set on either side, for paired rows of attribute codes"""
+    matching = (codes_a == codes_b) & (codes_a >= 0)
+    total = ((codes_a != MISSING_CODE) | (codes_b != MISSING_CODE)).sum(axis=-1)
+    return matching, total, np.divide(matching.sum(axis=-1), total, out=np.zeros(total.shape), where=total > 0)
 
 def test_startup_similarity_logic():
     """Test startup similarity calculations and verify they make sense"""
     print("🧪 TESTING STARTUP SIMILARITY LOGIC")
     print("=" * 50)
     
-    # Load graph
-    G = load_knowledge_graph_to_networkx()
-    
     # Get all startups and their technologies
-    startup_techs = defaultdict(set)
-    for startup, tech, data in G.edges(data=True):
-        if data.get('relationship') == 'USES_TECHNOLOGY':
-            startup_techs[startup].add(tech)
+    _, startup_techs, _, _ = load_indexed_kg()
     
     # Test specific similarity calculations
     test_cases = [
@@ -61,14 +177,16 @@ def test_startup_similarity_logic():
             techs1 = startup_techs[startup1]
             techs2 = startup_techs[startup2]
             
-            intersection = len(techs1 & techs2)
-            union = len(techs1 | techs2)
-            jaccard = intersection / union if union > 0 else 0
+            intersection, union, jaccard = jaccard_counts(techs1, techs2)
+            
+            sorted1 = sorted(techs1)
+            # Filtering the sorted list keeps the shared techs in order without another sort
+            shared = [tech for tech in sorted1 if tech in techs2]
             
             print(f"\n📊 {startup1} vs {startup2}")
-            print(f"   Technologies A: {sorted(list(techs1))}")
-            print(f"   Technologies B: {sorted(list(techs2))}")
-            print(f"   Shared: {sorted(list(techs1 & techs2))} ({intersection} techs)")
+            print(f"   Technologies A: {sorted1}")
+            print(f"   Technologies B: {sorted(techs2)}")
+            print(f"   Shared: {shared} ({intersection} techs)")
             print(f"   Total unique: {union} techs")
             print(f"   Jaccard Index: {jaccard:.3f}")
             print(f"   ✅ LOGIC: Higher shared techs / lower total unique = higher similarity")
@@ -78,13 +196,8 @@ def test_vc_similarity_logic():
     print("\n\n💰 TESTING VC SIMILARITY LOGIC")
     print("=" * 50)
     
-    G = load_knowledge_graph_to_networkx()
-    
     # Get all VCs and their investments
-    vc_investments = defaultdict(set)
-    for vc, startup, data in G.edges(data=True):
-        if data.get('relationship') == 'INVESTS_IN':
-            vc_investments[vc].add(startup)
+    _, _, vc_investments, _ = load_indexed_kg()
     
     print(f"   Found {len(vc_investments)} VCs with investments")
     if len(vc_investments) > 0:
@@ -104,14 +217,13 @@ def test_vc_similarity_logic():
             investments1 = vc_investments[vc1]
             investments2 = vc_investments[vc2]
             
-            intersection = len(investments1 & investments2)
-            union = len(investments1 | investments2)
-            jaccard = intersection / union if union > 0 else 0
+            intersection, union, jaccard = jaccard_counts(investments1, investments2)
             
             print(f"\n💼 {vc1} vs {vc2}")
             print(f"   Investments A: {len(investments1)} startups")
             print(f"   Investments B: {len(investments2)} startups")
-            print(f"   Co-investments: {sorted(list(investments1 & investments2))} ({intersection} startups)")
+            co_investments = [startup for startup in sorted(investments1) if startup in investments2]
+            print(f"   Co-investments: {co_investments} ({intersection} startups)")
             print(f"   Total portfolio: {union} unique startups")
             print(f"   Jaccard Index: {jaccard:.3f}")
             print(f"   ✅ LOGIC: More co-investments / smaller combined portfolio = higher similarity")
@@ -121,11 +233,8 @@ def test_founder_similarity_logic():
     print("\n\n👥 TESTING FOUNDER SIMILARITY LOGIC")
     print("=" * 50)
     
-    # Load original data to get founder attributes
-    with open('startup_knowledge_graph.json', 'r') as f:
-        kg = json.load(f)
-    
-    founders = {entity_id: entity_data for entity_id, entity_data in kg['entities'].items() if entity_data['type'] == 'founder'}
+    # Founder attributes keyed by name
+    _, _, _, founder_props_by_name = load_indexed_kg()
     
     # Test specific founder pairs
     test_cases = [
@@ -134,33 +243,24 @@ def test_founder_similarity_logic():
         ("Shirley Thompson", "Andre Velazquez")
     ]
     
-    for founder1_name, founder2_name in test_cases:
-        founder1 = next((f for f in founders.values() if f['properties']['name'] == founder1_name), None)
-        founder2 = next((f for f in founders.values() if f['properties']['name'] == founder2_name), None)
+    # Every pair is compared at once over the founders' attribute code rows
+    row_of_name, attributes, codes = encode_founder_attributes(founder_props_by_name)
+    pairs = [(founder1_name, founder2_name) for founder1_name, founder2_name in test_cases
+             if founder1_name in row_of_name and founder2_name in row_of_name]
+    rows_a = codes[[row_of_name[founder1_name] for founder1_name, _ in pairs]]
+    rows_b = codes[[row_of_name[founder2_name] for _, founder2_name in pairs]]
+    matching, total, similarity = attribute_similarity(rows_a, rows_b)
+    
+    for p, (founder1_name, founder2_name) in enumerate(pairs):
+        common_attrs = [attributes[k] for k in np.flatnonzero(matching[p])]
         
-        if founder1 and founder2:
-            # Compare attributes
-            attrs1 = founder1['properties']
-            attrs2 = founder2['properties']
-            
-            # Check each attribute
-            common_attrs = []
-            total_attrs = set(attrs1.keys()) | set(attrs2.keys())
-            
-            for attr in total_attrs:
-                if attr in attrs1 and attr in attrs2:
-                    if attrs1[attr] == attrs2[attr]:
-                        common_attrs.append(attr)
-            
-            similarity = len(common_attrs) / len(total_attrs) if total_attrs else 0
-            
-            print(f"\n👤 {founder1_name} vs {founder2_name}")
-            print(f"   Founder A attributes: {attrs1}")
-            print(f"   Founder B attributes: {attrs2}")
-            print(f"   Matching attributes: {common_attrs}")
-            print(f"   Total attributes: {len(total_attrs)}")
-            print(f"   Similarity: {similarity:.3f}")
-            print(f"   ✅ LOGIC: More matching attributes / total attributes = higher similarity")
+        print(f"\n👤 {founder1_name} vs {founder2_name}")
+        print(f"   Founder A attributes: {founder_props_by_name[founder1_name]}")
+        print(f"   Founder B attributes: {founder_props_by_name[founder2_name]}")
+        print(f"   Matching attributes: {common_attrs}")
+        print(f"   Total attributes: {total[p]}")
+        print(f"   Similarity: {similarity[p]:.3f}")
+        print(f"   ✅ LOGIC: More matching attributes / total attributes = higher similarity")
 
 def test_edge_cases():
     """Test edge cases and boundary conditions"""
@@ -172,21 +272,19 @@ def test_edge_cases():
     
     # Jaccard of identical sets
     set1 = {"AI", "Machine Learning", "Python"}
-    jaccard_identical = len(set1 & set1) / len(set1 | set1)
+    _, _, jaccard_identical = jaccard_counts(set1, set1)
     print(f"   Identical tech sets: {jaccard_identical:.3f} ✅ (should be 1.0)")
     
     # Test completely different entities (should be 0.0 similarity)
     print("\n🎯 Testing completely different entities:")
     set2 = {"Blockchain", "Rust", "Cryptocurrency"}
-    jaccard_different = len(set1 & set2) / len(set1 | set2)
+    _, _, jaccard_different = jaccard_counts(set1, set2)
     print(f"   Different tech sets: {jaccard_different:.3f} ✅ (should be 0.0)")
     
     # Test partial overlap
     print("\n🎯 Testing partial overlap:")
     set3 = {"AI", "Java", "Cloud"}
-    intersection = len(set1 & set3)
-    union = len(set1 | set3)
-    jaccard_partial = intersection / union
+    intersection, union, jaccard_partial = jaccard_counts(set1, set3)
     print(f"   Set 1: {set1}")
     print(f"   Set 3: {set3}")
     print(f"   Shared: {set1 & set3} ({intersection} items)")
@@ -198,28 +296,22 @@ def validate_similarity_ranges():
     print("\n\n📏 VALIDATING SIMILARITY RANGES")
     print("=" * 50)
     
-    G = load_knowledge_graph_to_networkx()
-    
     # Check startup similarities
-    startup_techs = defaultdict(set)
-    for startup, tech, data in G.edges(data=True):
-        if data.get('relationship') == 'USES_TECHNOLOGY':
-            startup_techs[startup].add(tech)
+    _, startup_techs, _, _ = load_indexed_kg()
     
-    startups = list(startup_techs.keys())[:10]  # Test first 10
-    invalid_scores = []
+    # Every startup pair at once, from each startup's sorted technology ids in CSR layout
+    startups = list(startup_techs.keys())
+    tech_index = {tech: k for k, tech in enumerate(set().union(*startup_techs.values()))}
+    rows = [sorted(tech_index[tech] for tech in startup_techs[startup]) for startup in startups]
+    indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.array([k for row in rows for k in row], dtype=np.int32)
+    jaccard = pairwise_jaccard(indptr, indices)
     
-    for i, startup1 in enumerate(startups):
-        for startup2 in startups[i+1:]:
-            techs1 = startup_techs[startup1]
-            techs2 = startup_techs[startup2]
-            
-            intersection = len(techs1 & techs2)
-            union = len(techs1 | techs2)
-            jaccard = intersection / union if union > 0 else 0
-            
-            if not (0 <= jaccard <= 1):
-                invalid_scores.append((startup1, startup2, jaccard))
+    i, j = np.triu_indices(len(startups), k=1)
+    scores = jaccard[i, j]
+    invalid = np.flatnonzero(~((scores >= 0) & (scores <= 1)))
+    invalid_scores = [(startups[i[k]], startups[j[k]], scores[k]) for k in invalid]
     
     if invalid_scores:
         print(f"❌ Found {len(invalid_scores)} invalid similarity scores!")
@@ -3,6 +3,11 @@ import json
 import networkx as nx
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json writes the same graph
+    orjson = None
+
 # Load all data
 startups = pd.read_csv('data/startup_ecosystem_startups.csv')
 founders = pd.read_csv('data/startup_ecosystem_founders.csv')
@@ -20,81 +25,64 @@ kg = {
 
 print("Building Knowledge Graph...")
 
-# Add Startups
-for _, startup in startups.iterrows():
-    kg["entities"][startup['id']] = {
-        "type": "startup",
-        "properties": startup.to_dict()
-    }
-
-# Add Founders
-for _, founder in founders.iterrows():
-    kg["entities"][founder['id']] = {
-        "type": "founder",
-        "properties": founder.to_dict()
-    }
-
-# Add VCs
-for _, vc in vcs.iterrows():
-    kg["entities"][vc['id']] = {
-        "type": "vc",
-        "properties": vc.to_dict()
-    }
-
-# Add Technologies
-for _, tech in technologies.iterrows():
-    kg["entities"][tech['id']] = {
-        "type": "technology",
-        "properties": tech.to_dict()
-    }
+# Add entities; to_dict('records') converts each table in one pass instead of a Series per row
+for entity_type, table in [("startup", startups), ("founder", founders), ("vc", vcs), ("technology", technologies)]:
+    for record in table.to_dict('records'):
+        kg["entities"][record['id']] = {
+            "type": entity_type,
+            "properties": record
+        }
 
 # Add Founder-Startup relationships
-for _, rel in founder_startup.iterrows():
-    kg["relationships"].append({
-        "source": rel['founder_id'],
-        "target": rel['startup_id'],
-        "type": "WORKS_AT",
-        "properties": {
-            "role": rel['role'],
-            "equity_percentage": rel['equity_percentage'],
-            "is_active": rel['is_active']
-        }
-    })
+kg["relationships"].extend({
+    "source": rel['founder_id'],
+    "target": rel['startup_id'],
+    "type": "WORKS_AT",
+    "properties": {
+        "role": rel['role'],
+        "equity_percentage": rel['equity_percentage'],
+        "is_active": rel['is_active']
+    }
+} for rel in founder_startup.to_dict('records'))
 
 # Add Investment relationships
-for _, inv in investments.iterrows():
-    kg["relationships"].append({
-        "source": inv['vc_id'],
-        "target": inv['startup_id'],
-        "type": "INVESTS_IN",
-        "properties": {
-            "round_type": inv['round_type'],
-            "amount": inv['amount'],
-            "date": inv['date'],
-            "valuation": inv['valuation'],
-            "lead_investor": inv['lead_investor']
-        }
-    })
+kg["relationships"].extend({
+    "source": inv['vc_id'],
+    "target": inv['startup_id'],
+    "type": "INVESTS_IN",
+    "properties": {
+        "round_type": inv['round_type'],
+        "amount": inv['amount'],
+        "date": inv['date'],
+        "valuation": inv['valuation'],
+        "lead_investor": inv['lead_investor']
+    }
+} for inv in investments.to_dict('records'))
 
 # Add Startup-Technology relationships
-for _, tech_rel in startup_tech.iterrows():
-    kg["relationships"].append({
-        "source": tech_rel['startup_id'],
-        "target": tech_rel['technology_id'],
-        "type": "USES_TECHNOLOGY",
-        "properties": {
-            "usage_intensity": tech_rel['usage_intensity'],
-            "implementation_date": tech_rel['implementation_date']
-        }
-    })
+kg["relationships"].extend({
+    "source": tech_rel['startup_id'],
+    "target": tech_rel['technology_id'],
+    "type": "USES_TECHNOLOGY",
+    "properties": {
+        "usage_intensity": tech_rel['usage_intensity'],
+        "implementation_date": tech_rel['implementation_date']
+    }
+} for tech_rel in startup_tech.to_dict('records'))
 
 print(f"Knowledge Graph created with:")
 print(f"- {len(kg['entities'])} entities")
 print(f"- {len(kg['relationships'])} relationships")
 
-# Save as JSON
-with open('startup_knowledge_graph.json', 'w') as f:
-    json.dump(kg, f, indent=2, default=str)
+# Save as JSON. orjson would write missing values as null, but readers of this file treat
+# the bare NaN stdlib json writes as a present value, so only a graph without gaps uses it
+tables = [startups, founders, investments, technologies, vcs, founder_startup, startup_tech]
+if orjson is not None and not any(table.isna().values.any() for table in tables):
+    with open('startup_knowledge_graph.json', 'wb') as f:
+        f.write(orjson.dumps(kg, default=str, option=orjson.OPT_INDENT_2))
+else:
+    with open('startup_knowledge_graph.json', 'w') as f:
+        json.dump(kg, f, indent=2, default=str)
 
 print("Saved knowledge graph to 'startup_knowledge_graph.json'")
 
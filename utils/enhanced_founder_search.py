@@ -14,10 +14,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
-from query_system import IntelligentQuerySystem
+from query_system import get_query_system
 from similarity_analysis import StartupSimilarityAnalyzer
 import pandas as pd
 
+# Background columns returned for a founder; records are keyed 'f.name', 'f.university', ...
+FOUNDER_BACKGROUND_RETURN = 'RETURN f.name, f.previous_company, f.domain_expertise, f.technical_background, f.education_level, f.university, f.years_experience'
+
 class EnhancedFounderSearch:
     def __init__(self):
         # Setup Neo4j connection
@@ -34,24 +37,55 @@ class EnhancedFounderSearch:
         )
         
         # Initialize both systems
-        self.query_system = IntelligentQuerySystem(self.driver, database)
+        self.query_system = get_query_system(self.driver, database)
+        
+        # One session for the lookups below; sessions are not thread-safe, so it
+        # must only be used from the thread that created it
+        self.session = self.driver.session(database=database)
         self.similarity_analyzer = StartupSimilarityAnalyzer('startup_knowledge_graph.json')
         
+        # Founder backgrounds already fetched this session, keyed by name
+        self.background_cache = {}
+        
+        # Every founder name, sorted, fetched on first use; the set answers existence checks
+        self.founder_names = None
+        self.founder_name_set = set()
+        
     def get_founder_background(self, founder_name):
         """Get a founder's background information"""
-        with self.driver.session() as session:
-            result = session.run(
-                'MATCH (f:Founder {name: $name}) RETURN f.name, f.previous_company, f.domain_expertise, f.technical_background, f.education_level, f.university, f.years_experience',
-                name=founder_name
+        if founder_name in self.background_cache:
+            return self.background_cache[founder_name]
+        if self.founder_names is not None and founder_name not in self.founder_name_set:
+            return None
+        result = self.session.run(
+            'MATCH (f:Founder {name: $name}) ' + FOUNDER_BACKGROUND_RETURN,
+            name=founder_name
+        )
+        founder_data = result.single()
+        if not founder_data:
+            return None
+        self.background_cache[founder_name] = founder_data.data()
+        return self.background_cache[founder_name]
+    
+    def get_founder_backgrounds(self, names):
+        """Get background information for several founders in one query, keyed by name"""
+        missing = list({name for name in names if name not in self.background_cache})
+        if missing:
+            result = self.session.run(
+                'MATCH (f:Founder) WHERE f.name IN $names ' + FOUNDER_BACKGROUND_RETURN,
+                names=missing
             )
-            founder_data = result.single()
-            return founder_data.data() if founder_data else None
+            for record in result:
+                self.background_cache.setdefault(record['f.name'], record.data())
+        return {name: self.background_cache[name] for name in names if name in self.background_cache}
     
     def get_available_founders(self, limit=20):
         """Get a list of available founders for the user to choose from"""
-        with self.driver.session() as session:
-            result = session.run('MATCH (f:Founder) RETURN f.name ORDER BY f.name LIMIT $limit', limit=limit)
-            return [record['f.name'] for record in result]
+        if self.founder_names is None:
+            result = self.session.run('MATCH (f:Founder) WHERE f.name IS NOT NULL RETURN f.name')
+            self.founder_name_set = {record['f.name'] for record in result}
+            self.founder_names = sorted(self.founder_name_set)
+        return self.founder_names[:limit]
     
     def llm_similar_founders(self, founder_name):
         """Get similar founders using LLM/Cypher query"""
@@ -79,8 +113,13 @@ class EnhancedFounderSearch:
         print(f"\n🔍 SIMILARITY COMPARISON FOR: {target_founder}")
         print("=" * 70)
         
-        # Get target founder's background
-        target_background = self.get_founder_background(target_founder)
+        # Get the target's and every listed LLM founder's background in one round-trip
+        names = [target_founder]
+        if isinstance(llm_results, list):
+            names.extend(founder.get('f.name', '') for founder in llm_results[:5])
+        backgrounds = self.get_founder_backgrounds(names)
+        
+        target_background = backgrounds.get(target_founder)
         if target_background:
             print(f"\n📊 TARGET FOUNDER BACKGROUND:")
             for key, value in target_background.items():
@@ -92,7 +131,7 @@ class EnhancedFounderSearch:
             for i, founder in enumerate(llm_results[:5], 1):
                 print(f"   {i}. {founder.get('f.name', 'Unknown')}")
                 # Check actual similarities
-                founder_bg = self.get_founder_background(founder.get('f.name', ''))
+                founder_bg = backgrounds.get(founder.get('f.name', ''))
                 if founder_bg and target_background:
                     similarities = self._calculate_manual_similarity(target_background, founder_bg)
                     print(f"      Actual similarities: {similarities}")
@@ -176,6 +215,10 @@ class EnhancedFounderSearch:
     
     def close(self):
         """Close database connection"""
+        self.background_cache.clear()
+        self.founder_names = None
+        self.founder_name_set = set()
+        self.session.close()
         self.driver.close()
 
 def main():
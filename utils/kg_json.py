@@ -0,0 +1,148 @@
+"""
+Knowledge Graph JSON Reading
+Dependency-free helpers for reading startup_knowledge_graph.json, shared by the
+Neo4j importer and the analysis and verification scripts
+"""
+
+import json
+import os
+import pickle
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import ijson
+except ImportError:  # Optional: fall back to json.load without streaming
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses the non-streaming fallback
+    orjson = None
+
+class NaNAsNullReader:
+    """
+    Binary file wrapper that rewrites bare NaN tokens to null for ijson.
+    json.dump writes missing CSV values as NaN, which strict JSON parsers reject.
+    """
+    # A whole string literal (skipped, so NaN inside text is left alone), a NaN
+    # token, or the opening quote of a string that is not finished yet
+    TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|NaN|"', re.DOTALL)
+    
+    def __init__(self, f):
+        self.f = f
+        self.tail = b''
+    
+    def read(self, size=-1):
+        while True:
+            chunk = self.f.read(size)
+            data = self.tail + chunk
+            if not chunk or size < 0:
+                self.tail = b''
+                return self.rewrite(data, final=True)[0]
+            
+            # Anything that could still be cut mid-token is held back for the next call
+            data, self.tail = self.rewrite(data)
+            if data:
+                return data
+    
+    def rewrite(self, data, final=False):
+        """Replace NaN outside strings; returns the rewritten bytes and the bytes held back"""
+        parts = []
+        pos = 0
+        for match in self.TOKEN.finditer(data):
+            token = match.group()
+            if token == b'"':
+                if final:
+                    break
+                # A string still open at the end of the data; it is finished on the next read
+                parts.append(data[pos:match.start()])
+                return b''.join(parts), data[match.start():]
+            if token == b'NaN':
+                parts.append(data[pos:match.start()])
+                parts.append(b'null')
+                pos = match.end()
+        
+        rest = data[pos:]
+        # Outside strings only NaN starts with N, so a trailing N or Na is a split token
+        held = 0 if final else 2 if rest.endswith(b'Na') else 1 if rest.endswith(b'N') else 0
+        parts.append(rest[:len(rest) - held])
+        return b''.join(parts), rest[len(rest) - held:]
+
+@contextmanager
+def iter_kg(path):
+    """
+    Open the knowledge graph JSON and yield (entities, relationships): an iterable of
+    (id, entity) pairs and an iterable of relationship dicts. With ijson both sections
+    are streamed, so consume them in that order inside the with block.
+    """
+    if ijson is not None:
+        # Stream both sections so the graph is never fully in memory
+        with open(path, 'rb') as entities_file, open(path, 'rb') as rels_file:
+            yield (
+                ijson.kvitems(NaNAsNullReader(entities_file), 'entities', use_float=True),
+                ijson.items(NaNAsNullReader(rels_file), 'relationships.item', use_float=True)
+            )
+        return
+    
+    if orjson is not None:
+        # orjson rejects bare NaN, so rewrite it to null while reading
+        with open(path, 'rb') as f:
+            kg_data = orjson.loads(NaNAsNullReader(f).read())
+    else:
+        with open(path, 'r') as f:
+            kg_data = json.load(f)
+    yield kg_data.get('entities', {}).items(), kg_data.get('relationships', [])
+
+def summarize_kg(entities, relationships):
+    """Reduce (id, entity) pairs and relationship dicts to the counts and founder sets the scripts use"""
+    entity_counts = Counter()
+    founder_names = {}
+    for entity_id, entity_data in entities:
+        entity_type = entity_data.get('type', 'unknown')
+        entity_counts[entity_type] += 1
+        if entity_type == 'founder':
+            founder_names[entity_id] = entity_data.get('properties', {}).get('name', 'Unknown')
+    
+    rel_counts = Counter()
+    works_at_sources = set()
+    for rel in relationships:
+        rel_type = rel.get('type', 'unknown')
+        rel_counts[rel_type] += 1
+        if rel_type == 'WORKS_AT' and 'source' in rel:
+            works_at_sources.add(rel['source'])
+    
+    return {
+        'entity_counts': entity_counts,
+        'rel_counts': rel_counts,
+        'founder_names': founder_names,
+        'works_at_sources': works_at_sources
+    }
+
+def load_kg_summary(path):
+    """
+    summarize_kg for the JSON at path, pickled beside it as <name>.summary.pkl so
+    later runs of any script skip parsing while the file's (mtime, size) is unchanged
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_file = os.path.splitext(path)[0] + '.summary.pkl'
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = pickle.load(f)
+        if isinstance(cache, dict) and cache.get('stamp') == stamp and isinstance(cache.get('summary'), dict):
+            return cache['summary']
+    except Exception:
+        # A missing, truncated or outdated pickle is only a cache miss
+        pass
+    
+    with iter_kg(path) as (entities, relationships):
+        summary = summarize_kg(entities, relationships)
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'stamp': stamp, 'summary': summary}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"⚠️  Could not write summary cache: {e}")
+    return summary
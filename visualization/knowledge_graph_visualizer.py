@@ -1,43 +1,291 @@
 #!/usr/bin/env python3
 """
 Interactive Knowledge Graph Visualizer
-Creates beautiful network visualizations using pyvis with similarity analysis
+Creates beautiful vis.js network visualizations with similarity analysis
 """
 
+import sys
+import argparse
 import json
+import gzip
+import mmap
+import numpy as np
 import networkx as nx
-from pyvis.network import Network
 from collections import defaultdict, Counter
 import colorsys
+import functools
+import heapq
 import math
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json parses and writes the same data
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: NumPy popcounts compute the same counts
+    njit = None
+
+# (color, shape, size) per entity type; tuples, so callers cannot alter the shared styles
+NODE_STYLES = {
+    'startup': ('#FF6B6B', 'dot', 25),
+    'founder': ('#4ECDC4', 'triangle', 20),
+    'vc': ('#45B7D1', 'square', 30),
+    'technology': ('#96CEB4', 'diamond', 15)
+}
+DEFAULT_NODE_STYLE = ('#FECA57', 'dot', 20)
+
+EDGE_COLORS = {
+    'FOUNDED': '#FF6B6B',
+    'WORKS_AT': '#4ECDC4', 
+    'INVESTED_IN': '#45B7D1',
+    'USES_TECHNOLOGY': '#96CEB4',
+    'SIMILAR_TO': '#FF9FF3'
+}
+DEFAULT_EDGE_COLOR = '#95A5A6'
+
+INDUSTRY_COLORS = {
+    'fintech': '#FF6B6B',      # Red
+    'healthcare': '#4ECDC4',   # Teal
+    'education': '#45B7D1',    # Blue
+    'ecommerce': '#96CEB4',    # Green
+    'enterprise': '#FECA57',   # Yellow
+    'gaming': '#FF9FF3',       # Pink
+    'social': '#54A0FF',       # Light Blue
+    'travel': '#5F27CD',       # Purple
+    'food': '#FF9F43',         # Orange
+    'retail': '#10AC84',       # Dark Green
+    'media': '#EE5A6F',        # Rose
+    'automotive': '#C44569',   # Dark Pink
+    'real estate': '#F8B500',  # Golden
+    'sports': '#3C6382',       # Dark Blue
+    'fashion': '#A55EEA'       # Lavender
+}
+DEFAULT_INDUSTRY_COLOR = '#95A5A6'  # Default gray
+
+# Similarity edge color and strength bands; np.digitize maps a score to its band index
+_SIM_THRESH = np.array([0.3, 0.4, 0.6, 0.8])
+_SIM_COLORS = np.array(['#4CAF50', '#FFC107', '#FF9800', '#FF5722', '#FF1744'])
+_SIM_STRENGTHS = np.array(['Moderate', 'Moderate', 'Medium', 'High', 'High'])
+
+# Standalone vis-network page; the __*__ placeholders are filled in by _emit_visjs_html
+VISJS_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css">
+<script src="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"></script>
+<style>
+  body { margin: 0; background: #1a1a1a; }
+  #graph { width: 100%; height: __HEIGHT__; }
+</style>
+</head>
+<body>
+<div id="graph"></div>
+<script>
+  // vis-network shows string titles as plain text; the HTML tooltips need elements
+  function htmlTitle(item) {
+    if (typeof item.title === "string") {
+      const element = document.createElement("div");
+      element.innerHTML = item.title;
+      item.title = element;
+    }
+    return item;
+  }
+  const nodes = new vis.DataSet(__NODES__.map(htmlTitle));
+  const edges = new vis.DataSet(__EDGES__.map(htmlTitle));
+  new vis.Network(document.getElementById("graph"), {nodes: nodes, edges: edges}, __OPTIONS__);
+</script>
+__LEGEND__
+</body>
+</html>
+"""
+
+# Standalone sigma.js (WebGL) page; __GRAPH_DATA__ and __LEGEND__ are filled in by _render_sigma
+SIGMA_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="https://cdnjs.cloudflare.com/ajax/libs/graphology/0.25.4/graphology.umd.min.js"></script>
+<script src="https://cdnjs.cloudflare.com/ajax/libs/sigma.js/2.4.0/sigma.min.js"></script>
+<style>
+  body { margin: 0; background: #1a1a1a; }
+  #graph { width: 100%; height: 100vh; }
+  #tooltip { position: fixed; display: none; pointer-events: none; background: rgba(0,0,0,0.85);
+             color: white; padding: 8px; border-radius: 6px; font-family: Arial; font-size: 12px; }
+</style>
+</head>
+<body>
+<div id="graph"></div>
+<div id="tooltip"></div>
+<script>
+  const data = __GRAPH_DATA__;
+  const graph = new graphology.Graph({multi: true});
+  data.nodes.forEach(node => graph.addNode(node.key, node.attributes));
+  data.edges.forEach(edge => graph.addEdge(edge.source, edge.target, edge.attributes));
+  const renderer = new Sigma(graph, document.getElementById("graph"), {
+    labelColor: {color: "#ffffff"},
+    renderEdgeLabels: false
+  });
+  const tooltip = document.getElementById("tooltip");
+  renderer.on("enterNode", ({node}) => {
+    tooltip.innerHTML = graph.getNodeAttribute(node, "title") || "";
+    tooltip.style.display = "block";
+  });
+  renderer.on("leaveNode", () => { tooltip.style.display = "none"; });
+  document.addEventListener("mousemove", e => {
+    tooltip.style.left = (e.clientX + 12) + "px";
+    tooltip.style.top = (e.clientY + 12) + "px";
+  });
+</script>
+__LEGEND__
+</body>
+</html>
+"""
+
+@functools.lru_cache(maxsize=None)
+def relationship_title(relationship_type):
+    """Edge tooltip for a relationship type, built once per type and shared by its edges"""
+    return f"Relationship: {relationship_type}"
+
+def fnv1a(data):
+    """32-bit FNV-1a hash of a bytes object; unlike hash(), stable across processes"""
+    h = 0x811c9dc5
+    for byte in data:
+        h = ((h ^ byte) * 0x01000193) & 0xffffffff
+    return h
+
+@functools.lru_cache(maxsize=256)
+def industry_hash_color(industry_lower):
+    """Bright color derived from the hash of an industry without a predefined color"""
+    # FNV-1a rather than hash(), which PYTHONHASHSEED changes on every run
+    hash_val = fnv1a(industry_lower.encode('utf-8')) % 360
+    # Convert HSV to RGB for consistent bright colors
+    rgb = colorsys.hsv_to_rgb(hash_val/360, 0.7, 0.9)
+    return f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
+
+def to_script_json(data):
+    """Serialize data for inlining in a <script>, with orjson when it is installed"""
+    text = orjson.dumps(data).decode() if orjson is not None else json.dumps(data)
+    # "</" is escaped so names in the data cannot close the inline <script>
+    return text.replace('</', '<\\/')
+
+def append_edge(edges, joined, source, target, **options):
+    """Append an undirected edge dict unless the pair is already joined, as pyvis add_edge does"""
+    pair = frozenset((source, target))
+    if pair in joined:
+        return
+    joined.add(pair)
+    edges.append({'from': source, 'to': target, **options})
+
+def popcount(words):
+    """Number of set bits along the last axis of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(words.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+if njit is not None:
+    @njit(cache=True)
+    def popcount64(x):
+        """Set bits in one uint64 word (SWAR; LLVM lowers it to a POPCNT instruction)"""
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        # Signed result, so summing counts into an int64 does not promote to float
+        return np.int64((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+    
+    @njit(parallel=True, cache=True)
+    def pair_shared_counts(bits, i, j):
+        """Shared bits of bitset rows i[k] and j[k], without materializing the ANDed rows"""
+        shared = np.zeros(len(i), dtype=np.int64)
+        for k in prange(len(i)):
+            count = 0
+            for w in range(bits.shape[1]):
+                count += popcount64(bits[i[k], w] & bits[j[k], w])
+            shared[k] = count
+        return shared
+else:
+    def pair_shared_counts(bits, i, j):
+        """Shared bits of bitset rows i[k] and j[k]"""
+        return popcount(bits[i] & bits[j])
 
 class KnowledgeGraphVisualizer:
-    def __init__(self, json_file_path):
-        """Initialize with knowledge graph JSON file"""
+    def __init__(self, json_file_path, gzip_output=False):
+        """Initialize with knowledge graph JSON file
+        
+        With gzip_output set, every saved page also gets a gzip-compressed copy at
+        <output_file>.gz, for serving with Content-Encoding: gzip.
+        """
         self.json_file_path = json_file_path
+        self.gzip_output = gzip_output
         self.entities = {}
         self.relationships = []
-        self.graph = nx.Graph()
+        # NetworkX graph, built on first use of self.graph; only the aggregated view needs it
+        self._graph = None
+        self._tech_bitmatrix = None
+        self._similarity_cache = {}
         self.load_data()
         
     def load_data(self):
         """Load knowledge graph data"""
-        with open(self.json_file_path, 'r') as f:
-            data = json.load(f)
+        # Parse straight from the page cache rather than a private copy of the file
+        with open(self.json_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+            data = None
+            if orjson is not None:
+                try:
+                    with memoryview(raw) as view:
+                        data = orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # orjson rejects the bare NaN json.dump writes for missing values
+                    data = None
+            if data is None:
+                data = json.loads(raw[:])
         
         self.entities = data['entities']
         self.relationships = data['relationships']
         
-        # Build NetworkX graph for analysis
-        for entity_id, entity_data in self.entities.items():
-            self.graph.add_node(entity_id, **entity_data['properties'], type=entity_data['type'])
+        # The few type strings are interned so every entity and relationship shares one
+        # object per type
+        for entity_data in self.entities.values():
+            entity_data['type'] = sys.intern(entity_data['type'])
         
+        # Startup -> technology ids (in entity order), relationship counts per endpoint and
+        # USES_TECHNOLOGY counts per source, built in one pass over the relationships
+        startup_techs = defaultdict(set)
+        self._degree = Counter()
+        self._tech_count = Counter()
         for rel in self.relationships:
-            self.graph.add_edge(rel['source'], rel['target'], 
-                              type=rel['type'], **rel.get('properties', {}))
+            rel['type'] = sys.intern(rel['type'])
+            self._degree[rel['source']] += 1
+            self._degree[rel['target']] += 1
+            if rel['type'] == 'USES_TECHNOLOGY':
+                self._tech_count[rel['source']] += 1
+            if (rel['type'] == 'USES_TECHNOLOGY' and
+                self.entities.get(rel['source'], {}).get('type') == 'startup' and
+                self.entities.get(rel['target'], {}).get('type') == 'technology'):
+                startup_techs[rel['source']].add(rel['target'])
+        self._startup_techs = {eid: frozenset(startup_techs[eid]) for eid in self.entities if eid in startup_techs}
         
         print(f"📊 Loaded: {len(self.entities)} entities, {len(self.relationships)} relationships")
     
+    @property
+    def graph(self):
+        """NetworkX graph of the loaded entities and relationships, built on first access"""
+        if self._graph is None:
+            graph = nx.Graph()
+            graph.add_nodes_from(
+                (entity_id, {**entity_data['properties'], 'type': entity_data['type']})
+                for entity_id, entity_data in self.entities.items()
+            )
+            graph.add_edges_from(
+                (rel['source'], rel['target'], {'type': rel['type'], **rel.get('properties', {})})
+                for rel in self.relationships
+            )
+            self._graph = graph
+        return self._graph
+    
     def get_entity_stats(self):
         """Get statistics about entities"""
         stats = defaultdict(int)
@@ -46,97 +294,134 @@ class KnowledgeGraphVisualizer:
         return dict(stats)
     
     def get_node_color_and_shape(self, entity_type):
-        """Get color and shape for different entity types"""
-        styles = {
-            'startup': {'color': '#FF6B6B', 'shape': 'dot', 'size': 25},
-            'founder': {'color': '#4ECDC4', 'shape': 'triangle', 'size': 20},
-            'vc': {'color': '#45B7D1', 'shape': 'square', 'size': 30},
-            'technology': {'color': '#96CEB4', 'shape': 'diamond', 'size': 15}
-        }
-        return styles.get(entity_type, {'color': '#FECA57', 'shape': 'dot', 'size': 20})
+        """Get (color, shape, size) for different entity types"""
+        return NODE_STYLES.get(entity_type, DEFAULT_NODE_STYLE)
     
     def get_edge_color(self, relationship_type):
         """Get color for different relationship types"""
-        colors = {
-            'FOUNDED': '#FF6B6B',
-            'WORKS_AT': '#4ECDC4', 
-            'INVESTED_IN': '#45B7D1',
-            'USES_TECHNOLOGY': '#96CEB4',
-            'SIMILAR_TO': '#FF9FF3'
-        }
-        return colors.get(relationship_type, '#95A5A6')
+        return EDGE_COLORS.get(relationship_type, DEFAULT_EDGE_COLOR)
+    
+    def _build_tech_bitmatrix(self):
+        """Pack each startup's technologies into a uint64 bitset row, once
+        
+        Returns (startup ids in entity order, bits[startup, word], technology count per startup).
+        Only startups using at least one technology get a row.
+        """
+        if self._tech_bitmatrix is not None:
+            return self._tech_bitmatrix
+        
+        tech_to_idx = {entity_id: t for t, entity_id in enumerate(
+            eid for eid, edata in self.entities.items() if edata['type'] == 'technology')}
+        
+        startup_list = list(self._startup_techs)
+        rows = np.repeat(np.arange(len(startup_list)), [len(self._startup_techs[eid]) for eid in startup_list])
+        cols = np.array([tech_to_idx[tech] for eid in startup_list for tech in self._startup_techs[eid]], dtype=np.uint64)
+        
+        bits = np.zeros((len(startup_list), (len(tech_to_idx) + 63) // 64), dtype=np.uint64)
+        np.bitwise_or.at(bits, (rows, (cols >> np.uint64(6)).astype(np.intp)), np.uint64(1) << (cols & np.uint64(63)))
+        self._tech_bitmatrix = (startup_list, bits, popcount(bits))
+        return self._tech_bitmatrix
+    
+    def _all_pairs_jaccard(self, threshold):
+        """Startup row pairs (i < j, sorted) that can reach Jaccard >= threshold
+        
+        All-Pairs prefix and size filtering: with technologies in a global rarest-first
+        order, two sets with Jaccard >= threshold must share a technology within their
+        first |A| - ceil(threshold * |A|) + 1 entries, and a set can only match sets of at
+        least threshold times its size. Needs threshold > 0.
+        """
+        startup_techs = self._startup_techs
+        frequency = Counter(tech for techs in startup_techs.values() for tech in techs)
+        row_of = {eid: row for row, eid in enumerate(startup_techs)}
+        
+        # Smallest sets first, so every indexed set is no larger than the one probing it
+        index = defaultdict(list)
+        candidates = set()
+        for eid in sorted(startup_techs, key=lambda eid: len(startup_techs[eid])):
+            techs = sorted(startup_techs[eid], key=lambda tech: (frequency[tech], tech))
+            size = len(techs)
+            # The epsilon keeps float rounding (e.g. 0.3 * 10) from shortening the prefix
+            prefix = techs[:size - math.ceil(threshold * size - 1e-9) + 1]
+            min_size = threshold * size - 1e-9
+            row = row_of[eid]
+            for tech in prefix:
+                for other_row, other_size in index[tech]:
+                    if other_size >= min_size:
+                        candidates.add((min(row, other_row), max(row, other_row)))
+                index[tech].append((row, size))
+        
+        pairs = np.array(sorted(candidates), dtype=np.intp).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
     
     def calculate_startup_similarities(self, threshold=0.2):
-        """Calculate startup similarities based on shared technologies"""
-        startup_techs = defaultdict(set)
+        """Calculate startup similarities based on shared technologies
         
-        # Build startup-technology mapping
-        for entity_id, entity_data in self.entities.items():
-            if entity_data['type'] == 'startup':
-                for rel in self.relationships:
-                    if (rel['source'] == entity_id and 
-                        rel['type'] == 'USES_TECHNOLOGY' and
-                        self.entities[rel['target']]['type'] == 'technology'):
-                        startup_techs[entity_id].add(rel['target'])
-        
-        similarities = []
-        startup_list = list(startup_techs.keys())
-        
-        for i in range(len(startup_list)):
-            for j in range(i+1, len(startup_list)):
-                s1, s2 = startup_list[i], startup_list[j]
-                techs1, techs2 = startup_techs[s1], startup_techs[s2]
-                
-                if techs1 and techs2:
-                    jaccard = len(techs1 & techs2) / len(techs1 | techs2)
-                    if jaccard >= threshold:
-                        similarities.append({
-                            'startup1': s1,
-                            'startup2': s2,
-                            'similarity': jaccard,
-                            'shared_techs': len(techs1 & techs2)
-                        })
-        
-        return similarities
+        Results are cached per threshold and shared between callers, so they must not be modified.
+        """
+        if threshold in self._similarity_cache:
+            return self._similarity_cache[threshold]
+        
+        startup_list, bits, sizes = self._build_tech_bitmatrix()
+        
+        # Candidate startup pairs in the same (i, j > i) order as a nested loop; a
+        # threshold of 0 or less admits pairs sharing nothing, so all pairs are candidates
+        if threshold > 0:
+            i, j = self._all_pairs_jaccard(threshold)
+        else:
+            i, j = np.triu_indices(len(startup_list), k=1)
+        
+        # A pair's shared techs are the popcount of its ANDed bitsets
+        shared = pair_shared_counts(bits, i, j)
+        jaccard = shared / (sizes[i] + sizes[j] - shared)
+        
+        self._similarity_cache[threshold] = [
+            {
+                'startup1': startup_list[i[k]],
+                'startup2': startup_list[j[k]],
+                'similarity': float(jaccard[k]),
+                'shared_techs': int(shared[k])
+            }
+            for k in np.flatnonzero(jaccard >= threshold)
+        ]
+        return self._similarity_cache[threshold]
     
     def create_network_visualization(self, 
                                    include_similarities=True,
                                    similarity_threshold=0.3,
                                    max_nodes=200,
-                                   output_file='knowledge_graph.html'):
-        """Create interactive network visualization"""
-        
-        # Initialize pyvis network
-        net = Network(
-            height="800px", 
-            width="100%", 
-            bgcolor="#1a1a1a",
-            font_color="white",
-            notebook=False
-        )
-        
-        # Configure physics
-        net.set_options("""
-        var options = {
-          "physics": {
-            "enabled": true,
-            "stabilization": {"iterations": 100},
-            "barnesHut": {
-              "gravitationalConstant": -80000,
-              "springConstant": 0.001,
-              "springLength": 200
+                                   output_file='knowledge_graph.html',
+                                   dashed_similarity=False,
+                                   aggregate=False,
+                                   renderer='visjs'):
+        """Create interactive network visualization
+        
+        Similarity edges are drawn solid unless dashed_similarity is set; dashed edges are
+        much slower for vis.js to draw. With aggregate set, a graph over max_nodes entities
+        is shown as community meta-nodes instead of being truncated. renderer='webgl' writes
+        a sigma.js page instead of a vis.js one, for graphs too large for vis.js to draw smoothly.
+        """
+        if aggregate and len(self.entities) > max_nodes:
+            return self.create_aggregated_visualization(max_nodes=max_nodes, output_file=output_file)
+        
+        # vis.js node and edge dicts
+        nodes, edges, joined = [], [], set()
+        
+        # Physics off: nodes ship with positions laid out below
+        options = {
+            "physics": {
+                "enabled": False
+            },
+            "edges": {"smooth": False},
+            "interaction": {
+                "hover": True,
+                "tooltipDelay": 200
             }
-          },
-          "interaction": {
-            "hover": true,
-            "tooltipDelay": 200
-          }
         }
-        """)
         
         # Add nodes with limits to avoid overwhelming visualization
         entity_counts = defaultdict(int)
         added_nodes = 0
+        added_ids = set()
         
         print(f"🎨 Creating visualization...")
         
@@ -148,7 +433,7 @@ class KnowledgeGraphVisualizer:
             if entity_counts[entity_type] >= max_nodes // 4:  # Limit each type
                 continue
                 
-            style = self.get_node_color_and_shape(entity_type)
+            color, shape, size = self.get_node_color_and_shape(entity_type)
             
             # Create hover info
             properties = entity_data['properties']
@@ -164,34 +449,35 @@ class KnowledgeGraphVisualizer:
             if 'university' in properties:
                 title += f"University: {properties['university']}<br>"
                 
-            net.add_node(
-                entity_id,
-                label=properties.get('name', entity_id)[:20],
-                title=title,
-                color=style['color'],
-                shape=style['shape'],
-                size=style['size'],
-                font={'size': 12, 'color': 'white'}
-            )
+            nodes.append({
+                'id': entity_id,
+                'label': properties.get('name', entity_id)[:20],
+                'title': title,
+                'color': color,
+                'shape': shape,
+                'size': size,
+                'font': {'size': 12, 'color': 'white'}
+            })
             
             entity_counts[entity_type] += 1
             added_nodes += 1
+            added_ids.add(entity_id)
         
         # Add original relationships
         added_edges = 0
         for rel in self.relationships:
-            if rel['source'] in [node['id'] for node in net.nodes] and \
-               rel['target'] in [node['id'] for node in net.nodes]:
+            if rel['source'] in added_ids and rel['target'] in added_ids:
                 
                 edge_color = self.get_edge_color(rel['type'])
                 
-                net.add_edge(
+                append_edge(
+                    edges, joined,
                     rel['source'],
                     rel['target'],
                     label=rel['type'],
                     color=edge_color,
                     width=2,
-                    title=f"Relationship: {rel['type']}"
+                    title=relationship_title(rel['type'])
                 )
                 added_edges += 1
         
@@ -201,20 +487,29 @@ class KnowledgeGraphVisualizer:
             similarities = self.calculate_startup_similarities(similarity_threshold)
             
             for sim in similarities[:20]:  # Limit similarity edges
-                if sim['startup1'] in [node['id'] for node in net.nodes] and \
-                   sim['startup2'] in [node['id'] for node in net.nodes]:
+                if sim['startup1'] in added_ids and sim['startup2'] in added_ids:
                     
-                    net.add_edge(
+                    append_edge(
+                        edges, joined,
                         sim['startup1'],
                         sim['startup2'],
                         label=f"Similar ({sim['similarity']:.2f})",
                         color='#FF9FF3',
                         width=1,
-                        dashes=True,
+                        dashes=dashed_similarity,
                         title=f"Similarity: {sim['similarity']:.3f}<br>Shared technologies: {sim['shared_techs']}"
                     )
                     added_edges += 1
         
+        # Lay out the drawn graph once here instead of stabilizing it in the browser
+        layout_graph = nx.Graph()
+        layout_graph.add_nodes_from(added_ids)
+        layout_graph.add_edges_from((edge['from'], edge['to']) for edge in edges)
+        pos = nx.spring_layout(layout_graph, seed=42, iterations=50, scale=600)
+        for node in nodes:
+            node['x'], node['y'] = (float(c) for c in pos[node['id']])
+            node['physics'] = False
+        
         # Add legend as HTML
         legend_html = """
         <div style="position: fixed; top: 10px; left: 10px; background: rgba(0,0,0,0.8); 
@@ -224,79 +519,226 @@ class KnowledgeGraphVisualizer:
             <div style="margin: 5px 0;"><span style="color: #4ECDC4;">▲</span> Founders</div>
             <div style="margin: 5px 0;"><span style="color: #45B7D1;">■</span> VCs</div>
             <div style="margin: 5px 0;"><span style="color: #96CEB4;">♦</span> Technologies</div>
-            <div style="margin: 5px 0;"><span style="color: #FF9FF3;">--</span> Similarities</div>
+            <div style="margin: 5px 0;"><span style="color: #FF9FF3;">{similarity_mark}</span> Similarities</div>
             <br>
             <small>Total Nodes: {total_nodes} | Total Edges: {total_edges}</small>
         </div>
-        """.format(total_nodes=added_nodes, total_edges=added_edges)
-        
-        # Save the visualization
-        net.save_graph(output_file)
+        """.format(total_nodes=added_nodes, total_edges=added_edges,
+                   similarity_mark='--' if dashed_similarity else '—')
         
-        # Add legend to the HTML file
-        with open(output_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Save the visualization with the legend before the closing body tag
+        if renderer == 'webgl':
+            self._render_sigma(nodes, edges, legend_html, output_file)
+        else:
+            self._emit_visjs_html(nodes, edges, options, output_file, legend_html)
         
-        # Insert legend before closing body tag
-        html_content = html_content.replace('</body>', f'{legend_html}</body>')
+        print(f"✅ Visualization saved as {output_file}")
+        print(f"📊 Stats: {added_nodes} nodes, {added_edges} edges")
         
+        return output_file
+    
+    def _render_sigma(self, nodes, edges, legend_html, output_file):
+        """Write pyvis-style node and edge dicts (laid out, with x/y) as a sigma.js WebGL page"""
+        graph_data = {
+            'nodes': [
+                {
+                    'key': node['id'],
+                    'attributes': {
+                        'label': node.get('label', ''),
+                        'title': node.get('title', ''),
+                        'x': node['x'],
+                        'y': -node['y'],  # vis.js y grows downward, sigma's upward
+                        'size': node.get('size', 20) / 2.5,
+                        'color': node.get('color', DEFAULT_NODE_STYLE[0])
+                    }
+                }
+                for node in nodes
+            ],
+            'edges': [
+                {
+                    'source': edge['from'],
+                    'target': edge['to'],
+                    'attributes': {
+                        'size': edge.get('width', 1),
+                        'color': edge.get('color', DEFAULT_EDGE_COLOR)
+                    }
+                }
+                for edge in edges
+            ]
+        }
+        html = SIGMA_TEMPLATE.replace('__LEGEND__', legend_html).replace('__GRAPH_DATA__', to_script_json(graph_data))
+        self._write_page(html, output_file)
+    
+    def _emit_visjs_html(self, nodes, edges, options, output_file, legend_html='', height='800px'):
+        """Write node and edge dicts and vis-network options as a standalone vis.js page"""
+        html = (VISJS_TEMPLATE
+                .replace('__HEIGHT__', height)
+                .replace('__LEGEND__', legend_html)
+                .replace('__OPTIONS__', to_script_json(options))
+                .replace('__EDGES__', to_script_json(edges))
+                .replace('__NODES__', to_script_json(nodes)))
+        self._write_page(html, output_file)
+    
+    def _write_page(self, html, output_file):
+        """Write a generated page, plus its .gz copy when gzip_output is set"""
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(html)
+        if self.gzip_output:
+            with gzip.open(output_file + '.gz', 'wt', compresslevel=6, encoding='utf-8') as f:
+                f.write(html)
+    
+    def _aggregated_view(self, max_nodes):
+        """Collapse the graph into at most max_nodes Louvain community meta-nodes
         
-        print(f"✅ Visualization saved as {output_file}")
-        print(f"📊 Stats: {added_nodes} nodes, {added_edges} edges")
+        Returns (nodes, edges): (meta_id, node attributes) and (meta_id, meta_id, edge attributes)
+        tuples, with meta-edges weighted by the relationships running between communities.
+        """
+        communities = sorted(nx.community.louvain_communities(self.graph, resolution=1.0, seed=42),
+                             key=len, reverse=True)
+        # Past the ceiling, the smallest communities share one last meta-node
+        if len(communities) > max_nodes:
+            communities = communities[:max_nodes - 1] + [set().union(*communities[max_nodes - 1:])]
+        
+        community_of = {}
+        nodes = []
+        for k, members in enumerate(communities):
+            meta_id = f"community_{k}"
+            for entity_id in members:
+                community_of[entity_id] = meta_id
+            
+            type_counts = Counter(self.entities[eid]['type'] for eid in members if eid in self.entities)
+            majority_type = type_counts.most_common(1)[0][0] if type_counts else 'unknown'
+            color, shape, _ = self.get_node_color_and_shape(majority_type)
+            
+            top_members = sorted(members, key=self.graph.degree, reverse=True)[:5]
+            title = f"<b>COMMUNITY</b><br>"
+            title += f"Members: {len(members)}<br>"
+            title += "".join(f"{count} {entity_type}<br>" for entity_type, count in type_counts.most_common())
+            title += "Top members: " + ", ".join(
+                str(self.entities.get(eid, {}).get('properties', {}).get('name', eid)) for eid in top_members)
+            
+            nodes.append((meta_id, {
+                'label': f"{majority_type.title()} group ({len(members)})",
+                'title': title,
+                'color': color,
+                'shape': shape,
+                'size': min(60, 15 + len(members)),
+                'font': {'size': 12, 'color': 'white'}
+            }))
+        
+        meta_edge_counts = Counter()
+        for rel in self.relationships:
+            src, dst = community_of.get(rel['source']), community_of.get(rel['target'])
+            if src and dst and src != dst:
+                meta_edge_counts[tuple(sorted((src, dst)))] += 1
+        edges = [
+            (src, dst, {
+                'value': count,
+                'color': '#95A5A6',
+                'title': f"Relationships between communities: {count}"
+            })
+            for (src, dst), count in meta_edge_counts.items()
+        ]
+        return nodes, edges
+    
+    def create_aggregated_visualization(self, max_nodes=200, output_file='aggregated_graph.html'):
+        """Create a visualization of the whole graph as community meta-nodes"""
+        
+        options = {
+            "physics": {
+                "enabled": False
+            },
+            "edges": {"smooth": False},
+            "interaction": {
+                "hover": True,
+                "tooltipDelay": 200
+            }
+        }
+        
+        nodes, edges = self._aggregated_view(max_nodes)
+        node_dicts = [{'id': meta_id, **attributes} for meta_id, attributes in nodes]
+        edge_dicts = [{'from': src, 'to': dst, **attributes} for src, dst, attributes in edges]
+        
+        # Lay out the communities here, pulled together by their relationship counts
+        layout_graph = nx.Graph()
+        layout_graph.add_nodes_from(meta_id for meta_id, _ in nodes)
+        layout_graph.add_weighted_edges_from((src, dst, attributes['value']) for src, dst, attributes in edges)
+        pos = nx.spring_layout(layout_graph, seed=42, iterations=50, scale=600)
+        for node in node_dicts:
+            node['x'], node['y'] = (float(c) for c in pos[node['id']])
+            node['physics'] = False
+        
+        legend_html = f"""
+        <div style="position: fixed; top: 10px; left: 10px; background: rgba(0,0,0,0.8); 
+                    color: white; padding: 15px; border-radius: 10px; font-family: Arial;">
+            <h3>🌐 Knowledge Graph Communities</h3>
+            <div style="margin: 5px 0;">Each node is a community, colored by its most common entity type</div>
+            <div style="margin: 5px 0;">Edge width: relationships between communities</div>
+            <br>
+            <small>Entities: {len(self.entities)} | Communities: {len(nodes)} | Edges: {len(edges)}</small>
+        </div>
+        """
+        self._emit_visjs_html(node_dicts, edge_dicts, options, output_file, legend_html)
+        
+        print(f"✅ Aggregated visualization saved as {output_file}")
+        print(f"📊 Stats: {len(self.entities)} entities in {len(nodes)} communities, {len(edges)} edges")
         
         return output_file
     
     def create_focused_visualization(self, focus_entity_type='startup', output_file='focused_graph.html'):
         """Create a focused visualization around specific entity type"""
         
-        net = Network(height="800px", width="100%", bgcolor="#1a1a1a", font_color="white")
+        # vis.js node and edge dicts
+        nodes, edges, joined = [], [], set()
         
         # Get all entities of focus type
         focus_entities = [eid for eid, edata in self.entities.items() 
                          if edata['type'] == focus_entity_type]
         
         # Get their direct neighbors
+        focus_ids = set(focus_entities)
         connected_entities = set(focus_entities)
         for rel in self.relationships:
-            if rel['source'] in focus_entities:
+            if rel['source'] in focus_ids:
                 connected_entities.add(rel['target'])
-            if rel['target'] in focus_entities:
+            if rel['target'] in focus_ids:
                 connected_entities.add(rel['source'])
         
         # Add nodes
         for entity_id in connected_entities:
             if entity_id in self.entities:
                 entity_data = self.entities[entity_id]
-                style = self.get_node_color_and_shape(entity_data['type'])
+                color, shape, size = self.get_node_color_and_shape(entity_data['type'])
                 
                 # Highlight focus entities
                 if entity_data['type'] == focus_entity_type:
-                    style['size'] *= 1.5
-                    style['color'] = '#FFD93D'  # Golden highlight
+                    size *= 1.5
+                    color = '#FFD93D'  # Golden highlight
                 
-                net.add_node(
-                    entity_id,
-                    label=entity_data['properties'].get('name', entity_id)[:15],
-                    color=style['color'],
-                    shape=style['shape'],
-                    size=style['size']
-                )
+                nodes.append({
+                    'id': entity_id,
+                    'label': entity_data['properties'].get('name', entity_id)[:15],
+                    'color': color,
+                    'shape': shape,
+                    'size': size,
+                    'font': {'color': 'white'}
+                })
         
         # Add edges
         for rel in self.relationships:
             if (rel['source'] in connected_entities and 
                 rel['target'] in connected_entities):
                 
-                net.add_edge(
+                append_edge(
+                    edges, joined,
                     rel['source'],
                     rel['target'],
                     color=self.get_edge_color(rel['type']),
                     width=2
                 )
         
-        net.save_graph(output_file)
+        # Empty options keep vis-network's default physics and smooth edges
+        self._emit_visjs_html(nodes, edges, {}, output_file)
         print(f"✅ Focused visualization ({focus_entity_type}) saved as {output_file}")
         
         return output_file
@@ -304,11 +746,8 @@ class KnowledgeGraphVisualizer:
     def create_top_connected_visualization(self, top_n=30, output_file='top_connected_graph.html'):
         """Create a fast visualization showing only the most connected entities"""
         
-        # Calculate node degrees (connections)
-        node_degrees = defaultdict(int)
-        for rel in self.relationships:
-            node_degrees[rel['source']] += 1
-            node_degrees[rel['target']] += 1
+        # Node degrees (connections), counted at load time
+        node_degrees = self._degree
         
         # Get top connected nodes by type
         top_nodes_by_type = defaultdict(list)
@@ -317,30 +756,23 @@ class KnowledgeGraphVisualizer:
                 entity_type = self.entities[entity_id]['type']
                 top_nodes_by_type[entity_type].append((entity_id, degree))
         
-        # Sort and limit each type
+        # Take top 8 of each type, without sorting whole buckets
         selected_nodes = set()
         for entity_type, nodes_with_degree in top_nodes_by_type.items():
-            sorted_nodes = sorted(nodes_with_degree, key=lambda x: x[1], reverse=True)
-            # Take top 8 of each type
-            for node_id, degree in sorted_nodes[:8]:
+            for node_id, degree in heapq.nlargest(8, nodes_with_degree, key=itemgetter(1)):
                 selected_nodes.add(node_id)
         
-        # Create network
-        net = Network(
-            height="700px", 
-            width="100%", 
-            bgcolor="#1a1a1a",
-            font_color="white"
-        )
+        # vis.js node and edge dicts
+        nodes, edges, joined = [], [], set()
         
         # Add selected nodes
         for entity_id in selected_nodes:
             entity_data = self.entities[entity_id]
-            style = self.get_node_color_and_shape(entity_data['type'])
+            color, shape, _ = self.get_node_color_and_shape(entity_data['type'])
             
             # Size based on connections
             degree = node_degrees[entity_id]
-            style['size'] = min(50, max(15, degree * 2))
+            size = min(50, max(15, degree * 2))
             
             properties = entity_data['properties']
             title = f"<b>{entity_data['type'].upper()}</b><br>"
@@ -348,42 +780,43 @@ class KnowledgeGraphVisualizer:
             if 'name' in properties:
                 title += f"Name: {properties['name']}<br>"
             
-            net.add_node(
-                entity_id,
-                label=properties.get('name', entity_id)[:15],
-                title=title,
-                color=style['color'],
-                shape=style['shape'],
-                size=style['size']
-            )
+            nodes.append({
+                'id': entity_id,
+                'label': properties.get('name', entity_id)[:15],
+                'title': title,
+                'color': color,
+                'shape': shape,
+                'size': size,
+                'font': {'color': 'white'}
+            })
         
         # Add edges between selected nodes only
         for rel in self.relationships:
             if rel['source'] in selected_nodes and rel['target'] in selected_nodes:
-                net.add_edge(
+                append_edge(
+                    edges, joined,
                     rel['source'],
                     rel['target'],
                     color=self.get_edge_color(rel['type']),
                     width=2,
-                    title=f"Relationship: {rel['type']}"
+                    title=relationship_title(rel['type'])
                 )
         
         # Configure for faster rendering
-        net.set_options("""
-        var options = {
-          "physics": {
-            "enabled": true,
-            "stabilization": {"iterations": 50},
-            "barnesHut": {
-              "gravitationalConstant": -30000,
-              "springConstant": 0.01,
-              "springLength": 100
-            }
-          }
+        options = {
+            "physics": {
+                "enabled": True,
+                "stabilization": {"iterations": 50},
+                "barnesHut": {
+                    "gravitationalConstant": -30000,
+                    "springConstant": 0.01,
+                    "springLength": 100
+                }
+            },
+            "edges": {"smooth": False}
         }
-        """)
         
-        net.save_graph(output_file)
+        self._emit_visjs_html(nodes, edges, options, output_file, height="700px")
         print(f"✅ Top connected visualization saved as {output_file}")
         print(f"    Showing {len(selected_nodes)} most connected entities")
         
@@ -391,49 +824,16 @@ class KnowledgeGraphVisualizer:
 
     def get_industry_color(self, industry):
         """Get color based on startup industry"""
-        industry_colors = {
-            'fintech': '#FF6B6B',      # Red
-            'healthcare': '#4ECDC4',   # Teal
-            'education': '#45B7D1',    # Blue
-            'ecommerce': '#96CEB4',    # Green
-            'enterprise': '#FECA57',   # Yellow
-            'gaming': '#FF9FF3',       # Pink
-            'social': '#54A0FF',       # Light Blue
-            'travel': '#5F27CD',       # Purple
-            'food': '#FF9F43',         # Orange
-            'retail': '#10AC84',       # Dark Green
-            'media': '#EE5A6F',        # Rose
-            'automotive': '#C44569',   # Dark Pink
-            'real estate': '#F8B500',  # Golden
-            'sports': '#3C6382',       # Dark Blue
-            'fashion': '#A55EEA'       # Lavender
-        }
-        
-        if industry and industry.lower() in industry_colors:
-            return industry_colors[industry.lower()]
+        if not industry:
+            return DEFAULT_INDUSTRY_COLOR
         
         # Generate a color based on industry string hash if not in predefined
-        if industry:
-            hash_val = abs(hash(industry.lower())) % 360
-            # Convert HSV to RGB for consistent bright colors
-            import colorsys
-            rgb = colorsys.hsv_to_rgb(hash_val/360, 0.7, 0.9)
-            return f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
-        
-        return '#95A5A6'  # Default gray
+        industry_lower = industry.lower()
+        return INDUSTRY_COLORS.get(industry_lower) or industry_hash_color(industry_lower)
 
     def get_similarity_edge_color(self, similarity):
         """Get edge color based on similarity strength"""
-        if similarity >= 0.8:
-            return '#FF1744'  # Strong red for very high similarity
-        elif similarity >= 0.6:
-            return '#FF5722'  # Orange-red for high similarity
-        elif similarity >= 0.4:
-            return '#FF9800'  # Orange for medium similarity
-        elif similarity >= 0.3:
-            return '#FFC107'  # Yellow for moderate similarity
-        else:
-            return '#4CAF50'  # Green for lower similarity
+        return str(_SIM_COLORS[np.digitize(similarity, _SIM_THRESH)])
 
     def create_similarity_only_visualization(self, similarity_threshold=0.4, output_file='similarity_graph.html'):
         """Create a fast visualization showing only similarity connections"""
@@ -445,19 +845,15 @@ class KnowledgeGraphVisualizer:
             print(f"No similarities found above threshold {similarity_threshold}")
             return None
         
-        # Get unique startups in similarities
-        startup_nodes = set()
+        # Get unique startups in similarities, and how many similarities each has
+        similarity_counts = Counter()
         for sim in similarities:
-            startup_nodes.add(sim['startup1'])
-            startup_nodes.add(sim['startup2'])
-        
-        # Create network
-        net = Network(
-            height="650px", 
-            width="100%", 
-            bgcolor="#1a1a1a",
-            font_color="white"
-        )
+            similarity_counts[sim['startup1']] += 1
+            similarity_counts[sim['startup2']] += 1
+        startup_nodes = set(similarity_counts)
+        
+        # vis.js node and edge dicts
+        nodes, edges, joined = [], [], set()
         
         # Collect industries for legend
         industries_used = set()
@@ -469,8 +865,7 @@ class KnowledgeGraphVisualizer:
                 properties = entity_data['properties']
                 
                 # Get startup's technologies for tooltip
-                tech_count = sum(1 for rel in self.relationships 
-                               if rel['source'] == startup_id and rel['type'] == 'USES_TECHNOLOGY')
+                tech_count = self._tech_count[startup_id]
                 
                 # Get industry and color
                 industry = properties.get('industry', 'Unknown')
@@ -478,8 +873,7 @@ class KnowledgeGraphVisualizer:
                 node_color = self.get_industry_color(industry)
                 
                 # Size based on number of similarities
-                similarity_count = sum(1 for sim in similarities 
-                                     if sim['startup1'] == startup_id or sim['startup2'] == startup_id)
+                similarity_count = similarity_counts[startup_id]
                 node_size = max(20, min(40, 15 + similarity_count * 3))
                 
                 title = f"<b>STARTUP</b><br>"
@@ -490,56 +884,56 @@ class KnowledgeGraphVisualizer:
                 if 'funding_stage' in properties:
                     title += f"Stage: {properties['funding_stage']}<br>"
                 
-                net.add_node(
-                    startup_id,
-                    label=properties.get('name', startup_id)[:15],
-                    title=title,
-                    color=node_color,
-                    shape='dot',
-                    size=node_size,
-                    borderWidth=2,
-                    borderColor='white'
-                )
-        
-        # Add similarity edges with strength-based colors
-        for sim in similarities[:20]:  # Increased to top 20 similarities
-            edge_color = self.get_similarity_edge_color(sim['similarity'])
-            edge_width = max(1, sim['similarity'] * 6)
-            
-            # Make edge style based on similarity strength
-            edge_style = "solid" if sim['similarity'] >= 0.5 else "dashed"
-            
-            net.add_edge(
+                nodes.append({
+                    'id': startup_id,
+                    'label': properties.get('name', startup_id)[:15],
+                    'title': title,
+                    'color': node_color,
+                    'shape': 'dot',
+                    'size': node_size,
+                    'borderWidth': 2,
+                    'borderColor': 'white',
+                    'font': {'color': 'white'}
+                })
+        
+        # Add similarity edges with strength-based colors, all attributes computed in one pass
+        top_similarities = similarities[:20]  # Increased to top 20 similarities
+        sims = np.array([sim['similarity'] for sim in top_similarities], dtype=float)
+        bands = np.digitize(sims, _SIM_THRESH)
+        # Strength is carried by color and width; edges stay solid and straight
+        edge_colors = _SIM_COLORS[bands].tolist()
+        edge_widths = np.maximum(1.0, sims * 6.0).tolist()
+        strengths = _SIM_STRENGTHS[bands].tolist()
+        
+        for sim, edge_color, edge_width, strength in zip(top_similarities, edge_colors, edge_widths, strengths):
+            append_edge(
+                edges, joined,
                 sim['startup1'],
                 sim['startup2'],
                 label=f"{sim['similarity']:.2f}",
                 color=edge_color,
                 width=edge_width,
-                dashes=(edge_style == "dashed"),
-                title=f"Similarity: {sim['similarity']:.3f}<br>Shared technologies: {sim['shared_techs']}<br>Strength: {'High' if sim['similarity'] >= 0.6 else 'Medium' if sim['similarity'] >= 0.4 else 'Moderate'}"
+                title=f"Similarity: {sim['similarity']:.3f}<br>Shared technologies: {sim['shared_techs']}<br>Strength: {strength}"
             )
         
         # Enhanced physics for better layout
-        net.set_options("""
-        var options = {
-          "physics": {
-            "enabled": true,
-            "stabilization": {"iterations": 100},
-            "forceAtlas2Based": {
-              "gravitationalConstant": -80,
-              "springConstant": 0.05,
-              "springLength": 150,
-              "damping": 0.4
+        options = {
+            "physics": {
+                "enabled": True,
+                "stabilization": {"iterations": 100},
+                "forceAtlas2Based": {
+                    "gravitationalConstant": -80,
+                    "springConstant": 0.05,
+                    "springLength": 150,
+                    "damping": 0.4
+                }
+            },
+            "edges": {"smooth": False},
+            "interaction": {
+                "hover": True,
+                "tooltipDelay": 200
             }
-          },
-          "interaction": {
-            "hover": true,
-            "tooltipDelay": 200
-          }
         }
-        """)
-        
-        net.save_graph(output_file)
         
         # Add colorful legend to HTML
         industry_legend = ""
@@ -565,14 +959,7 @@ class KnowledgeGraphVisualizer:
         </div>
         """
         
-        # Add legend to HTML file
-        with open(output_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        html_content = html_content.replace('</body>', f'{legend_html}</body>')
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._emit_visjs_html(nodes, edges, options, output_file, legend_html, height="650px")
         
         print(f"✅ Colorful similarity visualization saved as {output_file}")
         print(f"    Showing {len(startup_nodes)} startups with {len(similarities[:20])} similarity connections")
@@ -582,6 +969,11 @@ class KnowledgeGraphVisualizer:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Create interactive HTML visualizations of the knowledge graph")
+    parser.add_argument('--renderer', choices=['visjs', 'webgl'], default='visjs',
+                        help="webgl also writes every entity to a sigma.js page (large graphs need SciPy for the layout)")
+    args = parser.parse_args()
+    
     print("🚀 Knowledge Graph Visualizer")
     print("=" * 50)
     
@@ -610,16 +1002,30 @@ def main():
             output_file='top_connected_graph.html'
         )
         
-        # Create similarity-only visualization
+        # Create similarity-only visualization (reuses the 0.3 similarities cached above)
         similarity_file = viz.create_similarity_only_visualization(
             similarity_threshold=0.3,
             output_file='similarity_graph.html'
         )
         
+        # The main graph keeps 100 nodes; on request, draw every entity with WebGL too.
+        # Each type is capped at max_nodes // 4, so 4x the entity count admits all of them
+        webgl_file = None
+        if args.renderer == 'webgl':
+            webgl_file = viz.create_network_visualization(
+                include_similarities=True,
+                similarity_threshold=0.3,
+                max_nodes=4 * len(viz.entities),
+                output_file='startup_knowledge_graph_webgl.html',
+                renderer='webgl'
+            )
+        
         print(f"\nVisualizations created!")
         print(f"   • Main graph: {main_file}")
         print(f"   • Top connected: {top_connected_file}")
         print(f"   • Similarities only: {similarity_file}")
+        if webgl_file:
+            print(f"   • Full graph (WebGL): {webgl_file}")
         print(f"\nOpen the HTML files in your browser to explore the interactive networks!")
         print(f"The top_connected and similarity graphs are much faster to load!")
         